@@ -0,0 +1,118 @@
+"""
+Benchmark of the per-call overhead of a generated client.
+
+Requests are served by httpx.MockTransport, so the network is not measured.
+The same request made with httpx directly is the baseline. httpx itself takes
+most of the time of a call, so the code of the client is also measured alone,
+with a recorded response.
+
+Usage
+-----
+python benchmarks/client_call.py --calls 20000
+"""
+
+import argparse
+import gc
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import httpx
+
+from pythogen import formatter
+from pythogen import generator
+
+
+OPENAPI_PATH = "tests/docs/openapi.yaml"
+BASE_URL = "http://testserver"
+RESPONSE_JSON = {"integer_data_all_params": 2}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=RESPONSE_JSON)
+
+
+class ReplayClient:
+    """httpx.Client that returns the response of the first request to every request"""
+
+    def __init__(self, client: httpx.Client) -> None:
+        self._client = client
+        self._response: httpx.Response | None = None
+
+    def request(self, method: str, url: str, **kwargs: object) -> httpx.Response:
+        if self._response is None:
+            self._response = self._client.request(method, url, **kwargs)
+        return self._response
+
+
+def measure(calls_by_title: dict[str, Callable[[], object]], calls: int, repeat: int) -> dict[str, float]:
+    """Best time of one call in seconds, the variants are run in turns to be measured in the same conditions"""
+    best = {title: float("inf") for title in calls_by_title}
+    gc.disable()  # as timeit does
+    for _ in range(repeat):
+        for title, call in calls_by_title.items():
+            started_at = time.perf_counter()
+            for _ in range(calls):
+                call()
+            best[title] = min(best[title], (time.perf_counter() - started_at) / calls)
+    gc.enable()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client_path = Path(tmp_dir) / "benchmark_client.py"
+        generator.generate(
+            input=OPENAPI_PATH,
+            output=str(client_path),
+            sync=True,
+            validation=generator.ValidationMode.off,
+            format_mode=formatter.FormatMode.none,
+        )
+        spec = importlib.util.spec_from_file_location("benchmark_client", client_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["benchmark_client"] = module
+        spec.loader.exec_module(module)
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    headers = {"x-request-source": "benchmark", "x-service-name": "benchmark"}
+    client = module.Client(BASE_URL, client=http_client, headers=headers)
+    # the response is recorded once, so that only the code of the client is measured
+    code_only_client = module.Client(BASE_URL, client=ReplayClient(http_client), headers=headers)
+
+    url = f"{BASE_URL}/objects/1"
+    params = {"return_error": "", "from": ""}
+    path_params = {"object_id": "1"}
+
+    results = measure(
+        {
+            "httpx": lambda: module.GetObjectResp.model_validate(
+                http_client.request("get", url, headers=headers, params=params).json()
+            ),
+            "client": lambda: client.get_object(path_params=path_params, query_params=params),
+            "client code": lambda: code_only_client.get_object(path_params=path_params, query_params=params),
+            "client code, meta": lambda: code_only_client.get_object(
+                path_params=path_params, query_params=params, meta=module.PythogenMetaBox()
+            ),
+        },
+        args.calls,
+        args.repeat,
+    )
+    print("through httpx.MockTransport:")
+    print(f"  {'httpx':<20} {results['httpx'] * 1e6:8.1f}us")
+    print(f"  {'client':<20} {results['client'] * 1e6:8.1f}us  (+{(results['client'] - results['httpx']) * 1e6:.1f}us)")
+    print("code of the client only (recorded response):")
+    for title in ("client code", "client code, meta"):
+        print(f"  {title:<20} {results[title] * 1e6:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark of the throughput of the async client at high concurrency with different
+settings of its connection pool, against the mock server (python tests/server/server.py).
+
+The mock server (aiohttp) speaks only HTTP/1.1. To compare with HTTP/2, pass the URL
+of the same API served over HTTP/2 (e.g. by a TLS-terminating proxy) with --http2-url,
+it needs `pip install httpx[http2]`.
+
+Usage
+-----
+python benchmarks/client_concurrency.py --requests 5000 --concurrency 500
+python benchmarks/client_concurrency.py --http2-url https://localhost:8443
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import httpx
+
+from pythogen import formatter
+from pythogen import generator
+
+
+OPENAPI_PATH = "tests/docs/openapi.yaml"
+TEST_SERVER_URL = "http://localhost:8080"
+
+
+def load_client_module() -> ModuleType:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client_path = Path(tmp_dir) / "benchmark_client.py"
+        generator.generate(
+            input=OPENAPI_PATH,
+            output=str(client_path),
+            validation=generator.ValidationMode.off,
+            format_mode=formatter.FormatMode.none,
+        )
+        spec = importlib.util.spec_from_file_location("benchmark_client", client_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["benchmark_client"] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+async def measure(client: Any, requests: int, concurrency: int) -> float:
+    """Requests per second"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call() -> None:
+        async with semaphore:
+            await client.get_object(path_params={"object_id": "1"}, query_params={"return_error": "", "from": ""})
+
+    await call()  # the first connection is not measured
+    started_at = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(requests)))
+    return requests / (time.perf_counter() - started_at)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--url", default=TEST_SERVER_URL)
+    parser.add_argument("--http2-url", help="URL of the API served over HTTP/2")
+    args = parser.parse_args()
+
+    module = load_client_module()
+    pool_limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    variants: list[tuple[str, str, dict[str, Any]]] = [
+        ("HTTP/1.1, default limits", args.url, {}),
+        (f"HTTP/1.1, {args.concurrency} connections", args.url, {"limits": pool_limits}),
+    ]
+    if args.http2_url:
+        variants += [
+            ("HTTP/1.1 (--http2-url)", args.http2_url, {"limits": pool_limits}),
+            ("HTTP/2 (--http2-url)", args.http2_url, {"limits": pool_limits, "http2": True}),
+        ]
+
+    print(f"requests: {args.requests}, concurrency: {args.concurrency}")
+    for title, url, options in variants:
+        client = module.Client(url, timeout=60, logs_integration=None, **options)
+        try:
+            rps = await measure(client, args.requests, args.concurrency)
+        finally:
+            await client.close()
+        print(f"{title:<32} {rps:8.0f} requests/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
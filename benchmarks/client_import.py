@@ -0,0 +1,140 @@
+"""
+Benchmark of the import time of generated clients: single module vs package
+with lazily imported models (--layout=package), with and without --defer-build,
+on a synthetic specification with independent resources or on a given one.
+
+Every measurement is made in a fresh interpreter, the best of --repeat runs is shown.
+
+Usage
+-----
+python benchmarks/client_import.py --resources 300
+python benchmarks/client_import.py --spec examples/petstore/openapi.yaml
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from pythogen import formatter
+from pythogen import generator
+from pythogen import renderer
+
+
+def build_spec(resources_count: int) -> dict:
+    paths: dict = {}
+    schemas: dict = {
+        "Status": {"type": "string", "enum": ["active", "archived"]},
+    }
+    for i in range(resources_count):
+        paths[f"/resources{i}/{{id}}"] = {
+            "get": {
+                "operationId": f"getResource{i}",
+                "parameters": [{"name": "id", "in": "path", "required": True, "schema": {"type": "string"}}],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {"application/json": {"schema": {"$ref": f"#/components/schemas/Resource{i}"}}},
+                    }
+                },
+            }
+        }
+        schemas[f"Resource{i}"] = {
+            "type": "object",
+            "required": ["id"],
+            "properties": {
+                "id": {"type": "string"},
+                "name": {"type": "string"},
+                "status": {"$ref": "#/components/schemas/Status"},
+                "owner": {"$ref": f"#/components/schemas/Resource{i}Owner"},
+                "tags": {"type": "array", "items": {"$ref": f"#/components/schemas/Resource{i}Tag"}},
+            },
+        }
+        schemas[f"Resource{i}Owner"] = {
+            "type": "object",
+            "properties": {"id": {"type": "integer"}, "email": {"type": "string"}},
+        }
+        schemas[f"Resource{i}Tag"] = {
+            "type": "object",
+            "properties": {"key": {"type": "string"}, "value": {"type": "string"}},
+        }
+
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "benchmark", "version": "0.0.1"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+# httpx and pydantic are imported (and pydantic builds its first model) before the measurement,
+# so that only the code of the client is measured
+PRELUDE = """
+import httpx
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class Warmup(BaseModel):
+    x: int | None = Field(None, alias="y")
+"""
+
+
+def measure(code: str, cwd: Path, repeat: int) -> float:
+    script = (
+        f"{PRELUDE}\nimport time\nstarted_at = time.perf_counter()\n{code}\nprint(time.perf_counter() - started_at)"
+    )
+    return min(
+        float(
+            subprocess.run([sys.executable, "-c", script], cwd=cwd, capture_output=True, check=True, text=True).stdout
+        )
+        for _ in range(repeat)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resources", type=int, default=300)
+    parser.add_argument("--spec", help="OpenAPI file to use instead of the synthetic specification")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        if args.spec:
+            spec_path = Path(args.spec).absolute()
+            print(f"spec: {args.spec}")
+        else:
+            spec_path = tmp_dir_path / "openapi.json"
+            spec_path.write_text(json.dumps(build_spec(args.resources)))
+            print(f"resources: {args.resources}, models: {args.resources * 3}")
+
+        variants = (
+            ("module", renderer.Layout.module, False),
+            ("module, defer_build", renderer.Layout.module, True),
+            ("package", renderer.Layout.package, False),
+            ("package, defer_build", renderer.Layout.package, True),
+        )
+        for i, (title, layout, defer_build) in enumerate(variants):
+            module_name = f"client_{i}"
+            generator.generate(
+                input=str(spec_path),
+                output=str(tmp_dir_path / (module_name if layout is renderer.Layout.package else f"{module_name}.py")),
+                validation=generator.ValidationMode.off,
+                defer_build=defer_build,
+                format_mode=formatter.FormatMode.none,
+                layout=layout,
+            )
+            seconds = measure(f"from {module_name} import Client", tmp_dir_path, args.repeat)
+            print(f"{title + ': import':<30} {seconds * 1000:8.1f}ms")
+
+            if not args.spec:
+                code = f"from {module_name} import Resource0\nResource0.model_validate({{'id': '1'}})"
+                seconds = measure(code, tmp_dir_path, args.repeat)
+                print(f"{title + ': one model':<30} {seconds * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark of the overhead of DefaultMetricsIntegration on every request: the children
+of the metrics looked up by their labels on every request (on_request_success) vs
+the children bound to the operation once (bind_operation).
+
+Usage
+-----
+python benchmarks/metrics_overhead.py --calls 200000
+"""
+
+import argparse
+import datetime
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+import httpx
+from prometheus_client import CollectorRegistry
+from prometheus_client import Counter
+from prometheus_client import Gauge
+from prometheus_client import Histogram
+
+from pythogen import formatter
+from pythogen import generator
+
+
+OPENAPI_PATH = "tests/docs/openapi.yaml"
+LABELS = ["client_name", "http_method", "http_target"]
+
+
+def load_client_module() -> ModuleType:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client_path = Path(tmp_dir) / "benchmark_client.py"
+        generator.generate(
+            input=OPENAPI_PATH,
+            output=str(client_path),
+            sync=True,
+            metrics=True,
+            validation=generator.ValidationMode.off,
+            format_mode=formatter.FormatMode.none,
+        )
+        spec = importlib.util.spec_from_file_location("benchmark_client", client_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["benchmark_client"] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def measure(call: Callable[[], object], calls: int) -> float:
+    """Microseconds per call"""
+    started_at = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - started_at) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+
+    module = load_client_module()
+    registry = CollectorRegistry()
+    integration = module.DefaultMetricsIntegration(
+        client_response_time_histogram=Histogram("response_time", "", [*LABELS, "http_status_code"], registry=registry),
+        client_non_http_errors_counter=Counter("non_http_errors", "", [*LABELS, "exception"], registry=registry),
+        client_request_size_histogram=Histogram("request_size", "", LABELS, registry=registry),
+        client_response_size_histogram=Histogram("response_size", "", LABELS, registry=registry),
+        client_in_flight_requests_gauge=Gauge("in_flight_requests", "", LABELS, registry=registry),
+    )
+    response = httpx.Response(200, request=httpx.Request("GET", "http://localhost/objects/1"), content=b"{}")
+    response.elapsed = datetime.timedelta(milliseconds=5)
+    operation_metrics = integration.bind_operation("benchmark", "get", "/objects/:object_id")
+
+    def labels() -> None:
+        integration.on_request_success("benchmark", response, "get", "/objects/:object_id")
+
+    def bound() -> None:
+        operation_metrics.on_request_start()
+        operation_metrics.on_request_success(response)
+        operation_metrics.on_request_end()
+
+    print(f"calls: {args.calls}")
+    labels_us = measure(labels, args.calls)
+    bound_us = measure(bound, args.calls)
+    print(f"{'labels on every request':<36} {labels_us:6.2f}us")
+    print(f"{'bound children, with in-flight gauge':<36} {bound_us:6.2f}us   x{labels_us / bound_us:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark of the decoding of a large JSON array response by a generated client:
+the decoder of the client (pydantic-core parses and validates the bytes at once)
+vs json.loads + model_validate of every item.
+
+Usage
+-----
+python benchmarks/response_decoding.py --items 50000
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import httpx
+
+from pythogen import formatter
+from pythogen import generator
+
+
+OPENAPI_PATH = "tests/docs/openapi.yaml"
+
+
+def measure(decode: Callable[[], object], repeat: int) -> float:
+    return min(_time(decode) for _ in range(repeat))
+
+
+def _time(decode: Callable[[], object]) -> float:
+    gc.collect()  # garbage of the previous run is not collected during the measurement
+    started_at = time.perf_counter()
+    decode()
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client_path = Path(tmp_dir) / "benchmark_client.py"
+        generator.generate(
+            input=OPENAPI_PATH,
+            output=str(client_path),
+            sync=True,
+            validation=generator.ValidationMode.off,
+            format_mode=formatter.FormatMode.none,
+        )
+        spec = importlib.util.spec_from_file_location("benchmark_client", client_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["benchmark_client"] = module
+        spec.loader.exec_module(module)
+
+    cases = (
+        (
+            "flat items",
+            module.GetObjectWithArrayResponseResponse200Item,
+            module.GET_OBJECT_WITH_ARRAY_RESPONSE_DECODERS[200],
+            [{"pricePlanCode": f"plan-{i}", "quantity": i / 2} for i in range(args.items)],
+        ),
+        (
+            "nested items",
+            module.GetObjectResp,
+            module.GET_LIST_OBJECTS_DECODERS[200],
+            [
+                {
+                    "integer_data_all_params": 2,
+                    "string_data": f"item-{i}",
+                    "array_data": ["a", "b", "c"],
+                    "boolean_data": True,
+                    "child": {"integer_data_all_params": 3, "integer_data": i},
+                }
+                for i in range(args.items)
+            ],
+        ),
+    )
+    print(f"items: {args.items}")
+    for title, item_class, decoder, items in cases:
+        response = httpx.Response(200, content=json.dumps(items).encode())
+
+        def validate_python() -> object:
+            return [item_class.model_validate(item) for item in response.json()]
+
+        def validate_json() -> object:
+            return decoder(response)
+
+        assert validate_python() == validate_json()
+        python_seconds = measure(validate_python, args.repeat)
+        json_seconds = measure(validate_json, args.repeat)
+        print(
+            f"{title:<14} json + model_validate: {python_seconds * 1000:8.1f}ms   "
+            f"client decoder: {json_seconds * 1000:8.1f}ms   x{python_seconds / json_seconds:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark of the schemas ordering (Document.sorted_schemas / Document.sorted_enums)
+on a synthetic specification.
+
+Usage
+-----
+python benchmarks/sorted_schemas.py --schemas 10000
+"""
+
+import argparse
+import random
+import time
+
+from pythogen import models
+
+
+def build_document(schemas_count: int, seed: int = 0) -> models.Document:
+    rnd = random.Random(seed)
+    schemas: dict[str, models.SchemaObject] = {}
+    ids: list[str] = []
+
+    for i in range(schemas_count):
+        schema_id = f"Schema{i}"
+
+        if i % 10 == 0:
+            schemas[schema_id] = _schema(schema_id, type=models.Type.string, enum=["a", "b", "c"])
+            ids.append(schema_id)
+            continue
+
+        properties = []
+        for j in range(rnd.randint(1, 6)):
+            if not ids:
+                break
+            target = schemas[rnd.choice(ids)]
+            if j % 3 == 0:
+                # array of models
+                property_schema = _schema(f"prop{j}_list", type=models.Type.array, items=target)
+            else:
+                property_schema = target
+            properties.append(models.SchemaProperty(orig_key=f"prop{j}", safety_key=None, schema=property_schema))
+
+        all_of = [schemas[rnd.choice(ids)]] if ids and i % 7 == 0 else []
+        any_of = [schemas[rnd.choice(ids)], schemas[rnd.choice(ids)]] if ids and i % 11 == 0 else []
+        schemas[schema_id] = _schema(schema_id, properties=properties, all_of=all_of, any_of=any_of)
+        ids.append(schema_id)
+
+    # the order in the specification is arbitrary
+    shuffled = list(schemas.items())
+    rnd.shuffle(shuffled)
+
+    return models.Document(
+        info=models.InfoObject(title="benchmark", version="0.0.1"),
+        paths={},
+        parameters={},
+        schemas=dict(shuffled),
+        discriminator_base_class_schemas=[],
+    )
+
+
+def _schema(schema_id: str, type: models.Type = models.Type.object, **kwargs) -> models.SchemaObject:
+    return models.SchemaObject(
+        id=schema_id,
+        title=schema_id,
+        enum=kwargs.pop("enum", None),
+        type=type,
+        format=None,
+        items=kwargs.pop("items", None),
+        properties=kwargs.pop("properties", []),
+        **kwargs,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--schemas", type=int, default=10_000)
+    args = parser.parse_args()
+
+    document = build_document(args.schemas)
+
+    started_at = time.perf_counter()
+    sorted_schemas = document.sorted_schemas
+    sorted_enums = document.sorted_enums
+    elapsed = time.perf_counter() - started_at
+
+    print(f"schemas: {args.schemas}, models: {len(sorted_schemas)}, enums: {len(sorted_enums)}")
+    print(f"sorting: {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark of the memory used by uploads of a large file through a generated client:
+the file is sent as the body, as a byte iterator and as a multipart file part,
+by the sync and the async client. Every upload runs in a fresh interpreter,
+the growth of its peak RSS during the upload is shown.
+
+Needs the mock server: python tests/server/server.py
+
+Usage
+-----
+python benchmarks/upload_memory.py --size-mb 2048
+python benchmarks/upload_memory.py --size-mb 256 --with-bytes  # compare with the file read into memory
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from pythogen import formatter
+from pythogen import generator
+
+
+OPENAPI_PATH = "tests/docs/openapi.yaml"
+TEST_SERVER_URL = "http://localhost:8080"
+CHUNK_SIZE = 65536
+
+BYTES_VARIANT = {"sync, bytes": "client.upload(content=file.read())"}
+VARIANTS = {
+    "sync, file": "client.upload(content=file)",
+    "sync, iterator": "client.upload(content=iter(lambda: file.read(CHUNK_SIZE), b''))",
+    "sync, multipart file": "client.upload_multipart(body=PostFile(text='-'), files={'file': ('file.bin', file)})",
+    "async, file": "asyncio.run(client.upload(content=file))",
+    "async, multipart file": (
+        "asyncio.run(client.upload_multipart(body=PostFile(text='-'), files={'file': ('file.bin', file)}))"
+    ),
+}
+
+UPLOAD_SCRIPT = """
+import asyncio
+import json
+import resource
+import sys
+import time
+
+sys.path.insert(0, {clients_dir!r})
+from {module} import Client, PostFile
+
+CHUNK_SIZE = {chunk_size}
+client = Client({url!r}, timeout=600)
+with open({file_path!r}, "rb") as file:
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started_at = time.perf_counter()
+    response = {upload}
+    seconds = time.perf_counter() - started_at
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"size": response.size, "seconds": seconds, "rss_growth_kib": rss_after - rss_before}}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--with-bytes", action="store_true", help="also upload the file read into memory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        for module in ("sync_upload_client", "async_upload_client"):
+            generator.generate(
+                input=OPENAPI_PATH,
+                output=str(tmp_dir_path / f"{module}.py"),
+                sync=module.startswith("sync"),
+                validation=generator.ValidationMode.off,
+                format_mode=formatter.FormatMode.none,
+            )
+
+        file_path = tmp_dir_path / "upload.bin"
+        with open(file_path, "wb") as file:
+            file.truncate(args.size_mb * 2**20)  # sparse file, reading it doesn't touch the disk
+
+        print(f"file: {args.size_mb} MiB")
+        variants = {**BYTES_VARIANT, **VARIANTS} if args.with_bytes else VARIANTS
+        for title, upload in variants.items():
+            script = UPLOAD_SCRIPT.format(
+                clients_dir=str(tmp_dir_path),
+                module="sync_upload_client" if title.startswith("sync") else "async_upload_client",
+                chunk_size=CHUNK_SIZE,
+                url=TEST_SERVER_URL,
+                file_path=str(file_path),
+                upload=upload,
+            )
+            process = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True, text=True)
+            result = json.loads(process.stdout)
+            assert result["size"] == args.size_mb * 2**20, result
+            print(
+                f"{title:<24} peak RSS growth {result['rss_growth_kib'] / 1024:8.1f} MiB   "
+                f"{args.size_mb / result['seconds']:8.1f} MiB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,7 @@
 #
 # Generator info:
 #   GitHub Page: https://github.com/artsmolin/pythogen
-#   Version:     0.2.40
+#   Version:     0.2.41
 # ==============================================================================
 
 # jinja2: lstrip_blocks: "True"
@@ -15,14 +15,44 @@
 
 from __future__ import annotations
 
+import codecs
 import datetime
+import hashlib
 import logging
+import os
+import pickle
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from contextlib import contextmanager
 from dataclasses import dataclass
+from dataclasses import field
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from functools import lru_cache
+from json import JSONDecodeError
+from json import JSONDecoder
 from typing import IO
 from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
 from typing import Literal
+from typing import Mapping
 from typing import Protocol
+from typing import Sequence
+from typing import Sized
 from typing import Union
+from urllib.parse import urlsplit
 
 import httpx
 from httpx import Timeout
@@ -30,6 +60,7 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import RootModel
+from pydantic import TypeAdapter
 
 
 # backward compatibility for httpx<0.18.2
@@ -39,12 +70,780 @@ except AttributeError:
     DEFAULT_AUTH = None
 
 
+# decodes the response of an operation with the given status code, see <OPERATION>_DECODERS
+ResponseDecoder = Callable[[httpx.Response], Any]
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_class: type) -> TypeAdapter:
+    """Validator of JSON arrays of the model, built on the first use"""
+    return TypeAdapter(list[item_class])
+
+
+def _parse_any_of(item: dict[str, Any], schema_classes: list[Any]) -> Any:
+    for schema_class in schema_classes:
+        try:
+            return schema_class.model_validate(item)
+        except:
+            continue
+
+    raise Exception('Can\'t parse "{item}"')
+
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_DECODER = JSONDecoder()
+_JSON_NUMBER_START = frozenset("-0123456789")
+_JSON_AFTER_NUMBER = frozenset(", \t\n\r]")
+
+
+class _JsonArrayItems:
+    """Decodes items of a JSON array that is received in chunks
+
+    Only the item being received is kept in memory, so arrays of any size take constant memory.
+    """
+
+    def __init__(self) -> None:
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""  # received text that isn't decoded yet
+        self._started = False
+        self._after_item = False
+        self._finished = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Return the items that were completed by the chunk"""
+        text = self._text + self._utf8_decoder.decode(chunk)
+        position = 0
+        items: list[Any] = []
+        while True:
+            position = _JSON_WHITESPACE.match(text, position).end()
+            if position == len(text):
+                break
+
+            char = text[position]
+            if not self._started:
+                if char != "[":
+                    raise ValueError("JSON array is expected")
+                self._started = True
+                position += 1
+            elif self._finished:
+                raise ValueError("Unexpected data after the end of the JSON array")
+            elif char == "]":
+                self._finished = True
+                position += 1
+            elif self._after_item:
+                if char != ",":
+                    raise ValueError(f"Unexpected {char!r} between items of the JSON array")
+                self._after_item = False
+                position += 1
+            else:
+                try:
+                    item, end = _JSON_DECODER.raw_decode(text, position)
+                except JSONDecodeError:
+                    break  # the item ends in the next chunks
+                if char in _JSON_NUMBER_START and text[end : end + 1] not in _JSON_AFTER_NUMBER:
+                    break  # the number may continue in the next chunk
+                items.append(item)
+                position = end
+                self._after_item = True
+
+        self._text = text[position:]
+        return items
+
+    def close(self) -> None:
+        if not self._finished:
+            raise ValueError("JSON array is truncated or invalid")
+
+
+# path of a file, writable binary file or callback that receives chunks of the downloaded file
+DownloadDestination = Union[str, os.PathLike, IO[bytes], Callable[[bytes], Any]]
+
+
+@contextmanager
+def _open_destination(destination: DownloadDestination) -> Iterator[Callable[[bytes], Any]]:
+    """Function that writes a chunk of a downloaded file to the destination"""
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "wb") as file:
+            yield file.write
+    elif callable(destination):
+        yield destination
+    else:
+        yield destination.write
+
+
+@dataclass
+class TransferStats:
+    bytes_transferred: int = 0  # as received, before decoding of Content-Encoding
+    seconds: float = 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_transferred / self.seconds if self.seconds else 0.0
+
+
+class UnexpectedResponse(Exception):
+    """Response of a streaming method that isn't the streamed array"""
+
+    def __init__(self, status_code: int, body: Any) -> None:
+        super().__init__(f"Unexpected response with status code {status_code}")
+        self.status_code = status_code
+        self.body = body  # decoded as in the regular method, None if the status code is not described
+
+
+def _timeout(
+    timeout: float | Timeout,
+    connect: float | None,
+    read: float | None,
+    write: float | None,
+    pool: float | None,
+) -> Timeout:
+    timeout = timeout if isinstance(timeout, Timeout) else Timeout(timeout)
+    return Timeout(
+        connect=timeout.connect if connect is None else connect,
+        read=timeout.read if read is None else read,
+        write=timeout.write if write is None else write,
+        pool=timeout.pool if pool is None else pool,
+    )
+
+
+def _limits(limits: httpx.Limits | None, keepalive_expiry: float | None) -> httpx.Limits:
+    limits = limits or httpx.Limits()
+    if keepalive_expiry is None:
+        return limits
+    return httpx.Limits(
+        max_connections=limits.max_connections,
+        max_keepalive_connections=limits.max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+RETRIED_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+@dataclass
+class RetryPolicy:
+    """Retries of the requests of idempotent operations
+
+    The delay before the n-th retry is the Retry-After header of the response, or a random value
+    between 0 and min(backoff_max, backoff_base * 2 ** (n - 1)) ("full jitter"), so that the clients
+    that failed at the same time don't retry at the same time. Responses with Retry-After longer
+    than retry_after_max are not retried.
+    """
+
+    attempts: int = 3  # including the first one
+    backoff_base: float = 0.1
+    backoff_max: float = 10.0
+    retry_after_max: float = 60.0
+    status_codes: frozenset[int] = RETRIED_STATUS_CODES
+    exceptions: tuple[type[Exception], ...] = (httpx.TransportError,)
+
+    def delay(self, retry: int, response: httpx.Response | None) -> float | None:
+        """Seconds to wait before the retry, None if the request is not retried"""
+        if retry >= self.attempts:
+            return None
+        retry_after = _retry_after(response) if response is not None else None
+        if retry_after is None:
+            return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (retry - 1)))
+        return retry_after if retry_after <= self.retry_after_max else None
+
+
+class RetryBudget:
+    """Limits retries to a share of the requests, so that retries don't multiply the load of a failing server
+
+    Every retried request adds `ratio` tokens, up to `max_tokens`, every retry takes one token.
+    The budget starts full, so that occasional failures are retried when there are few requests.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()  # the sync client may be used from many threads
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds from the Retry-After header, which is either seconds or an HTTP date"""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+def _is_replayable(content: Any, files: Any) -> bool:
+    """Files and iterators are consumed by the first attempt, so such requests can't be retried"""
+    return files is None and (content is None or isinstance(content, (str, bytes)))
+
+
+RESULT_EXTENSION = "pythogen_result"  # holder of the decoded result of a shared response
+_REVALIDATED_HEADERS = ("Cache-Control", "Expires", "Date", "Age", "ETag", "Last-Modified")
+_BODY_ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})  # of the received body
+
+
+def _cache_control(headers: httpx.Headers) -> dict[str, str]:
+    """Directives of the Cache-Control header, e.g. {"max-age": "60", "no-cache": ""}"""
+    directives: dict[str, str] = {}
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.partition("=")
+        if name.strip():
+            directives[name.strip().lower()] = value.strip().strip('"')
+    return directives
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return date.timestamp()
+
+
+def _fresh_until(headers: httpx.Headers) -> float:
+    """Time (time.time()) until which a response may be returned from the cache without revalidation"""
+    now = time.time()
+    cache_control = _cache_control(headers)
+    if "no-cache" in cache_control:
+        return now
+    if "max-age" in cache_control:
+        try:
+            return now + int(cache_control["max-age"]) - int(headers.get("Age", "0"))
+        except ValueError:
+            return now
+    expires = _http_date(headers.get("Expires"))
+    if expires is not None:
+        return now + expires - (_http_date(headers.get("Date")) or now)
+    return now
+
+
+@dataclass
+class CacheEntry:
+    """Response in the cache: the body and, once the response is decoded, the result of the method"""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    fresh_until: float
+    decoded: Any = None
+    is_decoded: bool = False
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "CacheEntry | None":
+        """Entry of the response, None if the response must not be cached"""
+        if response.status_code != 200 or "no-store" in _cache_control(response.headers):
+            return None
+        fresh_until = _fresh_until(response.headers)
+        has_validators = "ETag" in response.headers or "Last-Modified" in response.headers
+        if fresh_until <= time.time() and not has_validators:
+            return None  # it would never be used
+        return cls(response.status_code, _decoded_body_headers(response.headers), response.content, fresh_until)
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+    def validators(self) -> dict[str, str]:
+        """Headers of a conditional request, the server answers 304 if the cached response is still valid"""
+        headers = httpx.Headers(self.headers)
+        validators = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+    def revalidate(self, response: httpx.Response) -> None:
+        """Update the entry with the headers of the 304 response"""
+        headers = httpx.Headers(self.headers)
+        for name in _REVALIDATED_HEADERS:
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        self.headers = headers.multi_items()
+        self.fresh_until = _fresh_until(headers)
+
+    def to_response(self, method: str, url: str, cached: "_CachedResponse") -> httpx.Response:
+        response = httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(method, url),
+            extensions={RESULT_EXTENSION: cached},
+        )
+        response.elapsed = datetime.timedelta(0)
+        return response
+
+
+class CacheBackend(Protocol):
+    """Storage of cached responses, keys are hex digests"""
+
+    def get(self, key: str) -> CacheEntry | None:
+        ...
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+
+class MemoryCache:
+    """Least recently used responses in memory, up to `max_bytes` of bodies
+
+    Decoded results are returned to every caller, they must not be modified.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()  # the sync client may be used from many threads
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._pop(key)
+            if len(entry.content) > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._bytes += len(entry.content)
+            while self._bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.content)
+
+
+class DiskCache:
+    """Responses in the files of a local directory, the least recently used ones are removed beyond `max_bytes`
+
+    Entries are pickled, so only the application must be able to write to the directory.
+    The directory may be shared by the processes of the application.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int = 256 * 2**20) -> None:
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self._bytes = sum(size for _, size, _ in self._files())  # estimate, other processes may change the files
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                entry = pickle.load(file)
+            os.utime(path)  # the modification time is the time of the last use
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self.delete(key)  # written by another version of the client or damaged
+            return None
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            size = file.tell()
+        with self._lock:
+            size -= self._size(path)  # the replaced entry
+            os.replace(tmp_path, path)  # readers never see a partly written file
+            self._bytes += size
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        with self._lock:
+            size = self._size(path)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                return
+            self._bytes -= size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    @staticmethod
+    def _size(path: str) -> int:
+        try:
+            return os.stat(path).st_size
+        except FileNotFoundError:
+            return 0
+
+    def _files(self) -> list[tuple[float, int, str]]:
+        files = []
+        for dir_entry in os.scandir(self.directory):
+            if dir_entry.name.endswith(".pickle"):
+                try:
+                    stat = dir_entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, dir_entry.path))
+        return files
+
+    def _evict(self) -> None:
+        files = sorted(self._files())
+        self._bytes = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if self._bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._bytes -= size
+
+
+@dataclass
+class _CachedResponse:
+    """Result of a cached response, in response.extensions[RESULT_EXTENSION]"""
+
+    backend: CacheBackend
+    key: str
+    entry: CacheEntry
+    without_request: bool = False  # the response is fresh
+
+    def decoded(self, decoder: ResponseDecoder, response: httpx.Response) -> Any:
+        if not self.entry.is_decoded:
+            self.entry.decoded = decoder(response)
+            self.entry.is_decoded = True
+            self.backend.set(self.key, self.entry)
+        return self.entry.decoded
+
+
+class _SharedResponse:
+    """Result of a response that is returned to many coalesced calls, in response.extensions[RESULT_EXTENSION]"""
+
+    without_request = False
+
+    def __init__(self) -> None:
+        self._decoded: Any = None
+        self._is_decoded = False
+
+    def decoded(self, decoder: ResponseDecoder, response: httpx.Response) -> Any:
+        if not self._is_decoded:
+            self._decoded = decoder(response)
+            self._is_decoded = True
+        return self._decoded
+
+
+@dataclass
+class _CoalescedResponse:
+    """Result of a response of a call that was coalesced with another one"""
+
+    shared: "_CachedResponse | _SharedResponse"
+    without_request = True
+
+    def decoded(self, decoder: ResponseDecoder, response: httpx.Response) -> Any:
+        return self.shared.decoded(decoder, response)
+
+
+def _request_key(method: str, url: str, params: Any, headers: Mapping[str, str] | None) -> str:
+    key = repr((method, url, str(httpx.QueryParams(params)), sorted((headers or {}).items())))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _is_shareable_request(kwargs: dict[str, Any]) -> bool:
+    """Responses of requests with a body or a per-call auth are not shared, auth isn't a part of the key"""
+    return kwargs.get("content") is None and kwargs.get("auth") is DEFAULT_AUTH
+
+
+def _decoded_body_headers(headers: httpx.Headers) -> list[tuple[str, str]]:
+    """Headers of a response whose body is already decoded"""
+    return [(name, value) for name, value in headers.multi_items() if name not in _BODY_ENCODING_HEADERS]
+
+
+def _decoded(decoder: ResponseDecoder, response: httpx.Response) -> Any:
+    """Result of the method, shared responses are decoded once"""
+    shared = response.extensions.get(RESULT_EXTENSION)
+    if shared is None:
+        return decoder(response)
+    return shared.decoded(decoder, response)
+
+
+def _without_request(response: httpx.Response) -> bool:
+    """The response was returned from the cache or to a coalesced call, it isn't a request in the metrics"""
+    shared = response.extensions.get(RESULT_EXTENSION)
+    return shared is not None and shared.without_request
+
+
+class CircuitState(str, Enum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+@dataclass
+class CircuitBreakerPolicy:
+    """Circuit breakers of the operations (key="operation") or of the hosts (key="host")
+
+    A circuit opens when at least `failure_rate` of the last `window` calls failed, but not before `min_calls` calls.
+    The calls to an open circuit fail at once with CircuitOpenError. In `open_seconds` the circuit is half-open:
+    `half_open_calls` trial calls are let through, it closes when all of them succeed and opens again when one fails.
+    Failures are exceptions and responses with `failure_status_codes`.
+    """
+
+    failure_rate: float = 0.5
+    window: int = 20
+    min_calls: int = 10
+    open_seconds: float = 30.0
+    half_open_calls: int = 1
+    failure_status_codes: frozenset[int] = frozenset({500, 502, 503, 504})
+    key: Literal["operation", "host"] = "operation"
+
+
+class CircuitOpenError(Exception):
+    """The call was not made, because the circuit of the operation or the host is open"""
+
+    def __init__(self, circuit: str, retry_after: float) -> None:
+        super().__init__(f"Circuit {circuit} is open, retry in {retry_after:.1f}s")
+        self.circuit = circuit
+        self.retry_after = retry_after  # seconds until the circuit is half-open
+
+
+class CircuitBreaker:
+    """Circuit breaker of an operation or a host, see CircuitBreakerPolicy"""
+
+    def __init__(
+        self, circuit: str, policy: CircuitBreakerPolicy, on_state_change: Callable[[str, CircuitState], Any]
+    ) -> None:
+        self.circuit = circuit
+        self.policy = policy
+        self.state = CircuitState.closed
+        self._on_state_change = on_state_change
+        self._failed: deque[bool] = deque(maxlen=policy.window)  # outcomes of the last calls
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0  # in flight
+        self._trial_successes = 0
+        self._lock = threading.Lock()  # the sync client may be used from many threads
+
+    def before_call(self) -> bool:
+        """Let the call through or raise CircuitOpenError, True if it's a trial call of the half-open circuit"""
+        with self._lock:
+            previous_state = self.state
+            if self.state is CircuitState.open:
+                retry_after = self._opened_at + self.policy.open_seconds - time.monotonic()
+                if retry_after > 0:
+                    raise CircuitOpenError(self.circuit, retry_after)
+                self._set_state(CircuitState.half_open)
+            trial = self.state is CircuitState.half_open
+            if trial:
+                if self._trial_calls >= self.policy.half_open_calls:
+                    raise CircuitOpenError(self.circuit, 0.0)
+                self._trial_calls += 1
+            state = self.state
+        if state is not previous_state:
+            self._on_state_change(self.circuit, state)
+        return trial
+
+    def record(self, trial: bool, failed: bool) -> None:
+        with self._lock:
+            previous_state = self.state
+            if trial:
+                self._trial_calls -= 1
+                if self.state is CircuitState.half_open:
+                    if failed:
+                        self._set_state(CircuitState.open)
+                    else:
+                        self._trial_successes += 1
+                        if self._trial_successes >= self.policy.half_open_calls:
+                            self._set_state(CircuitState.closed)
+            elif self.state is CircuitState.closed:
+                if len(self._failed) == self._failed.maxlen:
+                    self._failures -= self._failed[0]
+                self._failed.append(failed)
+                self._failures += failed
+                failure_rate = self._failures / len(self._failed)
+                if len(self._failed) >= self.policy.min_calls and failure_rate >= self.policy.failure_rate:
+                    self._set_state(CircuitState.open)
+            state = self.state
+        if state is not previous_state:
+            self._on_state_change(self.circuit, state)
+
+    def release(self, trial: bool) -> None:
+        """The call ended without a result"""
+        if trial:
+            with self._lock:
+                self._trial_calls -= 1
+
+    def _set_state(self, state: CircuitState) -> None:
+        self.state = state
+        self._failed.clear()
+        self._failures = 0
+        self._trial_successes = 0
+        if state is CircuitState.open:
+            self._opened_at = time.monotonic()
+
+
+RATE_LIMIT_RESET_TIMESTAMP = 10**9  # larger X-RateLimit-Reset values are Unix timestamps, not seconds
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket: `requests` per `period` seconds, in bursts of up to `burst` requests (default: `requests`)"""
+
+    requests: float
+    period: float = 1.0
+    burst: float | None = None
+
+    @property
+    def rate(self) -> float:
+        """Tokens per second"""
+        return self.requests / self.period
+
+    @property
+    def capacity(self) -> float:
+        return self.burst if self.burst is not None else self.requests
+
+
+class TokenBucket:
+    """Rate limiter of the client or of an operation, see RateLimit
+
+    A request takes a token, the tokens may go below zero: the request waits until its token is refilled.
+    So waiting doesn't hold a lock, and the sync and the async client share the limiter.
+    """
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit = limit
+        self._tokens = limit.capacity
+        self._refilled_at = time.monotonic()  # in the future while the server asks to wait
+        self._lock = threading.Lock()  # the sync client may be used from many threads
+
+    def reserve(self) -> float:
+        """Take a token, seconds to wait before the request is sent"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = max(0.0, self._refilled_at - now)
+            if self._tokens < 0:
+                delay += -self._tokens / self.limit.rate
+            return delay
+
+    def update(self, remaining: int, reset: float) -> None:
+        """Follow the quota of the server: `remaining` requests are left until the reset in `reset` seconds"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, remaining)
+            if remaining <= 0:
+                self._refilled_at = max(self._refilled_at, now + reset)
+
+    def _refill(self, now: float) -> None:
+        if now > self._refilled_at:
+            self._tokens = min(self.limit.capacity, self._tokens + (now - self._refilled_at) * self.limit.rate)
+            self._refilled_at = now
+
+
+def _rate_limit_quota(response: httpx.Response) -> tuple[int, float] | None:
+    """Remaining requests and seconds until the reset of the quota of the server
+
+    By the RateLimit-Remaining/RateLimit-Reset or X-RateLimit-Remaining/X-RateLimit-Reset headers,
+    the reset is seconds or a Unix timestamp. 429 Too Many Requests leaves no requests until Retry-After.
+    """
+    quota = None
+    for prefix in ("RateLimit-", "X-RateLimit-"):
+        remaining = response.headers.get(prefix + "Remaining")
+        if remaining is not None:
+            try:
+                reset = float(response.headers.get(prefix + "Reset", 0))
+                quota = int(remaining), reset - time.time() if reset > RATE_LIMIT_RESET_TIMESTAMP else reset
+            except ValueError:
+                pass
+            break
+    if response.status_code == 429:
+        retry_after = _retry_after(response)
+        reset = quota[1] if quota is not None else 0.0
+        quota = 0, max(reset, retry_after or 0.0)
+    return quota
+
+
+def _update_rate_limiters(limiters: list[TokenBucket], response: httpx.Response) -> None:
+    quota = _rate_limit_quota(response)
+    if quota is not None:
+        for limiter in limiters:
+            limiter.update(*quota)
+
+
 class RequestBodySerializer(Protocol):
     def __call__(self, v: Any) -> Any:
         ...
 
 
+class OperationMetrics(Protocol):
+    """Metrics of an operation, bound to its labels once, see MetricsIntegration.bind_operation"""
+
+    def on_request_start(self) -> None:
+        ...
+
+    def on_request_end(self) -> None:
+        ...
+
+    def on_request_success(self, response: httpx.Response) -> None:
+        ...
+
+    def on_request_error(self, error: Exception) -> None:
+        ...
+
+
 class MetricsIntegration(Protocol):
+    """Collects the metrics of the requests of the client
+
+    Optional methods, called if the integration defines them:
+
+    bind_operation(client_name, http_method, http_target) -> OperationMetrics | None
+        Called for every operation when the metrics integration is set on the client, if shadow_path() is True.
+        The client calls the methods of the returned OperationMetrics instead of on_request_success and
+        on_request_error, and OperationMetrics.on_request_start/on_request_end around every request it sends.
+        None keeps the methods of the integration.
+    on_request_retry(client_name, http_method, http_target, reason: str, delay: float)
+        Called before every retry.
+    on_circuit_state_change(client_name, circuit: str, state: str)
+        Called when a circuit breaker changes its state.
+    on_request_throttled(client_name, http_method, http_target, delay: float)
+        Called when a request waits for the rate limiter.
+    on_cache_lookup(client_name, http_method, http_target, result: str)
+        Called when a response of a GET operation is looked up in the cache, `result` is "hit", "miss"
+        or "revalidated" (the cached response is returned after 304 Not Modified).
+    """
+
     def on_request_error(
         self,
         client_name: str,
@@ -67,6 +866,12 @@ class MetricsIntegration(Protocol):
         ...
 
 
+def _request_size(response: httpx.Response) -> int | None:
+    """Bytes of the body of the request, None if it was streamed without Content-Length"""
+    content_length = response.request.headers.get("Content-Length")
+    return int(content_length) if content_length is not None else None
+
+
 @dataclass
 class RequestBox:
     client_name: str
@@ -83,6 +888,14 @@ class ResponseBox:
 
 
 class LogsIntegration(Protocol):
+    """Logs the events of the client
+
+    Optional methods, called if the integration defines them:
+
+    log_circuit_state_change(client_name, circuit: str, state: str)
+        Called when a circuit breaker changes its state.
+    """
+
     def log_extra(self, **kwargs: Any) -> dict[str, Any]:
         ...
 
@@ -132,8 +945,16 @@ class DefaultLogsIntegration:
         else:
             return logging.INFO
 
+    def log_circuit_state_change(self, client_name: str, circuit: str, state: str) -> None:
+        level = logging.WARNING if state == CircuitState.open else logging.INFO
+        logging.log(
+            level,
+            f"circuit breaker is {state} | client={client_name} | circuit={circuit}",
+            extra=self.log_extra(client=client_name, circuit=circuit, state=state),
+        )
+
 
-FileContent = Union[IO[str], IO[bytes], str, bytes]
+FileContent = Union[IO[str], IO[bytes], str, bytes, Iterable[bytes]]
 FileTypes = Union[
     # file (or text)
     FileContent,
@@ -144,138 +965,226 @@ FileTypes = Union[
 ]
 
 
-class RequiredHeaders(Exception):
-    ...
+# body of a request: files and iterators are sent in chunks (Transfer-Encoding: chunked, if the size is unknown)
+RequestContent = Union[str, bytes, IO[bytes], Iterable[bytes], AsyncIterable[bytes]]
 
+UPLOAD_CHUNK_SIZE = 65536
 
-class EmptyBody(BaseModel):
-    status_code: int
-    text: str
 
+class _IteratorReader:
+    """File-like reader of a byte iterator, httpx sends multipart file parts only from files
 
-class FindPetsByStatusQueryParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
+    Chunks are returned as they are produced, httpx doesn't need them to be of the requested size.
+    """
 
-    status: Literal["available", "pending", "sold"] | None = Field(None, alias="status")
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
 
+    def read(self, size: int = -1) -> bytes:
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
 
-class FindPetsByTagsQueryParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
 
-    tags: list[str] | None = Field(None, alias="tags")
+def _streamed_file(content: FileContent) -> FileContent:
+    if isinstance(content, (str, bytes)) or hasattr(content, "read") or not isinstance(content, Iterable):
+        return content
+    return _IteratorReader(content)
 
 
-class GetPetByIdPathParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
+def _streamed_files(
+    files: Mapping[str, FileTypes] | Sequence[tuple[str, FileTypes]],
+) -> list[tuple[str, FileTypes]]:
+    """Multipart files, where byte iterators are replaced with file-like readers"""
+    streamed_files: list[tuple[str, FileTypes]] = []
+    for name, file in files.items() if isinstance(files, Mapping) else files:
+        if isinstance(file, tuple):
+            file = (file[0], _streamed_file(file[1]), *file[2:])
+        else:
+            file = _streamed_file(file)
+        streamed_files.append((name, file))
+    return streamed_files
 
-    pet_id: int = Field(alias="petId")
 
+async def _aiter_chunks(content: IO[bytes] | Iterable[bytes]) -> AsyncIterator[bytes]:
+    if hasattr(content, "read"):
+        while chunk := content.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+    else:
+        for chunk in content:
+            yield chunk
 
-class GetOrderByIdPathParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
 
-    order_id: int = Field(alias="orderId")
+def _async_content(content: RequestContent | None) -> RequestContent | None:
+    """httpx.AsyncClient sends files and iterators in chunks only from async iterators"""
+    if content is None or isinstance(content, (str, bytes, AsyncIterable)):
+        return content
+    return _aiter_chunks(content)
 
 
-class LoginUserQueryParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
+@dataclass
+class MapResult:
+    """Result of a call of Client.map"""
 
-    username: str | None = Field(None, alias="username")
-    password: str | None = Field(None, alias="password")
+    index: int  # of the call in the calls
+    kwargs: dict[str, Any]
+    result: Any = None
+    error: Exception | None = None  # raised by the call
 
+    @property
+    def ok(self) -> bool:
+        return self.error is None
 
-class GetUserByNamePathParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
-
-    username: str = Field(alias="username")
 
+@dataclass
+class MapProgress:
+    """Progress of Client.map, updated when a call completes"""
+
+    total: int | None  # None if the calls are an iterator
+    completed: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def calls_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed else 0.0
+
+
+class _MapResults:
+    """Results of the completed calls of Client.map to return, in the order of the calls if `ordered`"""
+
+    def __init__(self, progress: MapProgress, on_progress: Callable[[MapProgress], Any] | None, ordered: bool) -> None:
+        self._progress = progress
+        self._on_progress = on_progress
+        self._ordered = ordered
+        self._waiting: dict[int, MapResult] = {}  # completed before the calls that precede them
+        self._next_index = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of the results that wait for the calls that precede them"""
+        return len(self._waiting)
+
+    def add(self, result: MapResult) -> list[MapResult]:
+        self._progress.completed += 1
+        self._progress.failed += not result.ok
+        if self._on_progress is not None:
+            self._on_progress(self._progress)
+        if not self._ordered:
+            return [result]
+        self._waiting[result.index] = result
+        results = []
+        while self._next_index in self._waiting:
+            results.append(self._waiting.pop(self._next_index))
+            self._next_index += 1
+        return results
 
-class UpdatePetWithFormPathParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
-
-    pet_id: int = Field(alias="petId")
 
+class RequiredHeaders(Exception):
+    ...
 
-class UpdatePetWithFormQueryParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
 
-    name: str | None = Field(None, alias="name")
-    status: str | None = Field(None, alias="status")
+class EmptyBody(BaseModel):
+    status_code: int
+    text: str
 
 
-class UploadFilePathParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
+class BasicAuth(BaseModel):
+    username: str
+    password: str
 
-    pet_id: int = Field(alias="petId")
 
+class PythogenMetaBox(BaseModel):
+    request: RequestBox | None = None
+    response: ResponseBox | None = None
+    transfer: TransferStats | None = None  # set by download_* methods
 
-class UploadFileQueryParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
 
-    additional_metadata: str | None = Field(None, alias="additionalMetadata")
+class Order(BaseModel):
+    """
+    None
 
+    """
 
-class UpdateUserPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    id: int | None = None
+    petId: int | None = Field(None, alias="petId")
+    quantity: int | None = None
+    shipDate: datetime.datetime | None = Field(None, alias="shipDate")
+    status: Literal["placed", "approved", "delivered"] | None = Field(None, description="Order Status")
+    complete: bool | None = None
 
-    username: str = Field(alias="username")
 
+class Address(BaseModel):
+    """
+    None
+
+    """
 
-class DeletePetPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    street: str | None = None
+    city: str | None = None
+    state: str | None = None
+    zip: str | None = None
 
-    pet_id: int = Field(alias="petId")
 
+class Customer(BaseModel):
+    """
+    None
+
+    """
 
-class DeletePetHeaders(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    id: int | None = None
+    username: str | None = None
+    address: list[Address] | None = None
 
-    api_key: str | None = Field(None, alias="api_key")
 
+class Category(BaseModel):
+    """
+    None
+
+    """
 
-class DeleteOrderPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    id: int | None = None
+    name: str | None = None
 
-    order_id: int = Field(alias="orderId")
 
+class User(BaseModel):
+    """
+    None
+
+    """
 
-class DeleteUserPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-
-    username: str = Field(alias="username")
+    id: int | None = None
+    username: str | None = None
+    firstName: str | None = Field(None, alias="firstName")
+    lastName: str | None = Field(None, alias="lastName")
+    email: str | None = None
+    password: str | None = None
+    phone: str | None = None
+    userStatus: int | None = Field(None, alias="userStatus", description="User Status")
 
 
-class CreateuserswithlistinputRequestBody(BaseModel):
+class Tag(BaseModel):
     """
     None
 
@@ -284,9 +1193,11 @@ class CreateuserswithlistinputRequestBody(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    id: int | None = None
+    name: str | None = None
 
 
-class FindpetsbytagsResponse200(BaseModel):
+class Pet(BaseModel):
     """
     None
 
@@ -295,9 +1206,15 @@ class FindpetsbytagsResponse200(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    name: str
+    photoUrls: list[str] = Field(..., alias="photoUrls")
+    id: int | None = None
+    category: Category | None = None
+    tags: list[Tag] | None = None
+    status: Literal["available", "pending", "sold"] | None = Field(None, description="pet status in the store")
 
 
-class FindpetsbystatusResponse200(BaseModel):
+class ApiResponse(BaseModel):
     """
     None
 
@@ -306,9 +1223,12 @@ class FindpetsbystatusResponse200(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    code: int | None = None
+    type: str | None = None
+    message: str | None = None
 
 
-class AddpetortagRequestBody(RootModel):
+class AddpetortagResponse200(RootModel):
     """
     None
 
@@ -317,7 +1237,7 @@ class AddpetortagRequestBody(RootModel):
     root: Pet | Tag
 
 
-class AddpetortagResponse200(RootModel):
+class AddpetortagRequestBody(RootModel):
     """
     None
 
@@ -326,7 +1246,7 @@ class AddpetortagResponse200(RootModel):
     root: Pet | Tag
 
 
-class ApiResponse(BaseModel):
+class FindpetsbystatusResponse200(BaseModel):
     """
     None
 
@@ -335,12 +1255,9 @@ class ApiResponse(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    code: int | None = None
-    type: str | None = None
-    message: str | None = None
 
 
-class Tag(BaseModel):
+class FindpetsbytagsResponse200(BaseModel):
     """
     None
 
@@ -349,11 +1266,9 @@ class Tag(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    id: int | None = None
-    name: str | None = None
 
 
-class Category(BaseModel):
+class CreateuserswithlistinputRequestBody(BaseModel):
     """
     None
 
@@ -362,112 +1277,307 @@ class Category(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    id: int | None = None
-    name: str | None = None
 
 
-class Pet(BaseModel):
-    """
-    None
+class FindPetsByStatusQueryParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    status: Literal["available", "pending", "sold"] | None = Field(None, alias="status")
 
-    """
 
+class FindPetsByTagsQueryParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    name: str
-    photoUrls: list[str] = Field(..., alias="photoUrls")
-    id: int | None = None
-    category: Category | None = None
-    tags: list[Tag] | None = None
-    status: Literal["available", "pending", "sold"] | None = Field(None, description="pet status in the store")
 
+    tags: list[str] | None = Field(None, alias="tags")
 
-class User(BaseModel):
-    """
-    None
 
-    """
+class GetPetByIdPathParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    pet_id: int = Field(alias="petId")
+
 
+class GetOrderByIdPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    id: int | None = None
-    username: str | None = None
-    firstName: str | None = Field(None, alias="firstName")
-    lastName: str | None = Field(None, alias="lastName")
-    email: str | None = None
-    password: str | None = None
-    phone: str | None = None
-    userStatus: int | None = Field(None, alias="userStatus", description="User Status")
 
+    order_id: int = Field(alias="orderId")
 
-class Address(BaseModel):
-    """
-    None
 
-    """
+class LoginUserQueryParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    username: str | None = Field(None, alias="username")
+    password: str | None = Field(None, alias="password")
 
+
+class GetUserByNamePathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    street: str | None = None
-    city: str | None = None
-    state: str | None = None
-    zip: str | None = None
 
+    username: str = Field(alias="username")
 
-class Customer(BaseModel):
-    """
-    None
 
-    """
+class UpdatePetWithFormPathParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
 
+    pet_id: int = Field(alias="petId")
+
+
+class UpdatePetWithFormQueryParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    id: int | None = None
-    username: str | None = None
-    address: list[Address] | None = None
 
+    name: str | None = Field(None, alias="name")
+    status: str | None = Field(None, alias="status")
 
-class Order(BaseModel):
-    """
-    None
 
-    """
+class UploadFilePathParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    pet_id: int = Field(alias="petId")
 
+
+class UploadFileQueryParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    id: int | None = None
-    petId: int | None = Field(None, alias="petId")
-    quantity: int | None = None
-    shipDate: datetime.datetime | None = Field(None, alias="shipDate")
-    status: Literal["placed", "approved", "delivered"] | None = Field(None, description="Order Status")
-    complete: bool | None = None
 
+    additional_metadata: str | None = Field(None, alias="additionalMetadata")
 
-class BasicAuth(BaseModel):
-    username: str
-    password: str
 
+class UpdateUserPathParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
 
-class PythogenMetaBox(BaseModel):
-    request: RequestBox | None = None
-    response: ResponseBox | None = None
+    username: str = Field(alias="username")
+
+
+class DeletePetPathParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    pet_id: int = Field(alias="petId")
+
+
+class DeletePetHeaders(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    api_key: str | None = Field(None, alias="api_key")
+
+
+class DeleteOrderPathParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    order_id: int = Field(alias="orderId")
+
+
+class DeleteUserPathParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    username: str = Field(alias="username")
+
+
+FIND_PETS_BY_STATUS_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: _list_adapter(Pet).validate_json(response.content),
+    400: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+FIND_PETS_BY_TAGS_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: _list_adapter(Pet).validate_json(response.content),
+    400: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+GET_PET_BY_ID_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: Pet.model_validate_json(response.content),
+    400: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+    404: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+GET_INVENTORY_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: response.json(),
+}
+
+GET_ORDER_BY_ID_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: Order.model_validate_json(response.content),
+    400: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+    404: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+LOGIN_USER_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: response.text,
+    400: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+LOGOUT_USER_DECODERS: dict[int, ResponseDecoder] = {}
+
+GET_USER_BY_NAME_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: User.model_validate_json(response.content),
+    400: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+    404: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+ADD_PET_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: Pet.model_validate_json(response.content),
+    405: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+ADD_PET_OR_TAG_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: AddpetortagResponse200.model_validate_json(response.content),
+    405: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+UPDATE_PET_WITH_FORM_DECODERS: dict[int, ResponseDecoder] = {
+    405: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+UPLOAD_FILE_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: ApiResponse.model_validate_json(response.content),
+}
+
+PLACE_ORDER_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: Order.model_validate_json(response.content),
+    405: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+CREATE_USER_DECODERS: dict[int, ResponseDecoder] = {}
+
+CREATE_USERS_WITH_LIST_INPUT_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: User.model_validate_json(response.content),
+}
+
+UPDATE_PET_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: Pet.model_validate_json(response.content),
+    400: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+    404: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+    405: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+UPDATE_USER_DECODERS: dict[int, ResponseDecoder] = {}
+
+DELETE_PET_DECODERS: dict[int, ResponseDecoder] = {
+    400: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+DELETE_ORDER_DECODERS: dict[int, ResponseDecoder] = {
+    400: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+    404: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+DELETE_USER_DECODERS: dict[int, ResponseDecoder] = {
+    400: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+    404: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+
+OPERATION_TARGETS: dict[str, tuple[str, str]] = {
+    "findPetsByStatus": ("get", "/pet/findByStatus"),
+    "findPetsByTags": ("get", "/pet/findByTags"),
+    "getPetById": ("get", "/pet/:petId"),
+    "getInventory": ("get", "/store/inventory"),
+    "getOrderById": ("get", "/store/order/:orderId"),
+    "loginUser": ("get", "/user/login"),
+    "logoutUser": ("get", "/user/logout"),
+    "getUserByName": ("get", "/user/:username"),
+    "addPet": ("post", "/pet"),
+    "addPetOrTag": ("post", "/pet_or_tag"),
+    "updatePetWithForm": ("post", "/pet/:petId"),
+    "uploadFile": ("post", "/pet/:petId/uploadImage"),
+    "placeOrder": ("post", "/store/order"),
+    "createUser": ("post", "/user"),
+    "createUsersWithListInput": ("post", "/user/createWithList"),
+    "updatePet": ("put", "/pet"),
+    "updateUser": ("put", "/user/:username"),
+    "deletePet": ("delete", "/pet/:petId"),
+    "deleteOrder": ("delete", "/store/order/:orderId"),
+    "deleteUser": ("delete", "/user/:username"),
+}
+
+
+IDEMPOTENT_OPERATIONS: frozenset[str] = frozenset(
+    {
+        "findPetsByStatus",
+        "findPetsByTags",
+        "getPetById",
+        "getInventory",
+        "getOrderById",
+        "loginUser",
+        "logoutUser",
+        "getUserByName",
+        "updatePet",
+        "updateUser",
+        "deletePet",
+        "deleteOrder",
+        "deleteUser",
+    }
+)
+
+
+CACHEABLE_OPERATIONS: frozenset[str] = frozenset(
+    {
+        "findPetsByStatus",
+        "findPetsByTags",
+        "getPetById",
+        "getInventory",
+        "getOrderById",
+        "loginUser",
+        "logoutUser",
+        "getUserByName",
+    }
+)
+
+
+RATE_LIMITS: dict[str, RateLimit] = {}
 
 
 class Client:
     def __init__(
         self,
         base_url: str,
-        timeout: int = 5,
+        timeout: float | Timeout = 5,
         client_name: str = "",
         client: httpx.Client | None = None,
         headers: dict[str, str] | None = None,
         metrics_integration: MetricsIntegration | None = None,
         logs_integration: LogsIntegration | None = DefaultLogsIntegration(),
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        limits: httpx.Limits | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        idempotent_operations: Iterable[str] = (),
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        rate_limits: Mapping[str, RateLimit | None] | None = None,
+        response_cache: CacheBackend | None = None,
+        cached_operations: Iterable[str] | None = None,
     ):
         """
         Parameters
@@ -475,7 +1585,7 @@ class Client:
         base_url
             Base URL
         timeout
-            In seconds
+            In seconds, or httpx.Timeout
         client_name
             Used in metrics
         client
@@ -486,27 +1596,182 @@ class Client:
             The object that is responsible for collecting and sending metrics
         logs_integration
             The object that is responsible for logging events
+        connect_timeout, read_timeout, write_timeout, pool_timeout
+            In seconds, override the parts of the timeout
+        limits
+            Limits of the connection pool, default: httpx.Limits()
+        keepalive_expiry
+            In seconds, overrides limits.keepalive_expiry
+        http2
+            Use HTTP/2 when the server supports it, needs `pip install httpx[http2]`
+
+        retry_policy
+            Retries of idempotent operations, requests are not retried by default
+        retry_budget
+            Limits retries of all the operations of the client, default: RetryBudget()
+        idempotent_operations
+            Names of the methods of the operations that are retried besides GET, PUT, DELETE
+            and the ones marked with `x-idempotent: true`
+        circuit_breaker
+            Circuit breakers of the operations or of the hosts, calls are not limited by default
+        rate_limit
+            Rate limit of all the requests of the client, requests are not limited by default
+        rate_limits
+            Names of the methods of operations -> rate limits that override the `x-rate-limit` extensions,
+            None turns the limit of the operation off
+        response_cache
+            Cache of the responses of GET operations, e.g. MemoryCache() or DiskCache(directory),
+            responses are not cached by default
+        cached_operations
+            Names of the methods of the GET operations whose responses are cached, default: all of them
+
+        Timeouts, limits and http2 configure the httpx-client that is created when `client` is not passed.
         """
-        self.client = client or httpx.Client(timeout=Timeout(timeout))
+        if client is None:
+            client = httpx.Client(
+                timeout=_timeout(timeout, connect_timeout, read_timeout, write_timeout, pool_timeout),
+                limits=_limits(limits, keepalive_expiry),
+                http2=http2,
+            )
+        self.client = client
         self.base_url = base_url
         self.headers = headers or {}
+        self.client_name = client_name
         self.metrics_integration = metrics_integration
         self.logs_integration = logs_integration
-        self.client_name = client_name
+        self.retry_policy = retry_policy
+        self.retry_budget = retry_budget or RetryBudget()
+        self._retried_operations = IDEMPOTENT_OPERATIONS | frozenset(idempotent_operations)
+        self.circuit_breaker_policy = circuit_breaker
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self.rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+        rate_limits_ = {**RATE_LIMITS, **(rate_limits or {})}
+        self._rate_limiters = {
+            fn_name: TokenBucket(limit) for fn_name, limit in rate_limits_.items() if limit is not None
+        }
+        self.response_cache = response_cache
+        if cached_operations is None:
+            self._cached_operations = CACHEABLE_OPERATIONS
+        else:
+            self._cached_operations = CACHEABLE_OPERATIONS & frozenset(cached_operations)
+
+    @property
+    def metrics_integration(self) -> MetricsIntegration | None:
+        return self._metrics_integration
+
+    @metrics_integration.setter
+    def metrics_integration(self, metrics_integration: MetricsIntegration | None) -> None:
+        """Ask for the shadow path and bind the metrics of the operations once, not on every request"""
+        self._metrics_integration = metrics_integration
+        self._shadow_path = bool(metrics_integration) and metrics_integration.shadow_path()
+        self._operation_metrics: dict[str, OperationMetrics] = {}
+        bind_operation = getattr(metrics_integration, "bind_operation", None)
+        if bind_operation is None or not self._shadow_path:
+            return
+        for fn_name, (http_method, http_target) in OPERATION_TARGETS.items():
+            operation_metrics = bind_operation(self.client_name, http_method, http_target)
+            if operation_metrics is not None:
+                self._operation_metrics[fn_name] = operation_metrics
+
+    def findPetsByStatus(
+        self,
+        *,
+        query_params: FindPetsByStatusQueryParams | dict[str, Any],
+        auth: BasicAuth | None = None,
+        content: RequestContent | None = None,
+        meta: PythogenMetaBox | None = None,
+    ) -> EmptyBody | list[Pet]:
+        """
+        GET /pet/findByStatus
+        Operation ID: findPetsByStatus
+        Summary:      Finds Pets by status
+        Description:  Multiple status values can be provided with comma separated strings
+        """
+
+        method = "get"
+
+        path = "/pet/findByStatus"
+
+        url = f"{self.base_url}{path}"
+
+        if isinstance(query_params, FindPetsByStatusQueryParams):
+            params = query_params.model_dump(by_alias=True, exclude_none=True)
+        else:
+            params = query_params
+
+        headers_ = self.headers
 
-    def findPetsByStatus(
+        if auth is None:
+            auth_ = DEFAULT_AUTH
+        elif isinstance(auth, httpx.Auth):
+            auth_ = auth
+        else:
+            auth_ = (auth.username, auth.password)
+
+        try:
+            response = self._request(
+                "findPetsByStatus",
+                method,
+                url,
+                path,
+                "/pet/findByStatus",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
+        except Exception as exc:
+            if self.metrics_integration:
+                self._report_request_error("findPetsByStatus", method, path, "/pet/findByStatus", exc)
+
+            raise exc
+
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("findPetsByStatus", method, path, "/pet/findByStatus", response)
+
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
+
+        decoder = FIND_PETS_BY_STATUS_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
+
+        return _decoded(decoder, response)
+
+    def stream_findPetsByStatus(
         self,
         *,
         query_params: FindPetsByStatusQueryParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
-    ) -> EmptyBody | list[Pet]:
+        chunk_size: int = 65536,
+    ) -> Iterator[Pet]:
         """
         GET /pet/findByStatus
         Operation ID: findPetsByStatus
         Summary:      Finds Pets by status
         Description:  Multiple status values can be provided with comma separated strings
+
+        Streaming variant of findPetsByStatus: items of the array in the 200 response
+        are yielded one by one as they are received, the whole response is never loaded
+        into memory. Other responses raise UnexpectedResponse.
         """
 
         method = "get"
@@ -520,7 +1785,7 @@ class Client:
         else:
             params = query_params
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -529,62 +1794,65 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        metrics_path = "/pet/findByStatus"
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            with self._stream(
+                "findPetsByStatus",
+                method,
+                url,
+                path,
+                metrics_path,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            ) as response:
+                if response.status_code == 200:
+                    array_items = _JsonArrayItems()
+                    for chunk in response.iter_bytes(chunk_size):
+                        for item in array_items.feed(chunk):
+                            yield Pet.model_validate(item)
+                    array_items.close()
+                else:
+                    response.read()
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/pet/findByStatus"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("findPetsByStatus", method, path, metrics_path, exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/pet/findByStatus"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
-
-        if response.status_code == 200:
-            return [Pet.model_validate(item) for item in response.json()]
+            self._report_request_success("findPetsByStatus", method, path, metrics_path, response)
 
-        if response.status_code == 400:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-            if self.logs_integration:
+        if response.status_code != 200:
+            if self.logs_integration and response.status_code >= 400:
                 self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+            decoder = FIND_PETS_BY_STATUS_DECODERS.get(response.status_code)
+            raise UnexpectedResponse(response.status_code, decoder(response) if decoder is not None else None)
 
     def findPetsByTags(
         self,
         *,
         query_params: FindPetsByTagsQueryParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> EmptyBody | list[Pet]:
         """
@@ -605,7 +1873,7 @@ class Client:
         else:
             params = query_params
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -615,61 +1883,150 @@ class Client:
             auth_ = (auth.username, auth.password)
 
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            response = self._request(
+                "findPetsByTags",
+                method,
+                url,
+                path,
+                "/pet/findByTags",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/pet/findByTags"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("findPetsByTags", method, path, "/pet/findByTags", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/pet/findByTags"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("findPetsByTags", method, path, "/pet/findByTags", response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if meta:
-            meta.request = req
-            meta.response = resp
+        decoder = FIND_PETS_BY_TAGS_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-        if response.status_code == 200:
-            return [Pet.model_validate(item) for item in response.json()]
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-        if response.status_code == 400:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        return _decoded(decoder, response)
+
+    def stream_findPetsByTags(
+        self,
+        *,
+        query_params: FindPetsByTagsQueryParams | dict[str, Any],
+        auth: BasicAuth | None = None,
+        content: RequestContent | None = None,
+        meta: PythogenMetaBox | None = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[Pet]:
+        """
+        GET /pet/findByTags
+        Operation ID: findPetsByTags
+        Summary:      Finds Pets by tags
+        Description:  Multiple tags can be provided with comma separated strings. Use tag1, tag2, tag3 for testing.
+
+        Streaming variant of findPetsByTags: items of the array in the 200 response
+        are yielded one by one as they are received, the whole response is never loaded
+        into memory. Other responses raise UnexpectedResponse.
+        """
+
+        method = "get"
+
+        path = "/pet/findByTags"
+
+        url = f"{self.base_url}{path}"
+
+        if isinstance(query_params, FindPetsByTagsQueryParams):
+            params = query_params.model_dump(by_alias=True, exclude_none=True)
+        else:
+            params = query_params
+
+        headers_ = self.headers
+
+        if auth is None:
+            auth_ = DEFAULT_AUTH
+        elif isinstance(auth, httpx.Auth):
+            auth_ = auth
+        else:
+            auth_ = (auth.username, auth.password)
+
+        metrics_path = "/pet/findByTags"
+        try:
+            with self._stream(
+                "findPetsByTags",
+                method,
+                url,
+                path,
+                metrics_path,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            ) as response:
+                if response.status_code == 200:
+                    array_items = _JsonArrayItems()
+                    for chunk in response.iter_bytes(chunk_size):
+                        for item in array_items.feed(chunk):
+                            yield Pet.model_validate(item)
+                    array_items.close()
+                else:
+                    response.read()
+        except Exception as exc:
+            if self.metrics_integration:
+                self._report_request_error("findPetsByTags", method, path, metrics_path, exc)
+
+            raise exc
+
+        if self.metrics_integration:
+            self._report_request_success("findPetsByTags", method, path, metrics_path, response)
+
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-            if self.logs_integration:
+        if response.status_code != 200:
+            if self.logs_integration and response.status_code >= 400:
                 self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+            decoder = FIND_PETS_BY_TAGS_DECODERS.get(response.status_code)
+            raise UnexpectedResponse(response.status_code, decoder(response) if decoder is not None else None)
 
     def getPetById(
         self,
         *,
         path_params: GetPetByIdPathParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> EmptyBody | Pet:
         """
@@ -690,7 +2047,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -700,71 +2057,56 @@ class Client:
             auth_ = (auth.username, auth.password)
 
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            response = self._request(
+                "getPetById",
+                method,
+                url,
+                path,
+                "/pet/:petId",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/pet/:petId"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("getPetById", method, path, "/pet/:petId", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/pet/:petId"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
-
-        if response.status_code == 200:
-            return Pet.model_validate(response.json())
-
-        if response.status_code == 400:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
-
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("getPetById", method, path, "/pet/:petId", response)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 404:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = GET_PET_BY_ID_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        return _decoded(decoder, response)
 
     def getInventory(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> dict[Any, Any] | None:
         """
@@ -782,7 +2124,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -792,50 +2134,53 @@ class Client:
             auth_ = (auth.username, auth.password)
 
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            response = self._request(
+                "getInventory",
+                method,
+                url,
+                path,
+                "/store/inventory",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/store/inventory"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("getInventory", method, path, "/store/inventory", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/store/inventory"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("getInventory", method, path, "/store/inventory", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return response.json()
+        decoder = GET_INVENTORY_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
 
     def getOrderById(
         self,
         *,
         path_params: GetOrderByIdPathParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> EmptyBody | Order:
         """
@@ -856,7 +2201,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -866,72 +2211,57 @@ class Client:
             auth_ = (auth.username, auth.password)
 
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            response = self._request(
+                "getOrderById",
+                method,
+                url,
+                path,
+                "/store/order/:orderId",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/store/order/:orderId"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("getOrderById", method, path, "/store/order/:orderId", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/store/order/:orderId"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
-
-        if response.status_code == 200:
-            return Order.model_validate(response.json())
-
-        if response.status_code == 400:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
-
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("getOrderById", method, path, "/store/order/:orderId", response)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 404:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = GET_ORDER_BY_ID_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        return _decoded(decoder, response)
 
     def loginUser(
         self,
         *,
         query_params: LoginUserQueryParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> EmptyBody | str:
         """
@@ -952,7 +2282,7 @@ class Client:
         else:
             params = query_params
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -962,60 +2292,56 @@ class Client:
             auth_ = (auth.username, auth.password)
 
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            response = self._request(
+                "loginUser",
+                method,
+                url,
+                path,
+                "/user/login",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/user/login"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("loginUser", method, path, "/user/login", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/user/login"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("loginUser", method, path, "/user/login", response)
 
-        if response.status_code == 200:
-            return response.text
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 400:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = LOGIN_USER_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        return _decoded(decoder, response)
 
     def logoutUser(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> None:
         """
@@ -1033,7 +2359,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1043,47 +2369,53 @@ class Client:
             auth_ = (auth.username, auth.password)
 
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            response = self._request(
+                "logoutUser",
+                method,
+                url,
+                path,
+                "/user/logout",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/user/logout"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("logoutUser", method, path, "/user/logout", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/user/logout"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("logoutUser", method, path, "/user/logout", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
+        decoder = LOGOUT_USER_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
+
     def getUserByName(
         self,
         *,
         path_params: GetUserByNamePathParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> EmptyBody | User:
         """
@@ -1104,7 +2436,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1114,71 +2446,56 @@ class Client:
             auth_ = (auth.username, auth.password)
 
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            response = self._request(
+                "getUserByName",
+                method,
+                url,
+                path,
+                "/user/:username",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/user/:username"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("getUserByName", method, path, "/user/:username", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/user/:username"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
-
-        if response.status_code == 200:
-            return User.model_validate(response.json())
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("getUserByName", method, path, "/user/:username", response)
 
-        if response.status_code == 400:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
-
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
-
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 404:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = GET_USER_BY_NAME_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        return _decoded(decoder, response)
 
     def addPet(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: Pet | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -1198,7 +2515,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1217,62 +2534,57 @@ class Client:
             json = None
 
         try:
-            response = self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = self._request(
+                "addPet",
+                method,
+                url,
+                path,
+                "/pet",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/pet"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("addPet", method, path, "/pet", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/pet"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
-
-        if response.status_code == 200:
-            return Pet.model_validate(response.json())
+        if self.metrics_integration:
+            self._report_request_success("addPet", method, path, "/pet", response)
 
-        if response.status_code == 405:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        decoder = ADD_PET_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        return decoder(response)
 
     def addPetOrTag(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: AddpetortagRequestBody | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -1292,7 +2604,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1311,56 +2623,51 @@ class Client:
             json = None
 
         try:
-            response = self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = self._request(
+                "addPetOrTag",
+                method,
+                url,
+                path,
+                "/pet_or_tag",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/pet_or_tag"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("addPetOrTag", method, path, "/pet_or_tag", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/pet_or_tag"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
+            self._report_request_success("addPetOrTag", method, path, "/pet_or_tag", response)
 
-        if response.status_code == 200:
-            return AddpetortagResponse200.model_validate(response.json())
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 405:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = ADD_PET_OR_TAG_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        return decoder(response)
 
     def updatePetWithForm(
         self,
@@ -1368,7 +2675,7 @@ class Client:
         path_params: UpdatePetWithFormPathParams | dict[str, Any],
         query_params: UpdatePetWithFormQueryParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> EmptyBody | None:
         """
@@ -1392,7 +2699,7 @@ class Client:
         else:
             params = query_params
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1402,51 +2709,50 @@ class Client:
             auth_ = (auth.username, auth.password)
 
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            response = self._request(
+                "updatePetWithForm",
+                method,
+                url,
+                path,
+                "/pet/:petId",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/pet/:petId"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("updatePetWithForm", method, path, "/pet/:petId", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/pet/:petId"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+            self._report_request_success("updatePetWithForm", method, path, "/pet/:petId", response)
 
-        if meta:
-            meta.request = req
-            meta.response = resp
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 405:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = UPDATE_PET_WITH_FORM_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        return decoder(response)
 
     def uploadFile(
         self,
@@ -1454,7 +2760,7 @@ class Client:
         path_params: UploadFilePathParams | dict[str, Any],
         query_params: UploadFileQueryParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: bytes | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -1480,7 +2786,7 @@ class Client:
         else:
             params = query_params
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1499,51 +2805,53 @@ class Client:
             json = None
 
         try:
-            response = self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = self._request(
+                "uploadFile",
+                method,
+                url,
+                path,
+                "/pet/:petId/uploadImage",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/pet/:petId/uploadImage"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("uploadFile", method, path, "/pet/:petId/uploadImage", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/pet/:petId/uploadImage"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+            self._report_request_success("uploadFile", method, path, "/pet/:petId/uploadImage", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return ApiResponse.model_validate(response.json())
+        decoder = UPLOAD_FILE_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
 
     def placeOrder(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: Order | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -1563,7 +2871,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1582,62 +2890,57 @@ class Client:
             json = None
 
         try:
-            response = self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = self._request(
+                "placeOrder",
+                method,
+                url,
+                path,
+                "/store/order",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/store/order"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("placeOrder", method, path, "/store/order", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/store/order"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
+            self._report_request_success("placeOrder", method, path, "/store/order", response)
 
-        if response.status_code == 200:
-            return Order.model_validate(response.json())
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 405:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = PLACE_ORDER_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        return decoder(response)
 
     def createUser(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: User | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -1657,7 +2960,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1676,48 +2979,53 @@ class Client:
             json = None
 
         try:
-            response = self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = self._request(
+                "createUser",
+                method,
+                url,
+                path,
+                "/user",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/user"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("createUser", method, path, "/user", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/user"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+            self._report_request_success("createUser", method, path, "/user", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
+        decoder = CREATE_USER_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
+
     def createUsersWithListInput(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: list[User] | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -1737,7 +3045,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1756,51 +3064,53 @@ class Client:
             json = None
 
         try:
-            response = self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = self._request(
+                "createUsersWithListInput",
+                method,
+                url,
+                path,
+                "/user/createWithList",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/user/createWithList"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("createUsersWithListInput", method, path, "/user/createWithList", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/user/createWithList"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+            self._report_request_success("createUsersWithListInput", method, path, "/user/createWithList", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return User.model_validate(response.json())
+        decoder = CREATE_USERS_WITH_LIST_INPUT_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
 
     def updatePet(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: Pet | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -1820,7 +3130,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1839,85 +3149,58 @@ class Client:
             json = None
 
         try:
-            response = self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = self._request(
+                "updatePet",
+                method,
+                url,
+                path,
+                "/pet",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/pet"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("updatePet", method, path, "/pet", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/pet"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+            self._report_request_success("updatePet", method, path, "/pet", response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
-
-        if response.status_code == 200:
-            return Pet.model_validate(response.json())
-
-        if response.status_code == 400:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
-
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
-
-            return EmptyBody(status_code=response.status_code, text=response.text)
-
-        if response.status_code == 404:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
-
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
-
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 405:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = UPDATE_PET_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        return decoder(response)
 
     def updateUser(
         self,
         *,
         path_params: UpdateUserPathParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: User | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -1940,7 +3223,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1959,49 +3242,54 @@ class Client:
             json = None
 
         try:
-            response = self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = self._request(
+                "updateUser",
+                method,
+                url,
+                path,
+                "/user/:username",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/user/:username"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("updateUser", method, path, "/user/:username", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/user/:username"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+            self._report_request_success("updateUser", method, path, "/user/:username", response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
+        decoder = UPDATE_USER_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
+
     def deletePet(
         self,
         *,
         path_params: DeletePetPathParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         headers: DeletePetHeaders | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> EmptyBody | None:
@@ -2023,7 +3311,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if isinstance(headers, DeletePetHeaders):
             headers_ = headers.model_dump(by_alias=True, exclude_none=True)
@@ -2038,58 +3326,57 @@ class Client:
             auth_ = (auth.username, auth.password)
 
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            response = self._request(
+                "deletePet",
+                method,
+                url,
+                path,
+                "/pet/:petId",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/pet/:petId"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("deletePet", method, path, "/pet/:petId", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/pet/:petId"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+            self._report_request_success("deletePet", method, path, "/pet/:petId", response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 400:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = DELETE_PET_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        return decoder(response)
 
     def deleteOrder(
         self,
         *,
         path_params: DeleteOrderPathParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> EmptyBody | None:
         """
@@ -2110,7 +3397,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2120,69 +3407,57 @@ class Client:
             auth_ = (auth.username, auth.password)
 
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            response = self._request(
+                "deleteOrder",
+                method,
+                url,
+                path,
+                "/store/order/:orderId",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/store/order/:orderId"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("deleteOrder", method, path, "/store/order/:orderId", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/store/order/:orderId"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+            self._report_request_success("deleteOrder", method, path, "/store/order/:orderId", response)
 
-        if meta:
-            meta.request = req
-            meta.response = resp
-
-        if response.status_code == 400:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
-
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
-
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 404:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = DELETE_ORDER_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        return decoder(response)
 
     def deleteUser(
         self,
         *,
         path_params: DeleteUserPathParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> EmptyBody | None:
         """
@@ -2203,7 +3478,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2213,65 +3488,349 @@ class Client:
             auth_ = (auth.username, auth.password)
 
         try:
-            response = self.client.request(method, url, headers=headers_, params=params, content=content, auth=auth_)
+            response = self._request(
+                "deleteUser",
+                method,
+                url,
+                path,
+                "/user/:username",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/user/:username"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("deleteUser", method, path, "/user/:username", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/user/:username"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+            self._report_request_success("deleteUser", method, path, "/user/:username", response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if meta:
-            meta.request = req
-            meta.response = resp
+        decoder = DELETE_USER_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-        if response.status_code == 400:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        return decoder(response)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+    def close(self) -> None:
+        self.client.close()
 
-        if response.status_code == 404:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+    def map(
+        self,
+        operation: str | Callable[..., Any],
+        calls: Iterable[dict[str, Any]],
+        *,
+        concurrency: int = 10,
+        ordered: bool = True,
+        on_progress: Callable[[MapProgress], Any] | None = None,
+    ) -> Iterator[MapResult]:
+        """Call the operation with every kwargs of the calls, `concurrency` calls at a time
+
+        The calls are made by a pool of threads, which share the connection pool of the client.
+        Results are returned in the order of the calls, or as the calls complete if not `ordered`.
+        Exceptions of the calls are returned in MapResult.error. `on_progress` is called when a call completes.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency of map must be at least 1, got {concurrency}")
+        return self._map(operation, calls, concurrency, ordered, on_progress)
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+    def _map(
+        self,
+        operation: str | Callable[..., Any],
+        calls: Iterable[dict[str, Any]],
+        concurrency: int,
+        ordered: bool,
+        on_progress: Callable[[MapProgress], Any] | None,
+    ) -> Iterator[MapResult]:
+        method = getattr(self, operation) if isinstance(operation, str) else operation
+        results = _MapResults(MapProgress(len(calls) if isinstance(calls, Sized) else None), on_progress, ordered)
+
+        def call(index: int, kwargs: dict[str, Any]) -> MapResult:
+            try:
+                return MapResult(index, kwargs, result=method(**kwargs))
+            except Exception as exc:
+                return MapResult(index, kwargs, error=exc)
 
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        indexed_calls = enumerate(calls)
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"{self.client_name}-map")
+        pending: set[Future] = set()
+        try:
+            while True:
+                # results that complete ahead of a slow call wait for it in ordered mode, no calls are started
+                # while `concurrency` of them are waiting, so that they don't pile up
+                if results.waiting < concurrency:
+                    for index, kwargs in indexed_calls:
+                        pending.add(executor.submit(call, index, kwargs))
+                        if len(pending) >= concurrency:
+                            break
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from results.add(future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _request(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send the request of the operation, all the methods of the operations send requests through it"""
+        return self._send_cacheable(fn_name, method, url, path, path_template, kwargs)
+
+    def _send_cacheable(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send the request through the response cache"""
+        if self.response_cache is not None and fn_name in self._cached_operations and _is_shareable_request(kwargs):
+            return self._send_cached(fn_name, method, url, path, path_template, kwargs)
+        return self._send_retried(fn_name, method, url, path, path_template, kwargs)
+
+    def _send_cached(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Return the cached response if it's fresh, revalidate it if it's stale
+
+        A new response is stored in the cache when it's decoded, see _decoded.
+        """
+        key = _request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+        entry = self.response_cache.get(key)
+        if entry is not None and entry.is_fresh():
+            self._report_cache_lookup(method, path, path_template, "hit")
+            return entry.to_response(
+                method, url, _CachedResponse(self.response_cache, key, entry, without_request=True)
+            )
 
-    def close(self) -> None:
-        self.client.close()
+        if entry is not None:
+            kwargs = {**kwargs, "headers": {**(kwargs.get("headers") or {}), **entry.validators()}}
+        response = self._send_retried(fn_name, method, url, path, path_template, kwargs)
+        if entry is not None and response.status_code == 304:
+            entry.revalidate(response)
+            self.response_cache.set(key, entry)
+            self._report_cache_lookup(method, path, path_template, "revalidated")
+            cached_response = entry.to_response(method, url, _CachedResponse(self.response_cache, key, entry))
+            cached_response.elapsed = response.elapsed
+            return cached_response
+
+        self._report_cache_lookup(method, path, path_template, "miss")
+        new_entry = CacheEntry.from_response(response)
+        if new_entry is not None:
+            response.extensions[RESULT_EXTENSION] = _CachedResponse(self.response_cache, key, new_entry)
+        return response
+
+    def _report_cache_lookup(self, method: str, path: str, path_template: str, result: str) -> None:
+        on_cache_lookup = getattr(self.metrics_integration, "on_cache_lookup", None)
+        if on_cache_lookup is not None:
+            on_cache_lookup(self.client_name, method, self._metrics_path(path, path_template), result)
+
+    def _send_retried(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send the request, retry it by the retry policy if the operation is idempotent"""
+        if (
+            self.retry_policy is None
+            or fn_name not in self._retried_operations
+            or not _is_replayable(kwargs.get("content"), kwargs.get("files"))
+        ):
+            return self._send_limited(fn_name, method, url, path, path_template, kwargs)
+
+        self.retry_budget.deposit()
+        retry = 1
+        while True:
+            try:
+                response = self._send_limited(fn_name, method, url, path, path_template, kwargs)
+            except self.retry_policy.exceptions as exc:
+                delay = self._retry_delay(retry, None)
+                if delay is None:
+                    raise
+                reason = exc.__class__.__name__
+            else:
+                if response.status_code not in self.retry_policy.status_codes:
+                    return response
+                delay = self._retry_delay(retry, response)
+                if delay is None:
+                    return response
+                reason = str(response.status_code)
+
+            on_request_retry = getattr(self.metrics_integration, "on_request_retry", None)
+            if on_request_retry is not None:
+                on_request_retry(self.client_name, method, self._metrics_path(path, path_template), reason, delay)
+            time.sleep(delay)
+            retry += 1
+
+    def _retry_delay(self, retry: int, response: httpx.Response | None) -> float | None:
+        """Seconds to wait before the retry, None if the request is not retried"""
+        delay = self.retry_policy.delay(retry, response)
+        if delay is None or not self.retry_budget.withdraw():
+            return None
+        return delay
+
+    def _send_limited(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send the request when the rate limiters of the client and of the operation let it through
+
+        The limiters follow the quota of the server from the rate limit headers of the response.
+        """
+        limiters = self._wait_rate_limiters(fn_name, method, path, path_template)
+        response = self._send(fn_name, method, url, path, path_template, kwargs)
+        if limiters:
+            _update_rate_limiters(limiters, response)
+        return response
+
+    def _wait_rate_limiters(self, fn_name: str, method: str, path: str, path_template: str) -> list[TokenBucket]:
+        """Wait until the rate limiters of the client and of the operation let the request through, return the limiters"""
+        limiters = [limiter for limiter in (self.rate_limiter, self._rate_limiters.get(fn_name)) if limiter is not None]
+        if not limiters:
+            return limiters
+
+        delay = max(limiter.reserve() for limiter in limiters)
+        if delay > 0:
+            on_request_throttled = getattr(self.metrics_integration, "on_request_throttled", None)
+            if on_request_throttled is not None:
+                on_request_throttled(self.client_name, method, self._metrics_path(path, path_template), delay)
+            time.sleep(delay)
+        return limiters
+
+    def _send(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send the request through the circuit breaker of the operation or the host"""
+        if self.circuit_breaker_policy is None:
+            return self._send_counted(fn_name, method, url, path, path_template, kwargs)
+
+        circuit_breaker = self._circuit_breaker(fn_name, url)
+        trial = circuit_breaker.before_call()
+        try:
+            response = self._send_counted(fn_name, method, url, path, path_template, kwargs)
+        except Exception:
+            circuit_breaker.record(trial, failed=True)
+            raise
+        except BaseException:
+            circuit_breaker.release(trial)  # cancelled, the result is unknown
+            raise
+        circuit_breaker.record(trial, failed=response.status_code in self.circuit_breaker_policy.failure_status_codes)
+        return response
+
+    def _send_counted(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send the request, counted by the in-flight metric of the operation
+
+        Calls answered by the response cache don't get here.
+        """
+        operation_metrics = self._operation_metrics.get(fn_name)
+        if operation_metrics is None:
+            return self.client.request(method, url, **kwargs)
+
+        operation_metrics.on_request_start()
+        try:
+            return self.client.request(method, url, **kwargs)
+        finally:
+            operation_metrics.on_request_end()
+
+    @contextmanager
+    def _stream(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, **kwargs: Any
+    ) -> Iterator[httpx.Response]:
+        """Stream the response of the operation through the rate limiters and the circuit breaker,
+        like _send_limited and _send do
+
+        The call is recorded when the status code is received, errors while reading the body are not failures of the call.
+        """
+        limiters = self._wait_rate_limiters(fn_name, method, path, path_template)
+        if self.circuit_breaker_policy is None:
+            with self.client.stream(method, url, **kwargs) as response:
+                if limiters:
+                    _update_rate_limiters(limiters, response)
+                yield response
+            return
+
+        circuit_breaker = self._circuit_breaker(fn_name, url)
+        trial = circuit_breaker.before_call()
+        recorded = False
+        try:
+            with self.client.stream(method, url, **kwargs) as response:
+                circuit_breaker.record(
+                    trial, failed=response.status_code in self.circuit_breaker_policy.failure_status_codes
+                )
+                recorded = True
+                if limiters:
+                    _update_rate_limiters(limiters, response)
+                yield response
+        except Exception:
+            if not recorded:
+                circuit_breaker.record(trial, failed=True)
+            raise
+        except BaseException:
+            if not recorded:
+                circuit_breaker.release(trial)  # cancelled, the result is unknown
+            raise
+
+    def _circuit_breaker(self, fn_name: str, url: str) -> CircuitBreaker:
+        if self.circuit_breaker_policy.key == "host":
+            circuit = urlsplit(url).netloc
+        else:
+            circuit = fn_name
+        circuit_breaker = self._circuit_breakers.get(circuit)
+        if circuit_breaker is None:
+            circuit_breaker = self._circuit_breakers.setdefault(
+                circuit, CircuitBreaker(circuit, self.circuit_breaker_policy, self._on_circuit_state_change)
+            )
+        return circuit_breaker
+
+    def _on_circuit_state_change(self, circuit: str, state: CircuitState) -> None:
+        on_circuit_state_change = getattr(self.metrics_integration, "on_circuit_state_change", None)
+        if on_circuit_state_change is not None:
+            on_circuit_state_change(self.client_name, circuit, state.value)
+        log_circuit_state_change = getattr(self.logs_integration, "log_circuit_state_change", None)
+        if log_circuit_state_change is not None:
+            log_circuit_state_change(self.client_name, circuit, state.value)
+
+    def _metrics_path(self, path: str, path_template: str) -> str:
+        if self._shadow_path:
+            return path_template
+        return path
+
+    def _report_request_success(
+        self, fn_name: str, method: str, path: str, path_template: str, response: httpx.Response
+    ) -> None:
+        operation_metrics = self._operation_metrics.get(fn_name)
+        if operation_metrics is not None:
+            operation_metrics.on_request_success(response)
+        else:
+            self.metrics_integration.on_request_success(
+                self.client_name, response, method, self._metrics_path(path, path_template)
+            )
+
+    def _report_request_error(self, fn_name: str, method: str, path: str, path_template: str, error: Exception) -> None:
+        operation_metrics = self._operation_metrics.get(fn_name)
+        if operation_metrics is not None:
+            operation_metrics.on_request_error(error)
+        else:
+            self.metrics_integration.on_request_error(
+                self.client_name, error, method, self._metrics_path(path, path_template)
+            )
 
     def _get_url(self, path: str) -> str:
         return f"{self.base_url}{path}"
@@ -2300,51 +3859,4 @@ class Client:
         )
 
     def _parse_any_of(self, item: dict[str, Any], schema_classes: list[Any]) -> Any:
-        for schema_class in schema_classes:
-            try:
-                return schema_class.model_validate(item)
-            except:
-                continue
-
-        raise Exception('Can\'t parse "{item}"')
-
-
-if hasattr(CreateuserswithlistinputRequestBody, "model_rebuild"):
-    CreateuserswithlistinputRequestBody.model_rebuild()
-
-
-if hasattr(FindpetsbytagsResponse200, "model_rebuild"):
-    FindpetsbytagsResponse200.model_rebuild()
-
-if hasattr(FindpetsbystatusResponse200, "model_rebuild"):
-    FindpetsbystatusResponse200.model_rebuild()
-
-if hasattr(AddpetortagRequestBody, "model_rebuild"):
-    AddpetortagRequestBody.model_rebuild()
-
-if hasattr(AddpetortagResponse200, "model_rebuild"):
-    AddpetortagResponse200.model_rebuild()
-
-if hasattr(ApiResponse, "model_rebuild"):
-    ApiResponse.model_rebuild()
-
-if hasattr(Tag, "model_rebuild"):
-    Tag.model_rebuild()
-
-if hasattr(Category, "model_rebuild"):
-    Category.model_rebuild()
-
-if hasattr(Pet, "model_rebuild"):
-    Pet.model_rebuild()
-
-if hasattr(User, "model_rebuild"):
-    User.model_rebuild()
-
-if hasattr(Address, "model_rebuild"):
-    Address.model_rebuild()
-
-if hasattr(Customer, "model_rebuild"):
-    Customer.model_rebuild()
-
-if hasattr(Order, "model_rebuild"):
-    Order.model_rebuild()
+        return _parse_any_of(item, schema_classes)
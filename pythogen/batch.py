@@ -0,0 +1,199 @@
+"""
+Batch mode: generate many clients in one run.
+
+Jobs are described in a manifest (YAML or TOML) and are distributed
+over a pool of worker processes. Every worker imports the generator,
+the templates and the formatters only once and reuses them for all
+of its jobs.
+
+Example of manifest
+-------------------
+```
+defaults:
+  cache_dir: .pythogen-cache
+jobs:
+  - input: specs/petstore.yaml
+    output: clients/petstore_async.py
+  - input: specs/petstore.yaml
+    output: clients/petstore_sync.py
+    name: PetstoreClient
+    sync: true
+```
+Relative paths are resolved against the directory of the manifest.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Optional
+
+import typer
+import yaml
+
+from pythogen import console
+from pythogen import exceptions
+from pythogen import generator
+from pythogen import renderer
+
+
+JOB_OPTIONS = (
+    "name",
+    "sync",
+    "package_version",
+    "package_authors",
+    "metrics",
+    "headers",
+    "defer_build",
+    "cache_dir",
+    "validation",
+    "format",
+    "layout",
+)
+PATH_OPTIONS = ("input", "output", "cache_dir")
+
+
+@dataclass
+class Job:
+    input: str
+    output: str
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class JobResult:
+    job: Job
+    seconds: float
+    result: generator.GenerationResult | None = None
+    error: str | None = None
+
+    @property
+    def status(self) -> str:
+        if self.error is not None:
+            return "failed"
+        if self.result is not None and self.result.cache_hit:
+            return "cache hit"
+        return "generated"
+
+
+def load_manifest(manifest_path: str) -> list[Job]:
+    """Read the jobs from the manifest file"""
+    path = Path(manifest_path)
+    if path.suffix == ".toml":
+        try:
+            import tomllib
+        except ImportError as exc:  # python<3.11
+            raise Exception("TOML manifests require python>=3.11, use YAML manifest instead") from exc
+        manifest = tomllib.loads(path.read_text())
+    else:
+        manifest = yaml.load(path.read_text(), yaml.SafeLoader)
+
+    defaults: dict[str, Any] = manifest.get("defaults", {})
+    base_dir_path = path.parent
+
+    jobs: list[Job] = []
+    for i, raw_job in enumerate(manifest.get("jobs", [])):
+        raw_job = {**defaults, **raw_job}
+        if "input" not in raw_job or "output" not in raw_job:
+            raise Exception(f'Unable to parse manifest, job #{i} must contain "input" and "output" fields')
+
+        for key in PATH_OPTIONS:
+            if raw_job.get(key):
+                raw_job[key] = str(base_dir_path / raw_job[key])
+
+        unknown_options = set(raw_job) - set(JOB_OPTIONS) - set(PATH_OPTIONS)
+        if unknown_options:
+            raise Exception(f"Unable to parse manifest, job #{i} contains unknown options: {sorted(unknown_options)}")
+
+        jobs.append(
+            Job(
+                input=raw_job.pop("input"),
+                output=raw_job.pop("output"),
+                options=raw_job,
+            )
+        )
+
+    return jobs
+
+
+def run_jobs(jobs: list[Job], workers: int | None = None) -> list[JobResult]:
+    """Generate clients for all jobs
+
+    Results are returned in the order of jobs.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(jobs) or 1)
+    if workers == 1:
+        renderer.warm_up()
+        return [_run_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=renderer.warm_up) as executor:
+        return list(executor.map(_run_job, jobs))
+
+
+def _run_job(job: Job) -> JobResult:
+    started_at = time.perf_counter()
+    options = dict(job.options)
+    if "format" in options:
+        options["format_mode"] = options.pop("format")
+    try:
+        # Jobs are already spread over the worker processes, each job is formatted in its own worker
+        result = generator.generate(input=job.input, output=job.output, format_workers=1, **options)
+    except exceptions.Exit:
+        return JobResult(job=job, seconds=time.perf_counter() - started_at, error="invalid OpenAPI file")
+    except Exception as exc:
+        return JobResult(job=job, seconds=time.perf_counter() - started_at, error=f"{exc.__class__.__name__}: {exc}")
+    return JobResult(job=job, seconds=time.perf_counter() - started_at, result=result)
+
+
+def format_summary(results: list[JobResult], wall_seconds: float) -> str:
+    rows = [("output", "status", "seconds")]
+    for job_result in results:
+        rows.append((job_result.job.output, job_result.status, f"{job_result.seconds:.2f}"))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(3)]
+    lines = [f"{row[0]:<{widths[0]}}  {row[1]:<{widths[1]}}  {row[2]:>{widths[2]}}" for row in rows]
+    lines.insert(1, "-" * len(lines[0]))
+
+    jobs_seconds = sum(job_result.seconds for job_result in results)
+    lines.append("-" * len(lines[0]))
+    lines.append(f"{len(results)} jobs in {wall_seconds:.2f}s (sum of jobs {jobs_seconds:.2f}s)")
+    return "\n".join(lines)
+
+
+app = typer.Typer(pretty_exceptions_enable=False)
+
+
+@app.command()
+def main(
+    manifest: str = typer.Argument(..., help="manifest file path (YAML or TOML)"),
+    workers: Optional[int] = typer.Option(None, help="number of worker processes (default: number of CPUs)"),
+):
+    """
+    Generate many HTTP clients for python from OpenAPI in one run
+    """
+    started_at = time.perf_counter()
+    jobs = load_manifest(manifest)
+    results = run_jobs(jobs, workers=workers)
+    typer.echo(format_summary(results, wall_seconds=time.perf_counter() - started_at))
+
+    failed = [job_result for job_result in results if job_result.error is not None]
+    for job_result in failed:
+        console.print_error(
+            title="Failed to generate a client",
+            msg=job_result.error or "",
+            invalid_data=job_result.job.input,
+        )
+    if failed:
+        raise typer.Exit(code=1)
+
+
+# Used in pytroject.toml -> [tool.poetry.scripts]
+def run() -> None:
+    typer.run(main)  # pragma: no cover
+
+
+if __name__ == "__main__":
+    app()
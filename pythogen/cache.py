@@ -0,0 +1,186 @@
+"""
+Content-addressed cache of generated clients.
+
+The key of an entry is a hash of everything that affects the generated code:
+the bytes of the OpenAPI file, the generation options, the pythogen version
+and the contents of the j2-templates. If nothing of that has changed since
+the previous run, the client is taken from the cache and the whole
+validate/parse/render/format pipeline is skipped.
+
+Results of the OpenAPI validation are cached separately, by the hash
+of the OpenAPI file only, and so are the formatted chunks of code: after
+a small change of the OpenAPI file only the changed chunks are formatted.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from typing import Iterator
+from typing import MutableMapping
+
+from pythogen import settings
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    # Path relative to the output -> content, the empty path is the output file itself
+    files: dict[str, str]
+    generation_seconds: float
+
+
+@lru_cache(maxsize=1)
+def templates_digest() -> str:
+    """Hash of all j2-templates shipped with pythogen"""
+    digest = hashlib.sha256()
+    for templates_dir_path in (settings.HTTP_CLIENT_TEMPLATES_DIR_PATH, settings.HTTP_PACKAGE_TEMPLATES_DIR_PATH):
+        for template_path in sorted(templates_dir_path.rglob("*.j2")):
+            digest.update(str(template_path.relative_to(settings.CURRENT_DIR_PATH)).encode())
+            digest.update(template_path.read_bytes())
+    return digest.hexdigest()
+
+
+def make_key(spec: bytes, options: dict[str, Any], pythogen_version: str) -> str:
+    """Build a cache key
+
+    Arguments
+    ---------
+    spec
+        Raw content of the OpenAPI file
+    options
+        Generation options that affect the generated code (client name, sync, metrics, ...)
+    pythogen_version
+        Version of the generator
+    """
+    digest = hashlib.sha256()
+    digest.update(hashlib.sha256(spec).digest())
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+    digest.update(pythogen_version.encode())
+    digest.update(templates_digest().encode())
+    return digest.hexdigest()
+
+
+class GenerationCache:
+    """
+    Stores generated clients on disk, one file per cache key.
+    """
+
+    def __init__(self, cache_dir: str | os.PathLike) -> None:
+        self._clients_dir_path = Path(cache_dir) / "clients"
+
+    def get(self, key: str) -> CacheEntry | None:
+        try:
+            entry = json.loads((self._clients_dir_path / f"{key}.json").read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        return CacheEntry(key=key, files=entry["files"], generation_seconds=entry.get("generation_seconds", 0.0))
+
+    def put(self, key: str, files: dict[str, str], generation_seconds: float) -> None:
+        self._clients_dir_path.mkdir(parents=True, exist_ok=True)
+        _atomic_write(
+            self._clients_dir_path / f"{key}.json",
+            json.dumps({"generation_seconds": generation_seconds, "files": files}),
+        )
+
+
+class ValidationCache:
+    """
+    Remembers OpenAPI files that have already passed the validation.
+    """
+
+    def __init__(self, cache_dir: str | os.PathLike, validator_version: str) -> None:
+        self._validation_dir_path = Path(cache_dir) / "validation"
+        self._validator_version = validator_version
+
+    def is_valid(self, spec: bytes) -> bool:
+        return self._marker_path(spec).exists()
+
+    def mark_valid(self, spec: bytes) -> None:
+        self._validation_dir_path.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self._marker_path(spec), "")
+
+    def _marker_path(self, spec: bytes) -> Path:
+        digest = hashlib.sha256(spec)
+        digest.update(self._validator_version.encode())
+        return self._validation_dir_path / digest.hexdigest()
+
+
+class FormattedChunksCache(MutableMapping[str, str]):
+    """
+    Formatted chunks of code on disk, keyed by the hash of the unformatted chunk.
+    """
+
+    def __init__(self, cache_dir: str | os.PathLike, formatter_version: str) -> None:
+        self._chunks_dir_path = Path(cache_dir) / "chunks"
+        self._formatter_version = formatter_version
+
+    def __getitem__(self, chunk: str) -> str:
+        try:
+            return self._chunk_path(chunk).read_text()
+        except FileNotFoundError:
+            raise KeyError(chunk) from None
+
+    def __setitem__(self, chunk: str, formatted_chunk: str) -> None:
+        self._chunks_dir_path.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self._chunk_path(chunk), formatted_chunk)
+
+    def __delitem__(self, chunk: str) -> None:
+        try:
+            self._chunk_path(chunk).unlink()
+        except FileNotFoundError:
+            raise KeyError(chunk) from None
+
+    def __iter__(self) -> Iterator[str]:
+        # Only hashes of the chunks are stored, the chunks themselves can't be listed
+        return iter(())
+
+    def __len__(self) -> int:
+        return sum(1 for path in self._chunks_dir_path.glob("*") if not path.name.startswith("."))
+
+    def _chunk_path(self, chunk: str) -> Path:
+        digest = hashlib.sha256(chunk.encode())
+        digest.update(self._formatter_version.encode())
+        return self._chunks_dir_path / digest.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """User-wide cache directory, used when --cache-dir is not set"""
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base_dir_path = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base_dir_path / "pythogen"
+
+
+def write_if_changed(output_path: str, content: str) -> bool:
+    """Write the content to the file, unless the file already contains exactly this content
+
+    Returns True if the file was written.
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(output_path) as output_file:
+            if output_file.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    with open(output_path, "w") as output_file:
+        output_file.write(content)
+    return True
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    # Several pythogen processes may share one cache directory,
+    # so a half-written entry must never be visible to the readers.
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
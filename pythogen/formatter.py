@@ -0,0 +1,238 @@
+"""
+Formatting of the rendered client code (black, isort, autoflake).
+
+Black is the slowest step, so the module is split into independent
+chunks (enums, models, params classes, methods of the client, ...)
+that are formatted in parallel, and already formatted chunks are taken
+from the cache. Formatting every chunk separately and joining them with
+the blank lines black would put between them gives the same result as
+formatting the whole module at once.
+"""
+
+import ast
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import MutableMapping
+
+import autoflake
+import black
+import isort
+
+from pythogen import profiler
+
+
+LINE_LENGTH = 120
+DEFINITIONS = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Below this number of chunks to format, starting worker processes costs more than it saves
+MIN_CHUNKS_FOR_PARALLEL_FORMATTING = 32
+
+
+class FormatMode(str, Enum):
+    none = "none"  # keep the code as it is rendered from the templates
+    fast = "fast"  # black + isort, unused imports are kept
+    full = "full"  # black + isort + autoflake
+
+
+def format_code(
+    code: str,
+    mode: FormatMode = FormatMode.full,
+    workers: int | None = None,
+    chunks_cache: MutableMapping[str, str] | None = None,
+) -> str:
+    """Format the code of the generated client
+
+    Arguments
+    ---------
+    code
+        Rendered code
+    mode
+        What formatters to apply
+    workers
+        Number of processes formatting chunks in parallel (default: number of CPUs)
+    chunks_cache
+        Mapping "chunk of code -> formatted chunk of code", reused between calls
+    """
+    return format_files({"": code}, mode=mode, workers=workers, chunks_cache=chunks_cache)[""]
+
+
+def format_files(
+    files: dict[str, str],
+    mode: FormatMode = FormatMode.full,
+    workers: int | None = None,
+    chunks_cache: MutableMapping[str, str] | None = None,
+) -> dict[str, str]:
+    """Format several modules at once (e.g. modules of the generated package)
+
+    Chunks of all modules share one pool of processes. Arguments are the same as of format_code.
+    """
+    mode = FormatMode(mode)
+    if mode is FormatMode.none:
+        return dict(files)
+
+    with profiler.phase("black", pstats_name="format"):
+        chunks_of_files = {path: split_into_chunks(code) for path, code in files.items()}
+        formatted_chunks = format_chunks(
+            [chunk for chunks in chunks_of_files.values() for chunk in chunks],
+            workers=workers,
+            chunks_cache=chunks_cache,
+        )
+
+    formatted_files: dict[str, str] = {}
+    for path, chunks in chunks_of_files.items():
+        code = join_chunks(chunks, formatted_chunks)
+        if mode is FormatMode.full:
+            with profiler.phase("autoflake", pstats_name="format"):
+                code = autoflake.fix_code(
+                    code,
+                    remove_all_unused_imports=True,
+                )
+        with profiler.phase("isort", pstats_name="format"):
+            code = isort.code(
+                code,
+                force_grid_wrap=2,
+                lines_after_imports=2,
+                force_single_line=True,
+                line_length=LINE_LENGTH,
+            )
+        formatted_files[path] = code
+    return formatted_files
+
+
+@dataclass(frozen=True)
+class Chunk:
+    code: str
+    # Methods are formatted as top-level functions and indented back afterwards
+    indent: int = 0
+    # Blank lines between the previous chunk and this one
+    separator: str = "\n\n"
+
+
+def split_into_chunks(code: str) -> list[Chunk]:
+    """Split the module into independently formattable chunks
+
+    Every class and function definition (with its decorators and the comments
+    right above it) is a separate chunk, consecutive top-level statements
+    of other kinds are grouped together. Methods of classes, except the first
+    one, are separate chunks too.
+    """
+    lines = code.splitlines(keepends=True)
+    tree = ast.parse(code)
+
+    nodes: list[ast.stmt] = []
+    previous_is_definition = True
+    for node in tree.body:
+        is_definition = isinstance(node, DEFINITIONS)
+        if is_definition or previous_is_definition:
+            nodes.append(node)
+        previous_is_definition = is_definition
+
+    if not nodes:
+        return [Chunk(code=code)]
+
+    boundaries = [_start_line(lines, node) for node in nodes]
+    boundaries[0] = 0
+    boundaries.append(len(lines))
+
+    chunks: list[Chunk] = []
+    for node, start, end in zip(nodes, boundaries, boundaries[1:]):
+        if isinstance(node, ast.ClassDef):
+            chunks.extend(_split_class(lines, node, start, end))
+        else:
+            chunks.append(Chunk(code="".join(lines[start:end])))
+    return chunks
+
+
+def _split_class(lines: list[str], node: ast.ClassDef, start: int, end: int) -> list[Chunk]:
+    methods = [member for member in node.body if isinstance(member, DEFINITIONS)]
+    boundaries = [_start_line(lines, method) for method in methods[1:]]
+    method_lines = lines[boundaries[0] : end] if boundaries else []
+    if not boundaries or not all(line.startswith(" " * 4) or not line.strip() for line in method_lines):
+        return [Chunk(code="".join(lines[start:end]))]
+
+    # A split-off method is formatted as a top-level function, after which black puts 2 blank lines instead of 1,
+    # so a class with comments or statements after a method is formatted whole
+    method_ends = [*boundaries[1:], end]
+    if any(
+        line.strip()
+        for method, method_end in zip(methods[1:], method_ends)
+        for line in lines[method.end_lineno : method_end]
+    ):
+        return [Chunk(code="".join(lines[start:end]))]
+
+    # The class statement goes together with the first method, so that the chunk is a valid class
+    chunks = [Chunk(code="".join(lines[start : boundaries[0]]))]
+    for method_start, method_end in zip(boundaries, method_ends):
+        chunks.append(
+            Chunk(
+                code="".join(line[4:] if line.strip() else line for line in lines[method_start:method_end]),
+                indent=4,
+                separator="\n",
+            )
+        )
+    return chunks
+
+
+def _start_line(lines: list[str], node: ast.stmt) -> int:
+    """Index of the first line of the statement, including decorators and comments above it"""
+    start = min([node.lineno, *(decorator.lineno for decorator in getattr(node, "decorator_list", []))]) - 1
+    indent = " " * node.col_offset
+    while start > 0 and lines[start - 1].startswith(f"{indent}#"):
+        start -= 1
+    return start
+
+
+def format_chunks(
+    chunks: list[Chunk],
+    workers: int | None = None,
+    chunks_cache: MutableMapping[str, str] | None = None,
+) -> dict[Chunk, str]:
+    """Format chunks, every distinct chunk is formatted once"""
+    if chunks_cache is None:
+        chunks_cache = {}
+
+    formatted: dict[Chunk, str] = {}
+    to_format: list[Chunk] = []
+    for chunk in chunks:
+        if chunk in formatted:
+            continue
+        cached = chunks_cache.get(_cache_key(chunk))
+        if cached is not None:
+            formatted[chunk] = cached
+        else:
+            formatted[chunk] = ""
+            to_format.append(chunk)
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(to_format) >= MIN_CHUNKS_FOR_PARALLEL_FORMATTING:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(format_chunk, to_format, chunksize=max(1, len(to_format) // (workers * 4))))
+    else:
+        results = [format_chunk(chunk) for chunk in to_format]
+
+    for chunk, formatted_chunk in zip(to_format, results):
+        formatted[chunk] = formatted_chunk
+        chunks_cache[_cache_key(chunk)] = formatted_chunk
+
+    return formatted
+
+
+def join_chunks(chunks: list[Chunk], formatted_chunks: dict[Chunk, str]) -> str:
+    code = formatted_chunks[chunks[0]]
+    for chunk in chunks[1:]:
+        code += chunk.separator + formatted_chunks[chunk]
+    return code
+
+
+def format_chunk(chunk: Chunk) -> str:
+    code = black.format_str(chunk.code, mode=black.Mode(line_length=LINE_LENGTH - chunk.indent))
+    if chunk.indent:
+        indent = " " * chunk.indent
+        code = "".join(indent + line if line.strip() else line for line in code.splitlines(keepends=True))
+    return code
+
+
+def _cache_key(chunk: Chunk) -> str:
+    return f"{chunk.indent}:{chunk.code}"
@@ -0,0 +1,170 @@
+"""
+Generation pipeline: OpenAPI file -> validation -> parsing -> rendering.
+
+Shared by the CLI entrypoint and by the batch mode.
+"""
+
+import time
+from dataclasses import dataclass
+from enum import Enum
+from importlib import metadata
+from pathlib import Path
+
+from openapi_spec_validator import validate
+
+from pythogen import cache
+from pythogen import formatter
+from pythogen import packager
+from pythogen import profiler
+from pythogen import renderer
+from pythogen.parsers.document import load_openapi_file
+from pythogen.parsers.document import parse_openapi_file
+
+
+class ValidationMode(str, Enum):
+    full = "full"  # validate the OpenAPI file on every run
+    cached = "cached"  # validate only OpenAPI files that haven't passed the validation before
+    off = "off"  # trust the OpenAPI file, only the structural checks of the parsers are performed
+
+
+@dataclass
+class GenerationResult:
+    output_path: str
+    seconds: float
+    cache_hit: bool | None = None  # None if the cache is not used
+    written: bool = True
+    cached_generation_seconds: float | None = None
+
+
+def generate(
+    *,
+    input: str,
+    output: str,
+    name: str = "Client",
+    sync: bool = False,
+    package_version: str | None = None,
+    package_authors: str | None = None,
+    metrics: bool = False,
+    headers: str | None = None,
+    defer_build: bool = False,
+    cache_dir: str | None = None,
+    validation: ValidationMode = ValidationMode.full,
+    format_mode: formatter.FormatMode = formatter.FormatMode.full,
+    format_workers: int | None = None,
+    layout: renderer.Layout = renderer.Layout.module,
+) -> GenerationResult:
+    """Generate a client from the OpenAPI file
+
+    Raises exceptions.Exit if the OpenAPI file can't be turned into a client,
+    the reason is printed to stderr.
+    """
+    started_at = time.perf_counter()
+    pythogen_version: str = metadata.version("pythogen")
+    layout = renderer.Layout(layout)
+
+    with profiler.phase("spec load"):
+        spec = Path(input).read_bytes()
+
+    generation_cache: cache.GenerationCache | None = None
+    cache_entry: cache.CacheEntry | None = None
+    cache_key: str | None = None
+    if cache_dir:
+        generation_cache = cache.GenerationCache(cache_dir)
+        cache_key = cache.make_key(
+            spec=spec,
+            options={
+                "name": name,
+                "sync": sync,
+                "metrics": metrics,
+                "headers": headers,
+                "defer_build": defer_build,
+                "format": formatter.FormatMode(format_mode).value,
+                "layout": layout.value,
+            },
+            pythogen_version=pythogen_version,
+        )
+        with profiler.phase("cache lookup"):
+            cache_entry = generation_cache.get(cache_key)
+
+    if cache_entry is None:
+        with profiler.phase("spec load"):
+            spec_dict = load_openapi_file(input, content=spec)
+        with profiler.phase("validation"):
+            _validate(spec, spec_dict, ValidationMode(validation), cache_dir)
+
+    if package_version:
+        resp = packager.init_package(
+            output_path=output,
+            client_class_name=name,
+            package_version=package_version,
+            package_authors=package_authors,
+        )
+        output = resp.client_output_path
+        if layout is renderer.Layout.package:
+            output = str(Path(output).parent)
+
+    if cache_entry is not None:
+        with profiler.phase("write"):
+            written = [
+                cache.write_if_changed(str(Path(output, relative_path)), content)
+                for relative_path, content in cache_entry.files.items()
+            ]
+        return GenerationResult(
+            output_path=output,
+            seconds=time.perf_counter() - started_at,
+            cache_hit=True,
+            written=any(written),
+            cached_generation_seconds=cache_entry.generation_seconds,
+        )
+
+    document = parse_openapi_file(spec_dict)
+
+    render = renderer.render_package if layout is renderer.Layout.package else renderer.render_client
+    rendered = render(
+        output_path=output,
+        document=document,
+        name=name,
+        sync=sync,
+        metrics=metrics,
+        required_headers=headers.split(",") if headers else None,
+        defer_build=defer_build,
+        pythogen_version=pythogen_version,
+        format_mode=format_mode,
+        format_workers=format_workers,
+        chunks_cache=_chunks_cache(cache_dir) if cache_dir else None,
+    )
+
+    elapsed = time.perf_counter() - started_at
+    if generation_cache is not None and cache_key is not None:
+        files = rendered if isinstance(rendered, dict) else {"": rendered}
+        generation_cache.put(cache_key, files, generation_seconds=elapsed)
+
+    return GenerationResult(
+        output_path=output,
+        seconds=elapsed,
+        cache_hit=False if generation_cache is not None else None,
+    )
+
+
+def _validate(spec: bytes, spec_dict: dict, mode: ValidationMode, cache_dir: str | None) -> None:
+    if mode is ValidationMode.off:
+        return
+
+    if mode is ValidationMode.full:
+        validate(spec_dict)
+        return
+
+    validation_cache = cache.ValidationCache(
+        cache_dir=cache_dir or cache.default_cache_dir(),
+        validator_version=metadata.version("openapi-spec-validator"),
+    )
+    if validation_cache.is_valid(spec):
+        return
+
+    validate(spec_dict)
+    validation_cache.mark_valid(spec)
+
+
+def _chunks_cache(cache_dir: str) -> cache.FormattedChunksCache:
+    formatter_versions = (metadata.version(package) for package in ("black", "isort", "autoflake"))
+    return cache.FormattedChunksCache(cache_dir=cache_dir, formatter_version=",".join(formatter_versions))
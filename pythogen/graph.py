@@ -0,0 +1,124 @@
+"""
+Algorithms on the dependency graph of schemas.
+
+The graph is represented as a mapping "node -> nodes it depends on".
+"""
+
+from typing import Iterable
+from typing import Mapping
+
+
+def topological_sort(nodes: Iterable[str], dependencies: Mapping[str, Iterable[str]]) -> list[str]:
+    """Order nodes so that every node goes after the nodes it depends on
+
+    Depth-first search, O(V + E). Cycles are broken at the edge that closes
+    the cycle. Nodes from `dependencies` that are not in `nodes` are ignored.
+    The order is stable: independent nodes keep the order of `nodes`.
+    """
+    nodes = list(nodes)
+    allowed = set(nodes)
+    ordered: list[str] = []
+    visited: set[str] = set()
+
+    for root in nodes:
+        if root in visited:
+            continue
+        visited.add(root)
+        # Iterative DFS: (node, iterator over its dependencies)
+        stack = [(root, iter(dependencies.get(root, ())))]
+        while stack:
+            node, node_dependencies = stack[-1]
+            for dependency in node_dependencies:
+                if dependency in allowed and dependency not in visited:
+                    visited.add(dependency)
+                    stack.append((dependency, iter(dependencies.get(dependency, ()))))
+                    break
+            else:
+                stack.pop()
+                ordered.append(node)
+
+    return ordered
+
+
+def weakly_connected_components(nodes: Iterable[str], dependencies: Mapping[str, Iterable[str]]) -> list[list[str]]:
+    """Split nodes into groups that don't refer to each other, the direction of edges is ignored
+
+    Union-find, O((V + E) * α(V)). Components go in the order of their first
+    node, nodes inside a component keep the order of `nodes`.
+    Nodes from `dependencies` that are not in `nodes` are ignored.
+    """
+    nodes = list(nodes)
+    parents = {node: node for node in nodes}
+
+    def find(node: str) -> str:
+        root = node
+        while parents[root] != root:
+            root = parents[root]
+        while parents[node] != root:  # path compression
+            parents[node], node = root, parents[node]
+        return root
+
+    for node in nodes:
+        for dependency in dependencies.get(node, ()):
+            if dependency in parents:
+                parents[find(dependency)] = find(node)
+
+    components: dict[str, list[str]] = {}
+    for node in nodes:
+        components.setdefault(find(node), []).append(node)
+    return list(components.values())
+
+
+def strongly_connected_components(nodes: Iterable[str], dependencies: Mapping[str, Iterable[str]]) -> list[list[str]]:
+    """Split nodes into groups in which every node is reachable from every other one
+
+    Tarjan's algorithm without recursion, O(V + E). Components go in the
+    topological order: a component goes after the components it depends on.
+    Nodes from `dependencies` that are not in `nodes` are ignored.
+    """
+    nodes = list(nodes)
+    allowed = set(nodes)
+    indexes: dict[str, int] = {}
+    lowlinks: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    components: list[list[str]] = []
+
+    def visit(node: str) -> None:
+        indexes[node] = lowlinks[node] = len(indexes)
+        stack.append(node)
+        on_stack.add(node)
+
+    for root in nodes:
+        if root in indexes:
+            continue
+        visit(root)
+        # Iterative DFS: (node, iterator over its dependencies)
+        work = [(root, iter(dependencies.get(root, ())))]
+        while work:
+            node, node_dependencies = work[-1]
+            for dependency in node_dependencies:
+                if dependency not in allowed:
+                    continue
+                if dependency not in indexes:
+                    visit(dependency)
+                    work.append((dependency, iter(dependencies.get(dependency, ()))))
+                    break
+                if dependency in on_stack:
+                    lowlinks[node] = min(lowlinks[node], indexes[dependency])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+                if lowlinks[node] == indexes[node]:
+                    component: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component[::-1])
+
+    return components
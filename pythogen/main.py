@@ -1,14 +1,13 @@
-from importlib import metadata
+from contextlib import nullcontext
 from typing import Optional
 
 import typer
-from openapi_spec_validator import validate
-from openapi_spec_validator.readers import read_from_filename
 
 from pythogen import exceptions
-from pythogen import packager
+from pythogen import formatter
+from pythogen import generator
+from pythogen import profiler
 from pythogen import renderer
-from pythogen.parsers.document import parse_openapi_file
 
 
 app = typer.Typer(pretty_exceptions_enable=False)
@@ -17,45 +16,73 @@ app = typer.Typer(pretty_exceptions_enable=False)
 @app.command()
 def main(
     input: str = typer.Argument(..., help="input OpenAPI file path"),
-    output: str = typer.Argument(..., help="client output file path"),
+    output: str = typer.Argument(..., help="client output file path (directory for --layout=package)"),
     name: str = typer.Option("Client", help="client class name"),
     sync: bool = typer.Option(False, help="sync client"),
     package_version: Optional[str] = typer.Option(None, help="package version"),
     package_authors: Optional[str] = typer.Option(None, help="package authors"),
     metrics: bool = typer.Option(False, help="include metrics integration"),
     headers: Optional[str] = typer.Option(None, help="required headers"),
+    defer_build: bool = typer.Option(False, help="build validators of models on the first use, not on import"),
+    cache_dir: Optional[str] = typer.Option(None, help="directory for caching generated clients"),
+    validation: generator.ValidationMode = typer.Option(
+        generator.ValidationMode.full,
+        help="validation of the OpenAPI file: full, cached (skip already validated files) or off",
+    ),
+    format_mode: formatter.FormatMode = typer.Option(
+        formatter.FormatMode.full,
+        "--format",
+        help="formatting of the generated code: full (black, isort, autoflake), fast (black, isort) or none",
+    ),
+    format_workers: Optional[int] = typer.Option(
+        None, help="number of processes formatting the code (default: number of CPUs)"
+    ),
+    layout: renderer.Layout = typer.Option(
+        renderer.Layout.module,
+        help="module (the whole client in one file) or package (models are imported lazily)",
+    ),
+    profile: Optional[str] = typer.Option(
+        None, help="directory for the time and memory profile of the generation phases (profile.json)"
+    ),
+    profile_pstats: bool = typer.Option(False, help="also write cProfile stats of the phases to the --profile dir"),
 ):
     """
     Generate HTTP clients for python from OpenAPI
     """
-    spec_dict, _ = read_from_filename(input)
-    validate(spec_dict)
-
-    if package_version:
-        resp = packager.init_package(
-            output_path=output,
-            client_class_name=name,
-            package_version=package_version,
-            package_authors=package_authors,
-        )
-        output = resp.client_output_path
-
+    generation_profile = profiler.Profiler() if profile else None
     try:
-        document = parse_openapi_file(input)
+        with profiler.activate(generation_profile) if generation_profile else nullcontext():
+            result = generator.generate(
+                input=input,
+                output=output,
+                name=name,
+                sync=sync,
+                package_version=package_version,
+                package_authors=package_authors,
+                metrics=metrics,
+                headers=headers,
+                defer_build=defer_build,
+                cache_dir=cache_dir,
+                validation=validation,
+                format_mode=format_mode,
+                format_workers=format_workers,
+                layout=layout,
+            )
     except exceptions.Exit:
         return None
 
-    pythogen_version: str = metadata.version("pythogen")
+    if result.cache_hit:
+        typer.echo(
+            f"cache hit: {result.output_path} ({'written' if result.written else 'unchanged'}, "
+            f"{result.seconds:.2f}s instead of {result.cached_generation_seconds:.2f}s)"
+        )
+    elif result.cache_hit is False:
+        typer.echo(f"cache miss: {result.output_path} (generated in {result.seconds:.2f}s)")
 
-    renderer.render_client(
-        output_path=output,
-        document=document,
-        name=name,
-        sync=sync,
-        metrics=metrics,
-        required_headers=headers.split(",") if headers else None,
-        pythogen_version=pythogen_version,
-    )
+    if generation_profile and profile:
+        typer.echo(generation_profile.format_table())
+        for path in generation_profile.dump(profile, pstats=profile_pstats):
+            typer.echo(f"profile written: {path}")
 
 
 # Used in pytroject.toml -> [tool.poetry.scripts]
@@ -9,6 +9,9 @@ import re
 from dataclasses import dataclass
 from dataclasses import field
 from enum import Enum
+from functools import cached_property
+
+from pythogen import graph
 
 
 class SafetyKeyMixin:
@@ -60,6 +63,11 @@ class HttpMethod(Enum):
     trace = "trace"
 
 
+# https://www.rfc-editor.org/rfc/rfc9110#section-9.2
+SAFE_METHODS = frozenset({HttpMethod.get, HttpMethod.head, HttpMethod.options})
+IDEMPOTENT_METHODS = SAFE_METHODS | {HttpMethod.put, HttpMethod.delete}
+
+
 class ParameterLocation(Enum):
     query = "query"
     header = "header"
@@ -254,6 +262,15 @@ class RequestBodyObject:
     are_files_required: bool
 
 
+@dataclass
+class RateLimitObject:
+    """x-rate-limit extension: `requests` per `period` seconds, in bursts of up to `burst` requests"""
+
+    requests: int | float
+    period: int | float = 1
+    burst: int | float | None = None
+
+
 @dataclass
 class OperationObject:
     """
@@ -268,6 +285,25 @@ class OperationObject:
     responses: ResponsesObject
     parameters: list[ParameterObject]
     path_str: str
+    idempotent: bool | None = None  # x-idempotent extension
+    rate_limit: RateLimitObject | None = None  # x-rate-limit extension
+
+    @property
+    def is_idempotent(self) -> bool:
+        """Can be sent again without changing the result, retried requests must be idempotent"""
+        if self.idempotent is not None:
+            return self.idempotent
+        return self.method in IDEMPOTENT_METHODS
+
+    @property
+    def is_safe(self) -> bool:
+        """Read-only, can be sent twice at the same time (hedged)"""
+        return self.method in SAFE_METHODS
+
+    @property
+    def is_cacheable(self) -> bool:
+        """Responses can be stored by a client-side cache"""
+        return self.method is HttpMethod.get
 
     @property
     def path_params(self) -> list[ParameterObject]:
@@ -324,53 +360,85 @@ class Document:
 
     discriminator_base_class_schemas: list[DiscriminatorBaseClassSchema]
 
-    def _build_sorted_schemas(self, keys: list[str], exclude_enums: bool = False):
-        sorted: list[str] = []
-        key_for_processing = set(keys)
-        while keys:
-            key = keys.pop()
-            if key in sorted:
-                index = sorted.index(key)
-            else:
-                sorted.append(key)
-                index = len(sorted) - 1
-
-            schema = self.schemas[key]
-
-            for all_of_item in schema.all_of:
-                if all_of_item.id in key_for_processing and all_of_item.id not in sorted:
-                    sorted.insert(index, all_of_item.id)
-
-            for property in schema.properties:
-                if property.schema.id in key_for_processing and property.schema.id not in sorted:
-                    sorted.insert(index, property.schema.id)
-                if property.schema.items:
-                    if isinstance(property.schema.items, list):
-                        for items in property.schema.items:
-                            if items.id in self.schemas:
-                                sorted.insert(index, items.id)
-                    elif property.schema.items.id in self.schemas:
-                        sorted.insert(index, property.schema.items.id)
-
-        sorted_schemas = []
-        for key in sorted:
-            if self.schemas[key] not in sorted_schemas:
-                sorted_schemas.append(self.schemas[key])
-
-        if exclude_enums:
-            sorted_schemas = [s for s in sorted_schemas if s.enum is None]
-
-        return sorted_schemas
-
-    @property
+    @cached_property
+    def schema_dependencies(self) -> dict[str, list[str]]:
+        """Dependency graph of schemas: schema id -> ids of schemas it refers to
+
+        Dependencies are collected from properties, array items, allOf, anyOf
+        and discriminator mappings, including the ones of nested inline schemas.
+        A schema that refers to itself is among its own dependencies.
+        """
+        return {key: self._collect_dependencies(schema) for key, schema in self.schemas.items()}
+
+    @cached_property
+    def recursive_schemas(self) -> set[str]:
+        """Ids of schemas that refer to themselves, directly or through other schemas
+
+        Strongly connected components of the dependency graph. Only models of these
+        schemas are defined before all of their dependencies and need model_rebuild().
+        """
+        recursive_schemas: set[str] = set()
+        for component in graph.strongly_connected_components(self.schemas.keys(), self.schema_dependencies):
+            if len(component) > 1 or component[0] in self.schema_dependencies[component[0]]:
+                recursive_schemas.update(component)
+        return recursive_schemas
+
+    @cached_property
+    def _topologically_sorted_schemas(self) -> list[SchemaObject]:
+        keys = graph.topological_sort(self.schemas.keys(), self.schema_dependencies)
+        return [self.schemas[key] for key in keys]
+
+    @cached_property
     def sorted_schemas(self) -> list[SchemaObject]:
-        keys = [key for key, schema in self.schemas.items() if schema.enum is None and not schema.type.is_primitive]
-        return self._build_sorted_schemas(keys, exclude_enums=True)
+        return [
+            schema
+            for schema in self._topologically_sorted_schemas
+            if schema.enum is None and not schema.type.is_primitive
+        ]
 
-    @property
+    @cached_property
     def sorted_enums(self) -> list[SchemaObject]:
-        keys = [key for key, schema in self.schemas.items() if schema.enum is not None]
-        return self._build_sorted_schemas(keys)
+        return [schema for schema in self._topologically_sorted_schemas if schema.enum is not None]
+
+    def referenced_schemas(self, schema: SchemaObject) -> list[str]:
+        """Ids of schemas of the document that are referred to by the (possibly inline) schema
+
+        A schema of the document refers to itself.
+        """
+        if schema.id in self.schemas:
+            return [schema.id]
+        return self._collect_dependencies(schema)
+
+    def _collect_dependencies(self, schema: SchemaObject) -> list[str]:
+        dependencies: dict[str, None] = {}  # ordered set
+        visited: set[int] = {id(schema)}
+        stack = list(reversed(_iter_nested_schemas(schema)))
+        while stack:
+            nested_schema = stack.pop()
+            if nested_schema.id in self.schemas:
+                dependencies[nested_schema.id] = None
+                continue
+
+            # Inline schema without its own class, its dependencies belong to the parent
+            if id(nested_schema) in visited:
+                continue
+            visited.add(id(nested_schema))
+            stack.extend(reversed(_iter_nested_schemas(nested_schema)))
+
+        return list(dependencies)
+
+
+def _iter_nested_schemas(schema: SchemaObject) -> list[SchemaObject]:
+    nested: list[SchemaObject] = [property.schema for property in schema.properties]
+    if isinstance(schema.items, list):
+        nested.extend(schema.items)
+    elif schema.items is not None:
+        nested.append(schema.items)
+    nested.extend(schema.all_of)
+    nested.extend(schema.any_of)
+    if schema.discriminator:
+        nested.extend(schema.discriminator.mapping.values())
+    return nested
 
 
 @dataclass
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import json
 import logging
+from pathlib import Path
+from typing import Any
 
 import yaml
 
+from pythogen import console
+from pythogen import exceptions
 from pythogen import models
+from pythogen import profiler
 from pythogen.parsers.inline_schemas_aggregator import InlineSchemasAggregator
+from pythogen.parsers.issues_collector import IssuesCollector
 from pythogen.parsers.operations import OperationParser
 from pythogen.parsers.parameters import ParameterParser
 from pythogen.parsers.paths import PathParser
@@ -18,7 +25,59 @@ from pythogen.parsers.schemas import SchemaParser
 logger = logging.getLogger(__name__)
 
 
-def parse_openapi_file(file_path: str) -> models.Document:
+try:
+    # libyaml-based loader is several times faster than the pure-python one
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
+
+class OpenApiYamlLoader(_SafeLoader):
+    """
+    Safe YAML loader that leaves timestamps as strings and turns keys into strings,
+    so that the loaded document is the same as the one the validator expects.
+    """
+
+    yaml_implicit_resolvers = {
+        first_char: [(tag, regexp) for tag, regexp in resolvers if tag != "tag:yaml.org,2002:timestamp"]
+        for first_char, resolvers in _SafeLoader.yaml_implicit_resolvers.items()
+    }
+
+    def construct_mapping(self, node: yaml.MappingNode, deep: bool = False) -> dict[str, Any]:
+        # YAML allows non-string keys (e.g. unquoted status codes: `200:`), JSON Schema doesn't
+        mapping = super().construct_mapping(node, deep=deep)
+        return {_string_key(key): value for key, value in mapping.items()}
+
+
+def _string_key(key: Any) -> str:
+    """The key as json.dumps writes it"""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, bool) or key is None:
+        return json.dumps(key)
+    return str(key)
+
+
+def load_openapi_file(file_path: str, content: bytes | None = None) -> dict[str, Any]:
+    """Загрузить OpenAPI-файл
+
+    Parameters
+    ----------
+    file_path
+        Путь до OpenAPI-файла (JSON или YAML).
+    content
+        Уже прочитанное содержимое файла, если есть.
+    """
+    if content is None:
+        content = Path(file_path).read_bytes()
+
+    if Path(file_path).suffix == ".json":
+        return json.loads(content)
+
+    return yaml.load(content, OpenApiYamlLoader)
+
+
+def parse_openapi_file(file_path: str | dict[str, Any]) -> models.Document:
     """Корневой парсер OpenAPI-файла
 
     Парсит файл и возвращает его представление в виде pydantic-объекта.
@@ -26,15 +85,19 @@ def parse_openapi_file(file_path: str) -> models.Document:
     Parameters
     ----------
     file_path
-        Путь до OpenAPI-файла, который необходимо спарсить.
+        Путь до OpenAPI-файла, который необходимо спарсить,
+        либо уже загруженный OpenAPI-документ (см. load_openapi_file).
     """
-    with open(file_path) as file:
-        openapi_data = yaml.load(file, yaml.SafeLoader)
+    if isinstance(file_path, dict):
+        openapi_data = file_path
+    else:
+        openapi_data = load_openapi_file(file_path)
 
     # Сюда будут складываться найденные в процессе парсинга базовые классы,
     # в которых определён дискриминатор.
     discriminator_base_class_schemas: list[models.DiscriminatorBaseClassSchema] = []
     inline_schema_aggregator = InlineSchemasAggregator()
+    issues_collector = IssuesCollector()
 
     ref_resolver = RefResolver(
         openapi_data=openapi_data,
@@ -44,6 +107,7 @@ def parse_openapi_file(file_path: str) -> models.Document:
         openapi_data=openapi_data,
         discriminator_base_class_schemas=discriminator_base_class_schemas,
         inline_schema_aggregator=inline_schema_aggregator,
+        issues_collector=issues_collector,
     )
     response_parser = ResponseParser(
         ref_resolver=ref_resolver,
@@ -59,6 +123,7 @@ def parse_openapi_file(file_path: str) -> models.Document:
         ref_resolver=ref_resolver,
         schema_parser=schema_parser,
         openapi_data=openapi_data,
+        issues_collector=issues_collector,
     )
     operation_parser = OperationParser(
         ref_resolver=ref_resolver,
@@ -66,6 +131,7 @@ def parse_openapi_file(file_path: str) -> models.Document:
         response_parser=response_parser,
         request_body_parser=request_body_parser,
         parameters_parser=parameters_parser,
+        issues_collector=issues_collector,
     )
     path_parser = PathParser(
         ref_resolver=ref_resolver,
@@ -74,8 +140,27 @@ def parse_openapi_file(file_path: str) -> models.Document:
         openapi_data=openapi_data,
     )
 
-    schemas = schema_parser.parse_collection()
-    paths = path_parser.parse_collection()
+    with profiler.phase("SchemaParser.parse_collection", pstats_name="parse"):
+        schemas = schema_parser.parse_collection()
+    with profiler.phase("PathParser.parse_collection", pstats_name="parse"):
+        paths = path_parser.parse_collection()
+    ref_resolver_stats = ref_resolver.stats
+    logger.debug(
+        f"$ref resolved {ref_resolver_stats.total} times "
+        f"(hits={ref_resolver_stats.hits}, misses={ref_resolver_stats.misses})"
+    )
+    with profiler.phase("ParameterParser.parse_collections", pstats_name="parse"):
+        parameters = parameters_parser.parse_collections()
+
+    issues = issues_collector.get_issues()
+    if issues:
+        console.print_error(
+            title="Failed to generate a client",
+            msg="\n".join(str(issue) for issue in issues),
+            invalid_data=None,
+        )
+        raise exceptions.Exit()
+
     all_schemas: dict[str, models.SchemaObject] = {
         **schemas,
         **inline_schema_aggregator.get_mapping(),
@@ -88,7 +173,7 @@ def parse_openapi_file(file_path: str) -> models.Document:
         ),
         paths=paths,
         schemas=all_schemas,
-        parameters=parameters_parser.parse_collections(),
+        parameters=parameters,
         discriminator_base_class_schemas=discriminator_base_class_schemas,
     )
     # print(document)
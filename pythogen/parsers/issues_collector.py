@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Issue:
+    location: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.location}: {self.message}"
+
+
+class IssuesCollector:
+    """
+    Collects structural problems of the OpenAPI file found during parsing,
+    so that all of them are reported at once instead of one per run.
+    """
+
+    def __init__(self):
+        # dict is used as an ordered set: the same schema may be parsed several times
+        self._issues: dict[Issue, None] = {}
+
+    def add(self, location: str, message: str) -> None:
+        self._issues[Issue(location=location, message=message)] = None
+
+    def get_issues(self) -> list[Issue]:
+        return list(self._issues)
@@ -2,6 +2,7 @@ import logging
 from typing import Any
 
 from pythogen import models
+from pythogen.parsers.issues_collector import IssuesCollector
 from pythogen.parsers.parameters import ParameterParser
 from pythogen.parsers.references import RefResolver
 from pythogen.parsers.request_body import RequestBodyParser
@@ -20,12 +21,14 @@ class OperationParser:
         response_parser: ResponseParser,
         request_body_parser: RequestBodyParser,
         parameters_parser: ParameterParser,
+        issues_collector: IssuesCollector,
     ) -> None:
         self._ref_resolver = ref_resolver
         self._schema_parser = schema_parser
         self._response_parser = response_parser
         self._request_body_parser = request_body_parser
         self._parameters_parser = parameters_parser
+        self._issues_collector = issues_collector
 
     def parse_item(
         self,
@@ -36,12 +39,26 @@ class OperationParser:
         """Parse endpoints method specification (POST/GET/PUT/... request)"""
         responses: dict[str, models.ResponseObject] = {}
         operation_id: str = self.parse_operation_id(path_str, method, operation_data)
+        location = f"operation {method.value.upper()} {path_str}"
 
-        for status_code, response_data in operation_data["responses"].items():
+        responses_data = operation_data.get("responses")
+        if not isinstance(responses_data, dict) or not responses_data:
+            self._issues_collector.add(location, 'the "responses" field must contain at least one response')
+            responses_data = {}
+
+        for status_code, response_data in responses_data.items():
             if status_code == "default":
                 logger.error('Unable to parse responses, "default" not implemented yet')
                 continue
 
+            if not str(status_code).isdigit():
+                self._issues_collector.add(location, f'unsupported response status code "{status_code}"')
+                continue
+
+            if not isinstance(response_data, dict):
+                self._issues_collector.add(location, f'response "{status_code}" must be an object')
+                continue
+
             if response_data.get("$ref", None):
                 resolved_ref = self._ref_resolver.resolve(response_data["$ref"])
                 response_data = resolved_ref.ref_data
@@ -49,6 +66,10 @@ class OperationParser:
             else:
                 response_id = f"{operation_id}Response{status_code}"
 
+            if "description" not in response_data:
+                self._issues_collector.add(location, f'response "{status_code}" must contain the "description" field')
+                continue
+
             responses[status_code] = self._response_parser.parse_item(response_id, response_data)
 
         request_body_data = operation_data.get("requestBody")
@@ -57,6 +78,13 @@ class OperationParser:
         else:
             request_body = None
 
+        idempotent = operation_data.get("x-idempotent")
+        if idempotent is not None and not isinstance(idempotent, bool):
+            self._issues_collector.add(location, 'the "x-idempotent" extension must be a boolean')
+            idempotent = None
+
+        rate_limit = self.parse_rate_limit(operation_data.get("x-rate-limit"), location)
+
         return models.OperationObject(
             method=method,
             summary=operation_data.get("summary"),
@@ -66,6 +94,36 @@ class OperationParser:
             responses=models.ResponsesObject(patterned=responses),
             parameters=self.parse_parameters(operation_data),
             path_str=path_str,
+            idempotent=idempotent,
+            rate_limit=rate_limit,
+        )
+
+    def parse_rate_limit(self, rate_limit_data: Any, location: str) -> models.RateLimitObject | None:
+        """x-rate-limit: {requests: 100, period: 60, burst: 10}, `period` (seconds) and `burst` are optional"""
+        if rate_limit_data is None:
+            return None
+
+        if not isinstance(rate_limit_data, dict) or set(rate_limit_data) - {"requests", "period", "burst"}:
+            self._issues_collector.add(
+                location,
+                'the "x-rate-limit" extension must be an object with "requests", optional "period" and "burst"',
+            )
+            return None
+
+        values = {key: rate_limit_data.get(key) for key in ("requests", "period", "burst")}
+        for key, value in values.items():
+            if value is None and key != "requests":
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                self._issues_collector.add(
+                    location, f'"{key}" of the "x-rate-limit" extension must be a positive number'
+                )
+                return None
+
+        return models.RateLimitObject(
+            requests=values["requests"],
+            period=values["period"] or 1,
+            burst=values["burst"],
         )
 
     def parse_operation_id(
@@ -90,7 +148,7 @@ class OperationParser:
     def parse_parameters(self, operation_data: dict[str, Any]) -> list[models.ParameterObject]:
         parameters: list[models.ParameterObject] = []
         for parameter_data in operation_data.get("parameters", []):
-            if parameter_data.get("$ref", None):
+            if isinstance(parameter_data, dict) and parameter_data.get("$ref", None):
                 resolved_ref = self._ref_resolver.resolve(parameter_data["$ref"])
                 parameter = self._parameters_parser.parse_item(resolved_ref.ref_id, resolved_ref.ref_data)
                 parameters.append(parameter)
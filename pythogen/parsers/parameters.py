@@ -1,18 +1,24 @@
 import re
 from typing import Any
 
-from pythogen import console
-from pythogen import exceptions
 from pythogen import models
+from pythogen.parsers.issues_collector import IssuesCollector
 from pythogen.parsers.references import RefResolver
 from pythogen.parsers.schemas import SchemaParser
 
 
 class ParameterParser:
-    def __init__(self, ref_resolver: RefResolver, schema_parser: SchemaParser, openapi_data: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        ref_resolver: RefResolver,
+        schema_parser: SchemaParser,
+        openapi_data: dict[str, Any],
+        issues_collector: IssuesCollector,
+    ) -> None:
         self._openapi_data = openapi_data
         self._ref_resolver = ref_resolver
         self._schema_parser = schema_parser
+        self._issues_collector = issues_collector
 
     def parse_collections(self) -> dict[str, models.ParameterObject]:
         parameters = self._openapi_data.get("components", {}).get("parameters", {})
@@ -22,6 +28,8 @@ class ParameterParser:
         }
 
     def parse_item(self, id_: str, data: dict[str, Any]) -> models.ParameterObject:
+        data = self._check_item(id_, data)
+
         schema_data = data["schema"]
         if schema_data.get("$ref", None):
             resolved_ref = self._ref_resolver.resolve(schema_data["$ref"])
@@ -34,12 +42,10 @@ class ParameterParser:
         safety_key = match["safety_key"] if match else None
 
         if len(schema.all_of) > 1:
-            console.print_error(
-                title="Failed to generate a client",
-                msg='"allOf" field in property can contains only one item.',
-                invalid_data=data,
+            self._issues_collector.add(
+                f'parameter "{data["name"]}"',
+                '"allOf" field in property can contains only one item.',
             )
-            raise exceptions.Exit()
 
         return models.ParameterObject(
             id=id_,
@@ -50,3 +56,29 @@ class ParameterParser:
             required=data.get("required", False),
             schema=schema,
         )
+
+    def _check_item(self, id_: str, data: Any) -> dict[str, Any]:
+        """Structural pre-check of the parameter
+
+        Problems are reported to the issues collector, the returned data is safe to parse.
+        """
+        if not isinstance(data, dict):
+            self._issues_collector.add(f'parameter "{id_}"', "parameter must be an object")
+            data = {}
+
+        checked_data = dict(data)
+        if not isinstance(data.get("name"), str):
+            self._issues_collector.add(f'parameter "{id_}"', 'the "name" field is required')
+            checked_data["name"] = id_
+
+        location = f'parameter "{checked_data["name"]}"'
+        if data.get("in") not in models.ParameterLocation.__members__:
+            allowed = ", ".join(models.ParameterLocation.__members__)
+            self._issues_collector.add(location, f'the "in" field must be one of: {allowed}')
+            checked_data["in"] = models.ParameterLocation.query.name
+
+        if not isinstance(data.get("schema"), dict):
+            self._issues_collector.add(location, 'the "schema" field is required')
+            checked_data["schema"] = {}
+
+        return checked_data
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from typing import Any
+from urllib.parse import unquote
 
 
 @dataclass
@@ -8,13 +9,35 @@ class ResolvedRef:
     ref_id: str
 
 
+@dataclass
+class RefResolverStats:
+    hits: int
+    misses: int
+
+    @property
+    def total(self) -> int:
+        return self.hits + self.misses
+
+
 class RefResolver:
     """
     Отвечает за получение данных из указанного $ref пути.
+
+    Resolved refs and all intermediate JSON Pointers are memoized,
+    so every section of the document is walked only once.
     """
 
     def __init__(self, openapi_data: dict[str, Any]) -> None:
         self._openapi_data = openapi_data
+        self._resolved_refs: dict[str, ResolvedRef] = {}
+        # JSON Pointer (already split into decoded tokens) -> document section
+        self._index: dict[tuple[str, ...], Any] = {(): openapi_data}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> RefResolverStats:
+        return RefResolverStats(hits=self._hits, misses=self._misses)
 
     def resolve(self, ref: str) -> ResolvedRef:
         """
@@ -25,12 +48,51 @@ class RefResolver:
         ref
             Путь до объекта. Пример: "#/components/schemas/PutObjectData"
         """
-        _, path = ref.split("#/")
-        segments = path.split("/")
-        target = self._openapi_data
-        while segments:
-            current = segments.pop(0)
-            if current not in target:
-                raise Exception(f'Unable to resolve "{ref}", document section "{current}" not found')
-            target = target[current]
-        return ResolvedRef(ref_data=target, ref_id=ref.split("/")[-1])
+        resolved_ref = self._resolved_refs.get(ref)
+        if resolved_ref is not None:
+            self._hits += 1
+            return resolved_ref
+
+        self._misses += 1
+        tokens = self._parse_pointer(ref)
+        resolved_ref = ResolvedRef(
+            ref_data=self._get_section(ref, tokens),
+            ref_id=tokens[-1] if tokens else "",
+        )
+        self._resolved_refs[ref] = resolved_ref
+        return resolved_ref
+
+    def _parse_pointer(self, ref: str) -> tuple[str, ...]:
+        """Split the ref into decoded JSON Pointer tokens (RFC 6901)"""
+        document, _, fragment = ref.partition("#")
+        if document:
+            raise Exception(f'Unable to resolve "{ref}", references to external documents are not supported')
+
+        # The pointer is a URI fragment, so it may be percent-encoded
+        pointer = unquote(fragment)
+        if not pointer:
+            return ()
+        if not pointer.startswith("/"):
+            raise Exception(f'Unable to resolve "{ref}", JSON Pointer must start with "/"')
+
+        return tuple(token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/"))
+
+    def _get_section(self, ref: str, tokens: tuple[str, ...]) -> Any:
+        section = self._index.get(tokens)
+        if section is not None or tokens in self._index:
+            return section
+
+        parent = self._get_section(ref, tokens[:-1])
+        current = tokens[-1]
+        if isinstance(parent, list):
+            try:
+                section = parent[int(current)]
+            except (ValueError, IndexError) as exc:
+                raise Exception(f'Unable to resolve "{ref}", document section "{current}" not found') from exc
+        elif isinstance(parent, dict) and current in parent:
+            section = parent[current]
+        else:
+            raise Exception(f'Unable to resolve "{ref}", document section "{current}" not found')
+
+        self._index[tokens] = section
+        return section
@@ -2,10 +2,9 @@ import re
 from collections import defaultdict
 from typing import Any
 
-from pythogen import console
-from pythogen import exceptions
 from pythogen import models
 from pythogen.parsers.inline_schemas_aggregator import InlineSchemasAggregator
+from pythogen.parsers.issues_collector import IssuesCollector
 from pythogen.parsers.references import RefResolver
 
 
@@ -41,11 +40,13 @@ class SchemaParser:
         openapi_data: dict[str, Any],
         discriminator_base_class_schemas: list[models.DiscriminatorBaseClassSchema],
         inline_schema_aggregator: InlineSchemasAggregator,
+        issues_collector: IssuesCollector,
     ) -> None:
         self._openapi_data = openapi_data
         self._ref_resolver = ref_resolver
         self._discriminator_base_class_schemas = discriminator_base_class_schemas
         self._inline_schema_aggregator = inline_schema_aggregator
+        self._issues_collector = issues_collector
 
         self._processiong_parsed_schema_id_count: dict[str, int] = defaultdict(int)
         self._schemas: dict[str, models.SchemaObject] = {}
@@ -82,7 +83,9 @@ class SchemaParser:
         if schema_id in self._schemas:
             return self._schemas[schema_id]
 
-        schema_type = self._parse_type(schema_data)
+        schema_data = self._check_item(schema_id, schema_data)
+        schema_type = self._parse_type(schema_id, schema_data)
+        schema_format = self._parse_format(schema_id, schema_data)
         all_of = self._parse_all_of(schema_id, schema_data)
         any_of = self._parse_any_of(schema_id, schema_data)
 
@@ -104,7 +107,7 @@ class SchemaParser:
                 required=schema_data.get("required", []),
                 enum=schema_data.get("enum"),
                 type=schema_type,
-                format=self._parse_format(schema_data),
+                format=schema_format,
                 items=[],
                 properties=[],
                 description=self._get_description(schema_data),
@@ -112,7 +115,7 @@ class SchemaParser:
                 all_of=all_of,
                 any_of=any_of,
                 is_inline=is_inline,
-                discriminator=self._parse_discriminator(schema_data),
+                discriminator=self._parse_discriminator(schema_id, schema_data),
                 minimum=schema_data.get("minimum"),
                 maximum=schema_data.get("maximum"),
                 exclusive_minimum=schema_data.get("exclusiveMinimum", False),
@@ -129,14 +132,14 @@ class SchemaParser:
             required=schema_data.get("required", []),
             enum=schema_data.get("enum"),
             type=schema_type,
-            format=self._parse_format(schema_data),
+            format=schema_format,
             items=self._parse_items(schema_id, schema_data),
-            properties=self._parse_properties(schema_type, schema_data),
+            properties=self._parse_properties(schema_id, schema_type, schema_format, schema_data),
             description=self._get_description(schema_data),
             all_of=all_of,
             any_of=any_of,
             is_inline=is_inline,
-            discriminator=self._parse_discriminator(schema_data),
+            discriminator=self._parse_discriminator(schema_id, schema_data),
             minimum=schema_data.get("minimum"),
             maximum=schema_data.get("maximum"),
             exclusive_minimum=schema_data.get("exclusiveMinimum", False),
@@ -175,7 +178,43 @@ class SchemaParser:
 
         return result
 
-    def _parse_type(self, data: dict[str, Any]) -> models.Type:
+    def _check_item(self, schema_id: str, data: Any) -> dict[str, Any]:
+        """Structural pre-check of the schema
+
+        Problems are reported to the issues collector, the returned data is safe to parse.
+        """
+        location = f'schema "{schema_id}"'
+        if not isinstance(data, dict):
+            self._issues_collector.add(location, "schema must be an object")
+            return {}
+
+        checked_data = data
+        for key, expected_type, type_name in (
+            ("properties", dict, "an object"),
+            ("items", dict, "an object"),
+            ("required", list, "an array"),
+            ("enum", list, "an array"),
+            ("allOf", list, "an array"),
+            ("anyOf", list, "an array"),
+            ("discriminator", dict, "an object"),
+        ):
+            if key in data and not isinstance(data[key], expected_type):
+                self._issues_collector.add(location, f'"{key}" field must be {type_name}')
+                if checked_data is data:
+                    checked_data = dict(data)
+                checked_data.pop(key)
+
+        for key in ("allOf", "anyOf"):
+            items = checked_data.get(key, [])
+            if not all(isinstance(item, dict) for item in items):
+                self._issues_collector.add(location, f'"{key}" items must be objects')
+                if checked_data is data:
+                    checked_data = dict(data)
+                checked_data[key] = [item for item in items if isinstance(item, dict)]
+
+        return checked_data
+
+    def _parse_type(self, schema_id: str, data: dict[str, Any]) -> models.Type:
         if data == {}:
             # Парсинг пустой схемы
             # application/json:
@@ -192,17 +231,18 @@ class SchemaParser:
             raw_data_type: str | None = data.get("type")
             try:
                 data_type = models.Type(raw_data_type)
-            except ValueError as exc:
-                raise Exception(f'Unable to parse schema, unknown type "{raw_data_type}" on "{data}"') from exc
+            except ValueError:
+                self._issues_collector.add(f'schema "{schema_id}"', f'unknown type "{raw_data_type}"')
+                data_type = models.Type.object
         return data_type
 
-    def _parse_format(self, data: dict[str, Any]) -> models.Format | None:
+    def _parse_format(self, schema_id: str, data: dict[str, Any]) -> models.Format | None:
         data_format = data.get("format")
         if data_format:
             try:
                 return models.Format(data_format)
-            except Exception as exc:
-                raise Exception(f'Unable to parse schema, unknown format "{data_format}"') from exc
+            except Exception:
+                self._issues_collector.add(f'schema "{schema_id}"', f'unknown format "{data_format}"')
         return None
 
     def _get_description(self, data: dict[str, Any]) -> str | None:
@@ -213,7 +253,7 @@ class SchemaParser:
             description = description.replace('"', '\\"')
         return description
 
-    def _parse_discriminator(self, data: dict[str, Any]) -> models.Discriminator | None:
+    def _parse_discriminator(self, schema_id: str, data: dict[str, Any]) -> models.Discriminator | None:
         raw_discriminator: dict[str, Any] | None = data.get("discriminator")
 
         if not raw_discriminator:
@@ -221,21 +261,16 @@ class SchemaParser:
 
         property_name: str | None = raw_discriminator.get("propertyName")
         if not property_name:
-            console.print_error(
-                title="Failed to generate a client",
-                msg='The discriminator must contain the "propertyName" field.',
-                invalid_data=data,
+            self._issues_collector.add(
+                f'schema "{schema_id}"', 'The discriminator must contain the "propertyName" field.'
             )
-            raise exceptions.Exit()
 
         raw_mapping: dict[str, Any] | None = raw_discriminator.get("mapping")
         if not raw_mapping:
-            console.print_error(
-                title="Failed to generate a client",
-                msg='The discriminator must contain the "mapping" field.',
-                invalid_data=data,
-            )
-            raise exceptions.Exit()
+            self._issues_collector.add(f'schema "{schema_id}"', 'The discriminator must contain the "mapping" field.')
+
+        if not property_name or not raw_mapping:
+            return None
 
         mapping: dict[str, models.SchemaObject] = {}
         for discriminator_value, ref in raw_mapping.items():
@@ -265,21 +300,20 @@ class SchemaParser:
 
     def _parse_properties(
         self,
+        schema_id: str,
         schema_type: models.Type,
+        data_format: models.Format | None,
         data: dict[str, Any],
     ) -> list[models.SchemaProperty]:
-        data_format = data.get("format")
-        if data_format:
-            try:
-                data_format = models.Format(data_format)
-            except Exception as exc:
-                raise Exception(f'Unable to parse schema "{id}", unknown format "{data_format}"') from exc
-
         properties = []
 
         properties_map = data.get("properties")
         if properties_map:
             for key, property_schema_data in properties_map.items():
+                if not isinstance(property_schema_data, dict):
+                    self._issues_collector.add(f'schema "{schema_id}"', f'property "{key}" must be an object')
+                    continue
+
                 if property_schema_data.get("$ref", None):
                     resolved_ref = self._ref_resolver.resolve(property_schema_data["$ref"])
                     property_schema_data = resolved_ref.ref_data
@@ -0,0 +1,161 @@
+"""
+Per-phase profile of the generation: wall time and peak memory.
+
+Phases are marked in the code with `profiler.phase(...)`, which does
+nothing unless a profiler is activated:
+```
+profile = profiler.Profiler()
+with profiler.activate(profile):
+    generator.generate(...)
+print(profile.format_table())
+```
+Memory is traced with tracemalloc, which slows the generation down,
+so the seconds of a profiled run are higher than of a regular one.
+Work done in other processes (e.g. parallel formatting) is counted
+in wall time only.
+"""
+
+import cProfile
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+
+@dataclass
+class PhaseStats:
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    peak_memory_bytes: int = 0  # peak of memory allocated by python while the phase was running
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseStats] = {}
+        self.total_seconds = 0.0
+        self._pstats: dict[str, cProfile.Profile] = {}
+        self._peaks: list[int] = []  # peaks of the phases that are running, the innermost is the last
+
+    @contextmanager
+    def phase(self, name: str, pstats_name: str | None = None) -> Iterator[None]:
+        stats = self.phases.setdefault(name, PhaseStats(name=name))
+
+        if self._peaks:
+            # the peak is reset for the nested phase, but it's still the peak of the outer one
+            self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        self._peaks.append(0)
+
+        pstats_profile = None
+        if pstats_name is not None:
+            pstats_profile = self._pstats.setdefault(pstats_name, cProfile.Profile())
+            pstats_profile.enable()
+
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats.seconds += time.perf_counter() - started_at
+            stats.calls += 1
+            if pstats_profile is not None:
+                pstats_profile.disable()
+
+            peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+            stats.peak_memory_bytes = max(stats.peak_memory_bytes, peak)
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+
+    def format_table(self) -> str:
+        rows = [("phase", "calls", "seconds", "%", "peak memory, MiB")]
+        for stats in self.phases.values():
+            share = stats.seconds / self.total_seconds * 100 if self.total_seconds else 0.0
+            rows.append(
+                (
+                    stats.name,
+                    str(stats.calls),
+                    f"{stats.seconds:.3f}",
+                    f"{share:.1f}",
+                    f"{stats.peak_memory_bytes / 2**20:.1f}",
+                )
+            )
+        rows.append(("total", "", f"{self.total_seconds:.3f}", "100.0", ""))
+
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = [
+            "  ".join(
+                value.ljust(width) if i == 0 else value.rjust(width)
+                for i, (value, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        ]
+        lines.insert(1, "-" * len(lines[0]))
+        lines.insert(-1, "-" * len(lines[0]))
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "total_seconds": self.total_seconds,
+            "phases": [asdict(stats) for stats in self.phases.values()],
+        }
+
+    def dump(self, profile_dir: str, pstats: bool = False) -> list[Path]:
+        """Write profile.json (and <phase>.pstats files) to the directory, returns paths of the written files"""
+        profile_dir_path = Path(profile_dir)
+        profile_dir_path.mkdir(parents=True, exist_ok=True)
+
+        json_path = profile_dir_path / "profile.json"
+        json_path.write_text(json.dumps(self.to_dict(), indent=2))
+        paths = [json_path]
+
+        if pstats:
+            for pstats_name, pstats_profile in self._pstats.items():
+                pstats_path = profile_dir_path / f"{pstats_name}.pstats"
+                pstats_profile.dump_stats(pstats_path)
+                paths.append(pstats_path)
+        return paths
+
+
+_active_profiler: ContextVar[Profiler | None] = ContextVar("active_profiler", default=None)
+
+
+@contextmanager
+def activate(profile: Profiler) -> Iterator[Profiler]:
+    """Collect the phases of the code run inside the block into the profiler"""
+    tracing_was_started = tracemalloc.is_tracing()
+    if not tracing_was_started:
+        tracemalloc.start()
+    token = _active_profiler.set(profile)
+    started_at = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total_seconds += time.perf_counter() - started_at
+        _active_profiler.reset(token)
+        if not tracing_was_started:
+            tracemalloc.stop()
+
+
+@contextmanager
+def phase(name: str, pstats_name: str | None = None) -> Iterator[None]:
+    """Mark a phase of the generation
+
+    Arguments
+    ---------
+    name
+        Name of the phase in the profile, repeated phases are summed up
+    pstats_name
+        Phases with the same pstats_name are profiled with cProfile into <pstats_name>.pstats
+    """
+    profile = _active_profiler.get()
+    if profile is None:
+        yield
+        return
+    with profile.phase(name, pstats_name=pstats_name):
+        yield
@@ -2,20 +2,32 @@
 Responsible for rendering/generating client code from data
 that was parsed from an OpenAPI file.
 """
+import ast
+import keyword
 import logging
 import re
 from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
 from typing import Generic
+from typing import Iterable
+from typing import MutableMapping
 from typing import TypeVar
 
-import autoflake
-import black
 import inflection
-import isort
 from jinja2 import Environment
 from jinja2 import FileSystemLoader
+from jinja2 import pass_context
+from jinja2.runtime import Context
 
+from pythogen import console
+from pythogen import exceptions
+from pythogen import formatter
+from pythogen import graph
 from pythogen import models
+from pythogen import profiler
 from pythogen import settings
 
 
@@ -25,6 +37,22 @@ PathStr = TypeVar("PathStr", bound=str)
 logger = logging.getLogger(__name__)
 
 
+class Layout(str, Enum):
+    module = "module"  # the whole client in one file
+    package = "package"  # package with lazily imported modules: client, enums, params, models/*
+
+
+DISCRIMINATORS_MODULE_NAME = "discriminators"
+
+
+@dataclass
+class ModelsGroup:
+    """Models that refer only to each other, rendered to one module of the package"""
+
+    module_name: str
+    models: list[models.SchemaObject]
+
+
 def render_client(
     *,
     output_path: str,
@@ -34,7 +62,11 @@ def render_client(
     metrics: bool,
     pythogen_version: str,
     required_headers: list[str] | None = None,
-) -> None:
+    defer_build: bool = False,
+    format_mode: formatter.FormatMode = formatter.FormatMode.full,
+    format_workers: int | None = None,
+    chunks_cache: MutableMapping[str, str] | None = None,
+) -> str:
     """Отрисовывает сгенерированный клиент на основе j2-шаблонов
 
     Arguments
@@ -43,32 +75,220 @@ def render_client(
         Пудо до файла, в который запишется сгенерированный клиент
     document
         Спаршенный в python-объекты OpenApi-файл
+    defer_build
+        Build validators of models on the first use instead of the import of the client
+    format_mode, format_workers, chunks_cache
+        See formatter.format_code
+
+    Returns the code of the generated client.
     """
-    env = Environment(
-        loader=FileSystemLoader(settings.HTTP_CLIENT_TEMPLATES_DIR_PATH), extensions=["jinja2.ext.loopcontrols"]
+    template = get_environment().get_template(settings.CLIENT_TEMPLATE_NAME)
+
+    context = _template_context(
+        document=document,
+        name=name,
+        sync=sync,
+        metrics=metrics,
+        required_headers=required_headers,
+        pythogen_version=pythogen_version,
+        defer_build=defer_build,
     )
-    template = env.get_template(
-        settings.CLIENT_TEMPLATE_NAME,
-        globals={
-            "varname": varname,
-            "classname": classname,
-            "typerepr": j2_typerepr,
-            "responserepr": j2_responserepr,
-            "iterresponsemap": iterresponsemap,
-            "parameterfield": parameterfield,
-            "propertyfield": propertyfield,
-            "repranyof": j2_repr_any_of,
+    with profiler.phase("render", pstats_name="render"):
+        rendered_client = template.render(**context)
+    rendered_client = formatter.format_code(
+        rendered_client,
+        mode=format_mode,
+        workers=format_workers,
+        chunks_cache=chunks_cache,
+    )
+    with profiler.phase("write"):
+        with open(output_path, "w") as output_file:
+            output_file.write(rendered_client)
+
+    return rendered_client
+
+
+def render_package(
+    *,
+    output_path: str,
+    document: models.Document,
+    name: str,
+    sync: bool,
+    metrics: bool,
+    pythogen_version: str,
+    required_headers: list[str] | None = None,
+    defer_build: bool = False,
+    format_mode: formatter.FormatMode = formatter.FormatMode.full,
+    format_workers: int | None = None,
+    chunks_cache: MutableMapping[str, str] | None = None,
+) -> dict[str, str]:
+    """Render the client as a package
+
+    ```
+    output_path/
+        __init__.py      # lazy imports of all classes
+        client.py        # client class and its runtime (integrations, boxes, ...)
+        enums.py
+        params.py        # path/query params and headers of operations
+        models/
+            __init__.py  # lazy imports of models
+            <group>.py   # models that refer only to each other
+    ```
+    Models are imported on the first access, so importing the client
+    doesn't build the models of the operations that are not called.
+
+    Arguments are the same as of render_client, output_path is the directory of the package.
+
+    Returns the code of the modules: path relative to output_path -> code.
+    """
+    environment = get_environment()
+    context = _template_context(
+        document=document,
+        name=name,
+        sync=sync,
+        metrics=metrics,
+        required_headers=required_headers,
+        pythogen_version=pythogen_version,
+        defer_build=defer_build,
+    )
+
+    with profiler.phase("render", pstats_name="render"):
+        files = _render_package_files(environment, document, context, name=name, metrics=metrics)
+
+    files = formatter.format_files(files, mode=format_mode, workers=format_workers, chunks_cache=chunks_cache)
+
+    with profiler.phase("write"):
+        package_path = Path(output_path)
+        (package_path / "models").mkdir(parents=True, exist_ok=True)
+        for relative_path, code in files.items():
+            with open(package_path / relative_path, "w") as output_file:
+                output_file.write(code)
+
+    return files
+
+
+def _render_package_files(
+    environment: Environment,
+    document: models.Document,
+    context: dict[str, Any],
+    *,
+    name: str,
+    metrics: bool,
+) -> dict[str, str]:
+    """Render the modules of the package, see render_package"""
+    enum_names = [classname(enum.id) for enum in document.sorted_enums]
+    params_names = [
+        class_name for operation in context["operations"] for class_name in operation_params_names(operation)
+    ]
+    groups = group_models(document)
+    module_of_model = {
+        classname(model.id): f".models.{group.module_name}" for group in groups for model in group.models
+    }
+    discriminator_names = [schema.name for schema in document.discriminator_base_class_schemas]
+
+    files: dict[str, str] = {}
+
+    lazy_imports = {class_name: ".client" for class_name in (name, *_runtime_names(context["sync"], metrics))}
+    lazy_imports.update({class_name: ".enums" for class_name in enum_names})
+    lazy_imports.update({class_name: ".params" for class_name in params_names})
+    lazy_imports.update(module_of_model)
+    lazy_imports.update({class_name: f".models.{DISCRIMINATORS_MODULE_NAME}" for class_name in discriminator_names})
+    files["__init__.py"] = environment.get_template("package/init.j2").render(**context, lazy_imports=lazy_imports)
+
+    files["models/__init__.py"] = environment.get_template("package/init.j2").render(
+        **context,
+        lazy_imports={
+            class_name: module_name.removeprefix(".models")
+            for class_name, module_name in lazy_imports.items()
+            if module_name.startswith(".models.")
         },
     )
 
-    prepared_operations = prepare_operations(document)
+    files["enums.py"] = environment.get_template("package/enums.j2").render(**context)
+
+    referenced_by_params = [
+        schema_id
+        for operation in context["operations"]
+        for parameter in (*operation.path_params, *operation.query_params, *operation.headers)
+        for schema_id in document.referenced_schemas(parameter.schema)
+    ]
+    files["params.py"] = environment.get_template("package/params.j2").render(
+        **context,
+        imported_names=_imported_names(referenced_by_params, enum_names, module_of_model),
+    )
+
+    models_group_template = environment.get_template("package/models_group.j2")
+    for group in groups:
+        referenced_by_group = [
+            schema_id for model in group.models for schema_id in document.schema_dependencies[model.id]
+        ]
+        files[f"models/{group.module_name}.py"] = models_group_template.render(
+            **{**context, "models": group.models, "discriminator_base_class_schemas": []},
+            imported_names={
+                class_name: f".{module_name}" if module_name.startswith(".") else module_name
+                for class_name, module_name in _imported_names(referenced_by_group, enum_names, module_of_model).items()
+                if module_name != f".models.{group.module_name}"
+            },
+        )
+    files[f"models/{DISCRIMINATORS_MODULE_NAME}.py"] = models_group_template.render(
+        **{**context, "models": []},
+        imported_names={},
+    )
+
+    files["client.py"] = environment.get_template("package/client.j2").render(
+        **context,
+        modules_of_names={
+            **{class_name: "enums" for class_name in enum_names},
+            **{class_name: "operation_params" for class_name in params_names},
+            **{class_name: "models" for class_name in module_of_model},
+        },
+        imported_names={
+            **{class_name: ".enums" for class_name in enum_names},
+            **{class_name: ".params" for class_name in params_names},
+            **{class_name: ".models" for class_name in module_of_model},
+        },
+    )
+    return files
+
 
-    rendered_client = template.render(
+@lru_cache
+def _runtime_names(sync: bool, metrics: bool) -> tuple[str, ...]:
+    """Public classes and type aliases of client.py that are not generated from the OpenAPI file
+
+    Taken from the rendered runtime, so that the package exports every one of them.
+    """
+    code = get_environment().get_template("runtime.j2").render(sync=sync, metrics=metrics)
+    names: list[str] = []
+    for node in ast.parse(code).body:
+        if isinstance(node, ast.ClassDef):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            names.extend(target.id for target in node.targets if isinstance(target, ast.Name))
+    # constants, e.g. RETRIED_STATUS_CODES, are not exported
+    return tuple(name for name in names if not name.startswith("_") and not name.isupper())
+
+
+def _template_context(
+    *,
+    document: models.Document,
+    name: str,
+    sync: bool,
+    metrics: bool,
+    required_headers: list[str] | None,
+    pythogen_version: str,
+    defer_build: bool,
+) -> dict[str, Any]:
+    with profiler.phase("schema sorting"):
+        enums = document.sorted_enums
+        sorted_models = document.sorted_schemas
+    prepared_operations = prepare_operations(document)
+    check_operation_names(prepared_operations.all())
+    return dict(
         document=document,
         name=name,
         version=document.info.version,
-        enums=document.sorted_enums,
-        models=document.sorted_schemas,
+        enums=enums,
+        models=sorted_models,
         get=prepared_operations.get,
         post=prepared_operations.post,
         patch=prepared_operations.patch,
@@ -81,21 +301,118 @@ def render_client(
         required_headers=required_headers,
         operations=prepared_operations.all(),
         pythogen_version=pythogen_version,
+        defer_build=defer_build,
     )
-    rendered_client = black.format_str(rendered_client, mode=black.Mode(line_length=120))
-    rendered_client = isort.code(
-        rendered_client,
-        force_grid_wrap=2,
-        lines_after_imports=2,
-        force_single_line=True,
-        line_length=120,
+
+
+def check_operation_names(operations: Iterable[models.OperationObject]) -> None:
+    """Fail the generation when two operations get the same names in the client
+
+    E.g. the operations getMessage and get_message would share GET_MESSAGE_DECODERS and GetMessagePathParams.
+    Raises exceptions.Exit, the operations are printed to stderr.
+    """
+    first_operations: dict[str, models.OperationObject] = {}
+    collisions: list[str] = []
+    for operation in operations:
+        for name in (f"{varname(operation.fn_name).upper()}_DECODERS", classname(operation.fn_name)):
+            first = first_operations.setdefault(name, operation)
+            if first is not operation:
+                collisions.append(
+                    f'operations "{first.fn_name}" and "{operation.fn_name}" get the same name {name} in the client, '
+                    "one of them must be renamed"
+                )
+                break
+    if collisions:
+        console.print_error(title="Failed to generate a client", msg="\n".join(collisions), invalid_data=None)
+        raise exceptions.Exit()
+
+
+def _imported_names(
+    schema_ids: Iterable[str],
+    enum_names: list[str],
+    module_of_model: dict[str, str],
+) -> dict[str, str]:
+    """Class name -> module to import it from, for the schemas that are rendered to classes"""
+    imported_names: dict[str, str] = {}
+    for schema_id in schema_ids:
+        class_name = classname(schema_id)
+        if class_name in module_of_model:
+            imported_names[class_name] = module_of_model[class_name]
+        elif class_name in enum_names:
+            imported_names[class_name] = ".enums"
+    return imported_names
+
+
+def group_models(document: models.Document) -> list[ModelsGroup]:
+    """Split models into groups that don't refer to each other (weakly connected components)"""
+    rendered_models = {
+        model.id: model
+        for model in document.sorted_schemas
+        if model.type is not models.Type.null and not model.is_empty_object
+    }
+    components = graph.weakly_connected_components(rendered_models, document.schema_dependencies)
+
+    groups: list[ModelsGroup] = []
+    used_module_names = {DISCRIMINATORS_MODULE_NAME}
+    for component in components:
+        module_name = varname(component[0])
+        if keyword.iskeyword(module_name) or module_name in used_module_names:
+            suffix = 2
+            while f"{module_name}_{suffix}" in used_module_names:
+                suffix += 1
+            module_name = f"{module_name}_{suffix}"
+        used_module_names.add(module_name)
+        groups.append(ModelsGroup(module_name=module_name, models=[rendered_models[key] for key in component]))
+    return groups
+
+
+def operation_params_names(operation: models.OperationObject) -> list[str]:
+    """Names of the classes of path params, query params and headers of the operation"""
+    names = []
+    if operation.path_params:
+        names.append(f"{classname(operation.fn_name)}PathParams")
+    if operation.query_params:
+        names.append(f"{classname(operation.fn_name)}QueryParams")
+    if operation.headers:
+        names.append(f"{classname(operation.fn_name)}Headers")
+    return names
+
+
+@lru_cache(maxsize=1)
+def get_environment() -> Environment:
+    """Jinja environment with the client templates
+
+    Created once per process, so that the templates are loaded and compiled only once.
+    """
+    env = Environment(
+        loader=FileSystemLoader(settings.HTTP_CLIENT_TEMPLATES_DIR_PATH), extensions=["jinja2.ext.loopcontrols"]
     )
-    rendered_client = autoflake.fix_code(
-        rendered_client,
-        remove_all_unused_imports=True,
+    env.globals.update(
+        {
+            "varname": varname,
+            "classname": classname,
+            "typerepr": j2_typerepr,
+            "responserepr": j2_responserepr,
+            "iterresponsemap": iterresponsemap,
+            "streameditems": streamed_items,
+            "itemmapper": item_mapper,
+            "isdownload": is_download,
+            "parameterfield": parameterfield,
+            "propertyfield": propertyfield,
+            "repranyof": j2_repr_any_of,
+        }
     )
-    with open(output_path, "w") as output_file:
-        output_file.write(rendered_client)
+    env.filters["qualify"] = j2_qualify
+    return env
+
+
+def warm_up() -> None:
+    """Load the templates and the formatters ahead of time
+
+    Used by long-living processes (e.g. batch workers) that render many clients.
+    """
+    get_environment().get_template(settings.CLIENT_TEMPLATE_NAME)
+    formatter.format_code("import os\n", workers=1)
 
 
 @dataclass
@@ -147,6 +464,7 @@ def prepare_operations(document: models.Document) -> PreparedOperations:
 
 
 def iterresponsemap(responses: models.ResponsesObject) -> list[tuple[str, str]]:
+    """Status code -> expression that decodes `response`, a status code is decoded by its first mapper"""
     mapping = []
 
     for code, response in responses.patterned.items():
@@ -161,14 +479,14 @@ def iterresponsemap(responses: models.ResponsesObject) -> list[tuple[str, str]]:
             continue
 
         if response.schema.type == models.Type.object:
-            mapper = f"{classname(response.schema.id)}.model_validate(response.json())"
+            mapper = f"{classname(response.schema.id)}.model_validate_json(response.content)"
             mapping.append((code, mapper))
             continue
 
         if response.schema.any_of:
             items_class_names = [classname(items.id) for items in response.schema.any_of]
             items_class_names_str: str = "[" + ", ".join(items_class_names) + "]"
-            mapper = f"self._parse_any_of(response.json(), {items_class_names_str})"
+            mapper = f"_parse_any_of(response.json(), {items_class_names_str})"
             mapping.append((code, mapper))
             continue
 
@@ -186,7 +504,7 @@ def iterresponsemap(responses: models.ResponsesObject) -> list[tuple[str, str]]:
 
                 if items.type is models.Type.object:
                     items_class_name = classname(items.id)
-                    mapper = f"[{items_class_name}.model_validate(item) for item in response.json()]"
+                    mapper = f"_list_adapter({items_class_name}).validate_json(response.content)"
                     mapping.append((code, mapper))
                     continue
 
@@ -211,7 +529,38 @@ def iterresponsemap(responses: models.ResponsesObject) -> list[tuple[str, str]]:
             f"Unable to create response mapping of {response.id} <response.schema.type={response.schema.type}>"
         )
 
-    return mapping
+    first_mappers: dict[str, str] = {}
+    for code, mapper in mapping:
+        first_mappers.setdefault(code, mapper)
+    return list(first_mappers.items())
+
+
+def streamed_items(operation: models.OperationObject) -> models.SchemaObject | None:
+    """Schema of the items, if the 200 response is an array that can be streamed item by item"""
+    response = operation.responses.patterned.get("200")
+    if response is None or response.schema is None or response.schema.type is not models.Type.array:
+        return None
+    if not isinstance(response.schema.items, models.SchemaObject):
+        return None
+    return response.schema.items
+
+
+def is_download(operation: models.OperationObject) -> bool:
+    """The 200 response is a binary file, that can be written to a file chunk by chunk"""
+    response = operation.responses.patterned.get("200")
+    return (
+        response is not None
+        and response.schema is not None
+        and response.schema.type is models.Type.string
+        and response.schema.format is models.Format.binary
+    )
+
+
+def item_mapper(items: models.SchemaObject) -> str:
+    """Expression that validates `item` of a streamed array, decoded from JSON"""
+    if items.type is models.Type.object and not items.is_empty_object:
+        return f"{classname(items.id)}.model_validate(item)"
+    return "item"
 
 
 def j2_responserepr(responses: models.ResponsesObject, document: models.Document) -> str:
@@ -302,6 +651,32 @@ def j2_repr_any_of(any_of_items: list[models.SchemaObject], document: models.Doc
     return " | ".join(items)
 
 
+# String literals are skipped, identifiers after a dot are attributes
+QUALIFY_PATTERN = re.compile(r"""('[^']*'|"[^"]*")|(?<![\w.])([A-Za-z_]\w*)""")
+
+
+@pass_context
+def j2_qualify(context: Context, expression: str) -> str:
+    """Refer to generated classes through their modules: "list[Pet]" -> "list[models.Pet]"
+
+    Used in the package layout, where client.py imports the modules with models
+    instead of the models themselves. In the single-module layout does nothing.
+    """
+    modules_of_names: dict[str, str] = context.get("modules_of_names") or {}
+    if not modules_of_names:
+        return expression
+
+    def replace(match: re.Match) -> str:
+        string, identifier = match.groups()
+        if string is not None:
+            return string
+        if identifier in modules_of_names:
+            return f"{modules_of_names[identifier]}.{identifier}"
+        return identifier
+
+    return QUALIFY_PATTERN.sub(replace, expression)
+
+
 def varname(value: str) -> str:
     clean_value = re.sub(r"\W|^(?=\d)", "_", value)  # remove special characters
     clean_value = re.sub("_{2,}", "_", clean_value)  # __ -> _
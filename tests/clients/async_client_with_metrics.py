@@ -7,7 +7,7 @@
 #
 # Generator info:
 #   GitHub Page: https://github.com/artsmolin/pythogen
-#   Version:     0.2.40
+#   Version:     0.2.41
 # ==============================================================================
 
 # jinja2: lstrip_blocks: "True"
@@ -15,29 +15,59 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
 import datetime
+import hashlib
+import inspect
 import logging
+import os
+import pickle
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections import deque
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
 from dataclasses import dataclass
+from dataclasses import field
+from email.utils import parsedate_to_datetime
 from enum import Enum
 from enum import IntEnum
+from functools import lru_cache
+from functools import partial
+from json import JSONDecodeError
+from json import JSONDecoder
 from typing import IO
 from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
 from typing import Literal
 from typing import Mapping
 from typing import Protocol
 from typing import Sequence
+from typing import Sized
 from typing import Union
 from typing import get_type_hints
+from urllib.parse import urlsplit
 
 import httpx
 from httpx import Timeout
 from prometheus_client import Counter
+from prometheus_client import Gauge
 from prometheus_client import Histogram
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import HttpUrl
 from pydantic import RootModel
+from pydantic import TypeAdapter
 from pydantic import ValidationInfo
 from pydantic import field_validator
 
@@ -49,12 +79,855 @@ except AttributeError:
     DEFAULT_AUTH = None
 
 
+# decodes the response of an operation with the given status code, see <OPERATION>_DECODERS
+ResponseDecoder = Callable[[httpx.Response], Any]
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_class: type) -> TypeAdapter:
+    """Validator of JSON arrays of the model, built on the first use"""
+    return TypeAdapter(list[item_class])
+
+
+def _parse_any_of(item: dict[str, Any], schema_classes: list[Any]) -> Any:
+    for schema_class in schema_classes:
+        try:
+            return schema_class.model_validate(item)
+        except:
+            continue
+
+    raise Exception('Can\'t parse "{item}"')
+
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_DECODER = JSONDecoder()
+_JSON_NUMBER_START = frozenset("-0123456789")
+_JSON_AFTER_NUMBER = frozenset(", \t\n\r]")
+
+
+class _JsonArrayItems:
+    """Decodes items of a JSON array that is received in chunks
+
+    Only the item being received is kept in memory, so arrays of any size take constant memory.
+    """
+
+    def __init__(self) -> None:
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""  # received text that isn't decoded yet
+        self._started = False
+        self._after_item = False
+        self._finished = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Return the items that were completed by the chunk"""
+        text = self._text + self._utf8_decoder.decode(chunk)
+        position = 0
+        items: list[Any] = []
+        while True:
+            position = _JSON_WHITESPACE.match(text, position).end()
+            if position == len(text):
+                break
+
+            char = text[position]
+            if not self._started:
+                if char != "[":
+                    raise ValueError("JSON array is expected")
+                self._started = True
+                position += 1
+            elif self._finished:
+                raise ValueError("Unexpected data after the end of the JSON array")
+            elif char == "]":
+                self._finished = True
+                position += 1
+            elif self._after_item:
+                if char != ",":
+                    raise ValueError(f"Unexpected {char!r} between items of the JSON array")
+                self._after_item = False
+                position += 1
+            else:
+                try:
+                    item, end = _JSON_DECODER.raw_decode(text, position)
+                except JSONDecodeError:
+                    break  # the item ends in the next chunks
+                if char in _JSON_NUMBER_START and text[end : end + 1] not in _JSON_AFTER_NUMBER:
+                    break  # the number may continue in the next chunk
+                items.append(item)
+                position = end
+                self._after_item = True
+
+        self._text = text[position:]
+        return items
+
+    def close(self) -> None:
+        if not self._finished:
+            raise ValueError("JSON array is truncated or invalid")
+
+
+# path of a file, writable binary file or callback that receives chunks of the downloaded file
+DownloadDestination = Union[str, os.PathLike, IO[bytes], Callable[[bytes], Any]]
+
+
+@contextmanager
+def _open_destination(destination: DownloadDestination) -> Iterator[Callable[[bytes], Any]]:
+    """Function that writes a chunk of a downloaded file to the destination"""
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "wb") as file:
+            yield file.write
+    elif callable(destination):
+        yield destination
+    else:
+        yield destination.write
+
+
+@dataclass
+class TransferStats:
+    bytes_transferred: int = 0  # as received, before decoding of Content-Encoding
+    seconds: float = 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_transferred / self.seconds if self.seconds else 0.0
+
+
+class UnexpectedResponse(Exception):
+    """Response of a streaming method that isn't the streamed array"""
+
+    def __init__(self, status_code: int, body: Any) -> None:
+        super().__init__(f"Unexpected response with status code {status_code}")
+        self.status_code = status_code
+        self.body = body  # decoded as in the regular method, None if the status code is not described
+
+
+def _timeout(
+    timeout: float | Timeout,
+    connect: float | None,
+    read: float | None,
+    write: float | None,
+    pool: float | None,
+) -> Timeout:
+    timeout = timeout if isinstance(timeout, Timeout) else Timeout(timeout)
+    return Timeout(
+        connect=timeout.connect if connect is None else connect,
+        read=timeout.read if read is None else read,
+        write=timeout.write if write is None else write,
+        pool=timeout.pool if pool is None else pool,
+    )
+
+
+def _limits(limits: httpx.Limits | None, keepalive_expiry: float | None) -> httpx.Limits:
+    limits = limits or httpx.Limits()
+    if keepalive_expiry is None:
+        return limits
+    return httpx.Limits(
+        max_connections=limits.max_connections,
+        max_keepalive_connections=limits.max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+RETRIED_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+@dataclass
+class RetryPolicy:
+    """Retries of the requests of idempotent operations
+
+    The delay before the n-th retry is the Retry-After header of the response, or a random value
+    between 0 and min(backoff_max, backoff_base * 2 ** (n - 1)) ("full jitter"), so that the clients
+    that failed at the same time don't retry at the same time. Responses with Retry-After longer
+    than retry_after_max are not retried.
+    """
+
+    attempts: int = 3  # including the first one
+    backoff_base: float = 0.1
+    backoff_max: float = 10.0
+    retry_after_max: float = 60.0
+    status_codes: frozenset[int] = RETRIED_STATUS_CODES
+    exceptions: tuple[type[Exception], ...] = (httpx.TransportError,)
+
+    def delay(self, retry: int, response: httpx.Response | None) -> float | None:
+        """Seconds to wait before the retry, None if the request is not retried"""
+        if retry >= self.attempts:
+            return None
+        retry_after = _retry_after(response) if response is not None else None
+        if retry_after is None:
+            return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (retry - 1)))
+        return retry_after if retry_after <= self.retry_after_max else None
+
+
+class RetryBudget:
+    """Limits retries to a share of the requests, so that retries don't multiply the load of a failing server
+
+    Every retried request adds `ratio` tokens, up to `max_tokens`, every retry takes one token.
+    The budget starts full, so that occasional failures are retried when there are few requests.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()  # the sync client may be used from many threads
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds from the Retry-After header, which is either seconds or an HTTP date"""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+def _is_replayable(content: Any, files: Any) -> bool:
+    """Files and iterators are consumed by the first attempt, so such requests can't be retried"""
+    return files is None and (content is None or isinstance(content, (str, bytes)))
+
+
+RESULT_EXTENSION = "pythogen_result"  # holder of the decoded result of a shared response
+_REVALIDATED_HEADERS = ("Cache-Control", "Expires", "Date", "Age", "ETag", "Last-Modified")
+_BODY_ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})  # of the received body
+
+
+def _cache_control(headers: httpx.Headers) -> dict[str, str]:
+    """Directives of the Cache-Control header, e.g. {"max-age": "60", "no-cache": ""}"""
+    directives: dict[str, str] = {}
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.partition("=")
+        if name.strip():
+            directives[name.strip().lower()] = value.strip().strip('"')
+    return directives
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return date.timestamp()
+
+
+def _fresh_until(headers: httpx.Headers) -> float:
+    """Time (time.time()) until which a response may be returned from the cache without revalidation"""
+    now = time.time()
+    cache_control = _cache_control(headers)
+    if "no-cache" in cache_control:
+        return now
+    if "max-age" in cache_control:
+        try:
+            return now + int(cache_control["max-age"]) - int(headers.get("Age", "0"))
+        except ValueError:
+            return now
+    expires = _http_date(headers.get("Expires"))
+    if expires is not None:
+        return now + expires - (_http_date(headers.get("Date")) or now)
+    return now
+
+
+@dataclass
+class CacheEntry:
+    """Response in the cache: the body and, once the response is decoded, the result of the method"""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    fresh_until: float
+    decoded: Any = None
+    is_decoded: bool = False
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "CacheEntry | None":
+        """Entry of the response, None if the response must not be cached"""
+        if response.status_code != 200 or "no-store" in _cache_control(response.headers):
+            return None
+        fresh_until = _fresh_until(response.headers)
+        has_validators = "ETag" in response.headers or "Last-Modified" in response.headers
+        if fresh_until <= time.time() and not has_validators:
+            return None  # it would never be used
+        return cls(response.status_code, _decoded_body_headers(response.headers), response.content, fresh_until)
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+    def validators(self) -> dict[str, str]:
+        """Headers of a conditional request, the server answers 304 if the cached response is still valid"""
+        headers = httpx.Headers(self.headers)
+        validators = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+    def revalidate(self, response: httpx.Response) -> None:
+        """Update the entry with the headers of the 304 response"""
+        headers = httpx.Headers(self.headers)
+        for name in _REVALIDATED_HEADERS:
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        self.headers = headers.multi_items()
+        self.fresh_until = _fresh_until(headers)
+
+    def to_response(self, method: str, url: str, cached: "_CachedResponse") -> httpx.Response:
+        response = httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(method, url),
+            extensions={RESULT_EXTENSION: cached},
+        )
+        response.elapsed = datetime.timedelta(0)
+        return response
+
+
+class CacheBackend(Protocol):
+    """Storage of cached responses, keys are hex digests"""
+
+    def get(self, key: str) -> CacheEntry | None:
+        ...
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+
+class MemoryCache:
+    """Least recently used responses in memory, up to `max_bytes` of bodies
+
+    Decoded results are returned to every caller, they must not be modified.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()  # the sync client may be used from many threads
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._pop(key)
+            if len(entry.content) > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._bytes += len(entry.content)
+            while self._bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.content)
+
+
+class DiskCache:
+    """Responses in the files of a local directory, the least recently used ones are removed beyond `max_bytes`
+
+    Entries are pickled, so only the application must be able to write to the directory.
+    The directory may be shared by the processes of the application.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int = 256 * 2**20) -> None:
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self._bytes = sum(size for _, size, _ in self._files())  # estimate, other processes may change the files
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                entry = pickle.load(file)
+            os.utime(path)  # the modification time is the time of the last use
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self.delete(key)  # written by another version of the client or damaged
+            return None
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            size = file.tell()
+        with self._lock:
+            size -= self._size(path)  # the replaced entry
+            os.replace(tmp_path, path)  # readers never see a partly written file
+            self._bytes += size
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        with self._lock:
+            size = self._size(path)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                return
+            self._bytes -= size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    @staticmethod
+    def _size(path: str) -> int:
+        try:
+            return os.stat(path).st_size
+        except FileNotFoundError:
+            return 0
+
+    def _files(self) -> list[tuple[float, int, str]]:
+        files = []
+        for dir_entry in os.scandir(self.directory):
+            if dir_entry.name.endswith(".pickle"):
+                try:
+                    stat = dir_entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, dir_entry.path))
+        return files
+
+    def _evict(self) -> None:
+        files = sorted(self._files())
+        self._bytes = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if self._bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._bytes -= size
+
+
+@dataclass
+class _CachedResponse:
+    """Result of a cached response, in response.extensions[RESULT_EXTENSION]"""
+
+    backend: CacheBackend
+    key: str
+    entry: CacheEntry
+    without_request: bool = False  # the response is fresh
+
+    def decoded(self, decoder: ResponseDecoder, response: httpx.Response) -> Any:
+        if not self.entry.is_decoded:
+            self.entry.decoded = decoder(response)
+            self.entry.is_decoded = True
+            self.backend.set(self.key, self.entry)
+        return self.entry.decoded
+
+
+class _SharedResponse:
+    """Result of a response that is returned to many coalesced calls, in response.extensions[RESULT_EXTENSION]"""
+
+    without_request = False
+
+    def __init__(self) -> None:
+        self._decoded: Any = None
+        self._is_decoded = False
+
+    def decoded(self, decoder: ResponseDecoder, response: httpx.Response) -> Any:
+        if not self._is_decoded:
+            self._decoded = decoder(response)
+            self._is_decoded = True
+        return self._decoded
+
+
+@dataclass
+class _CoalescedResponse:
+    """Result of a response of a call that was coalesced with another one"""
+
+    shared: "_CachedResponse | _SharedResponse"
+    without_request = True
+
+    def decoded(self, decoder: ResponseDecoder, response: httpx.Response) -> Any:
+        return self.shared.decoded(decoder, response)
+
+
+def _request_key(method: str, url: str, params: Any, headers: Mapping[str, str] | None) -> str:
+    key = repr((method, url, str(httpx.QueryParams(params)), sorted((headers or {}).items())))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _is_shareable_request(kwargs: dict[str, Any]) -> bool:
+    """Responses of requests with a body or a per-call auth are not shared, auth isn't a part of the key"""
+    return kwargs.get("content") is None and kwargs.get("auth") is DEFAULT_AUTH
+
+
+def _decoded_body_headers(headers: httpx.Headers) -> list[tuple[str, str]]:
+    """Headers of a response whose body is already decoded"""
+    return [(name, value) for name, value in headers.multi_items() if name not in _BODY_ENCODING_HEADERS]
+
+
+def _decoded(decoder: ResponseDecoder, response: httpx.Response) -> Any:
+    """Result of the method, shared responses are decoded once"""
+    shared = response.extensions.get(RESULT_EXTENSION)
+    if shared is None:
+        return decoder(response)
+    return shared.decoded(decoder, response)
+
+
+def _without_request(response: httpx.Response) -> bool:
+    """The response was returned from the cache or to a coalesced call, it isn't a request in the metrics"""
+    shared = response.extensions.get(RESULT_EXTENSION)
+    return shared is not None and shared.without_request
+
+
+def _shared_response(response: httpx.Response) -> httpx.Response:
+    """The response, decoded once for all the calls it's returned to"""
+    if RESULT_EXTENSION not in response.extensions:
+        response.extensions[RESULT_EXTENSION] = _SharedResponse()
+    return response
+
+
+def _coalesced_response(response: httpx.Response) -> httpx.Response:
+    """Copy of the shared response for a call that was coalesced with the call that sent the request"""
+    shared = response.extensions[RESULT_EXTENSION]
+    coalesced_response = httpx.Response(
+        response.status_code,
+        headers=_decoded_body_headers(response.headers),
+        content=response.content,
+        request=response.request,
+        extensions={**response.extensions, RESULT_EXTENSION: _CoalescedResponse(shared)},
+    )
+    coalesced_response.elapsed = datetime.timedelta(0)
+    return coalesced_response
+
+
+class CircuitState(str, Enum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+@dataclass
+class CircuitBreakerPolicy:
+    """Circuit breakers of the operations (key="operation") or of the hosts (key="host")
+
+    A circuit opens when at least `failure_rate` of the last `window` calls failed, but not before `min_calls` calls.
+    The calls to an open circuit fail at once with CircuitOpenError. In `open_seconds` the circuit is half-open:
+    `half_open_calls` trial calls are let through, it closes when all of them succeed and opens again when one fails.
+    Failures are exceptions and responses with `failure_status_codes`.
+    """
+
+    failure_rate: float = 0.5
+    window: int = 20
+    min_calls: int = 10
+    open_seconds: float = 30.0
+    half_open_calls: int = 1
+    failure_status_codes: frozenset[int] = frozenset({500, 502, 503, 504})
+    key: Literal["operation", "host"] = "operation"
+
+
+class CircuitOpenError(Exception):
+    """The call was not made, because the circuit of the operation or the host is open"""
+
+    def __init__(self, circuit: str, retry_after: float) -> None:
+        super().__init__(f"Circuit {circuit} is open, retry in {retry_after:.1f}s")
+        self.circuit = circuit
+        self.retry_after = retry_after  # seconds until the circuit is half-open
+
+
+class CircuitBreaker:
+    """Circuit breaker of an operation or a host, see CircuitBreakerPolicy"""
+
+    def __init__(
+        self, circuit: str, policy: CircuitBreakerPolicy, on_state_change: Callable[[str, CircuitState], Any]
+    ) -> None:
+        self.circuit = circuit
+        self.policy = policy
+        self.state = CircuitState.closed
+        self._on_state_change = on_state_change
+        self._failed: deque[bool] = deque(maxlen=policy.window)  # outcomes of the last calls
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0  # in flight
+        self._trial_successes = 0
+        self._lock = threading.Lock()  # the sync client may be used from many threads
+
+    def before_call(self) -> bool:
+        """Let the call through or raise CircuitOpenError, True if it's a trial call of the half-open circuit"""
+        with self._lock:
+            previous_state = self.state
+            if self.state is CircuitState.open:
+                retry_after = self._opened_at + self.policy.open_seconds - time.monotonic()
+                if retry_after > 0:
+                    raise CircuitOpenError(self.circuit, retry_after)
+                self._set_state(CircuitState.half_open)
+            trial = self.state is CircuitState.half_open
+            if trial:
+                if self._trial_calls >= self.policy.half_open_calls:
+                    raise CircuitOpenError(self.circuit, 0.0)
+                self._trial_calls += 1
+            state = self.state
+        if state is not previous_state:
+            self._on_state_change(self.circuit, state)
+        return trial
+
+    def record(self, trial: bool, failed: bool) -> None:
+        with self._lock:
+            previous_state = self.state
+            if trial:
+                self._trial_calls -= 1
+                if self.state is CircuitState.half_open:
+                    if failed:
+                        self._set_state(CircuitState.open)
+                    else:
+                        self._trial_successes += 1
+                        if self._trial_successes >= self.policy.half_open_calls:
+                            self._set_state(CircuitState.closed)
+            elif self.state is CircuitState.closed:
+                if len(self._failed) == self._failed.maxlen:
+                    self._failures -= self._failed[0]
+                self._failed.append(failed)
+                self._failures += failed
+                failure_rate = self._failures / len(self._failed)
+                if len(self._failed) >= self.policy.min_calls and failure_rate >= self.policy.failure_rate:
+                    self._set_state(CircuitState.open)
+            state = self.state
+        if state is not previous_state:
+            self._on_state_change(self.circuit, state)
+
+    def release(self, trial: bool) -> None:
+        """The call ended without a result"""
+        if trial:
+            with self._lock:
+                self._trial_calls -= 1
+
+    def _set_state(self, state: CircuitState) -> None:
+        self.state = state
+        self._failed.clear()
+        self._failures = 0
+        self._trial_successes = 0
+        if state is CircuitState.open:
+            self._opened_at = time.monotonic()
+
+
+RATE_LIMIT_RESET_TIMESTAMP = 10**9  # larger X-RateLimit-Reset values are Unix timestamps, not seconds
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket: `requests` per `period` seconds, in bursts of up to `burst` requests (default: `requests`)"""
+
+    requests: float
+    period: float = 1.0
+    burst: float | None = None
+
+    @property
+    def rate(self) -> float:
+        """Tokens per second"""
+        return self.requests / self.period
+
+    @property
+    def capacity(self) -> float:
+        return self.burst if self.burst is not None else self.requests
+
+
+class TokenBucket:
+    """Rate limiter of the client or of an operation, see RateLimit
+
+    A request takes a token, the tokens may go below zero: the request waits until its token is refilled.
+    So waiting doesn't hold a lock, and the sync and the async client share the limiter.
+    """
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit = limit
+        self._tokens = limit.capacity
+        self._refilled_at = time.monotonic()  # in the future while the server asks to wait
+        self._lock = threading.Lock()  # the sync client may be used from many threads
+
+    def reserve(self) -> float:
+        """Take a token, seconds to wait before the request is sent"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = max(0.0, self._refilled_at - now)
+            if self._tokens < 0:
+                delay += -self._tokens / self.limit.rate
+            return delay
+
+    def update(self, remaining: int, reset: float) -> None:
+        """Follow the quota of the server: `remaining` requests are left until the reset in `reset` seconds"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, remaining)
+            if remaining <= 0:
+                self._refilled_at = max(self._refilled_at, now + reset)
+
+    def _refill(self, now: float) -> None:
+        if now > self._refilled_at:
+            self._tokens = min(self.limit.capacity, self._tokens + (now - self._refilled_at) * self.limit.rate)
+            self._refilled_at = now
+
+
+def _rate_limit_quota(response: httpx.Response) -> tuple[int, float] | None:
+    """Remaining requests and seconds until the reset of the quota of the server
+
+    By the RateLimit-Remaining/RateLimit-Reset or X-RateLimit-Remaining/X-RateLimit-Reset headers,
+    the reset is seconds or a Unix timestamp. 429 Too Many Requests leaves no requests until Retry-After.
+    """
+    quota = None
+    for prefix in ("RateLimit-", "X-RateLimit-"):
+        remaining = response.headers.get(prefix + "Remaining")
+        if remaining is not None:
+            try:
+                reset = float(response.headers.get(prefix + "Reset", 0))
+                quota = int(remaining), reset - time.time() if reset > RATE_LIMIT_RESET_TIMESTAMP else reset
+            except ValueError:
+                pass
+            break
+    if response.status_code == 429:
+        retry_after = _retry_after(response)
+        reset = quota[1] if quota is not None else 0.0
+        quota = 0, max(reset, retry_after or 0.0)
+    return quota
+
+
+def _update_rate_limiters(limiters: list[TokenBucket], response: httpx.Response) -> None:
+    quota = _rate_limit_quota(response)
+    if quota is not None:
+        for limiter in limiters:
+            limiter.update(*quota)
+
+
+@dataclass
+class HedgePolicy:
+    """Hedged requests: if the response doesn't come in `delay` seconds, the request is sent again,
+    the first response is returned and the other request is cancelled
+
+    Without `delay`, it's the `percentile` of the latencies of the last `window` responses of the operation,
+    requests are not hedged until `min_samples` responses are received.
+    """
+
+    delay: float | None = None
+    percentile: float = 0.95
+    window: int = 100
+    min_samples: int = 20
+
+
+class _Latencies:
+    """Latencies of the last responses of an operation"""
+
+    def __init__(self, window: int) -> None:
+        self._seconds: deque[float] = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        self._seconds.append(seconds)
+
+    def percentile(self, policy: HedgePolicy) -> float | None:
+        if len(self._seconds) < policy.min_samples:
+            return None
+        seconds = sorted(self._seconds)
+        return seconds[min(len(seconds) - 1, int(len(seconds) * policy.percentile))]
+
+
+async def _first_response(tasks: list[asyncio.Future]) -> asyncio.Future:
+    """The first task that succeeded, or the first one if all of them failed"""
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in sorted(done, key=tasks.index):
+            if task.exception() is None:
+                return task
+    return tasks[0]
+
+
+def _cancel(tasks: list[asyncio.Future]) -> None:
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()  # the error of the request that lost is not logged as "never retrieved"
+
+
 class RequestBodySerializer(Protocol):
     def __call__(self, v: Any) -> Any:
         ...
 
 
+class OperationMetrics(Protocol):
+    """Metrics of an operation, bound to its labels once, see MetricsIntegration.bind_operation"""
+
+    def on_request_start(self) -> None:
+        ...
+
+    def on_request_end(self) -> None:
+        ...
+
+    def on_request_success(self, response: httpx.Response) -> None:
+        ...
+
+    def on_request_error(self, error: Exception) -> None:
+        ...
+
+
 class MetricsIntegration(Protocol):
+    """Collects the metrics of the requests of the client
+
+    Optional methods, called if the integration defines them:
+
+    bind_operation(client_name, http_method, http_target) -> OperationMetrics | None
+        Called for every operation when the metrics integration is set on the client, if shadow_path() is True.
+        The client calls the methods of the returned OperationMetrics instead of on_request_success and
+        on_request_error, and OperationMetrics.on_request_start/on_request_end around every request it sends.
+        None keeps the methods of the integration.
+    on_request_retry(client_name, http_method, http_target, reason: str, delay: float)
+        Called before every retry.
+    on_request_hedged(client_name, http_method, http_target, won: bool)
+        Called when a hedged request completes, `won` is True if the response of the hedge was the first.
+    on_circuit_state_change(client_name, circuit: str, state: str)
+        Called when a circuit breaker changes its state.
+    on_request_throttled(client_name, http_method, http_target, delay: float)
+        Called when a request waits for the rate limiter.
+    on_cache_lookup(client_name, http_method, http_target, result: str)
+        Called when a response of a GET operation is looked up in the cache, `result` is "hit", "miss"
+        or "revalidated" (the cached response is returned after 304 Not Modified).
+    on_request_coalesced(client_name, http_method, http_target)
+        Called when a call is coalesced with an identical call in flight.
+    """
+
     def on_request_error(
         self,
         client_name: str,
@@ -82,9 +955,29 @@ class DefaultMetricsIntegration:
         self,
         client_response_time_histogram: Histogram | None = None,
         client_non_http_errors_counter: Counter | None = None,
+        client_retries_counter: Counter | None = None,
+        client_retry_delay_histogram: Histogram | None = None,
+        client_hedges_counter: Counter | None = None,
+        client_circuit_state_changes_counter: Counter | None = None,
+        client_cache_lookups_counter: Counter | None = None,
+        client_coalesced_requests_counter: Counter | None = None,
+        client_throttle_delay_histogram: Histogram | None = None,
+        client_request_size_histogram: Histogram | None = None,
+        client_response_size_histogram: Histogram | None = None,
+        client_in_flight_requests_gauge: Gauge | None = None,
     ):
         self._client_response_time_histogram = client_response_time_histogram
         self._client_non_http_errors_counter = client_non_http_errors_counter
+        self._client_retries_counter = client_retries_counter
+        self._client_retry_delay_histogram = client_retry_delay_histogram
+        self._client_hedges_counter = client_hedges_counter
+        self._client_circuit_state_changes_counter = client_circuit_state_changes_counter
+        self._client_cache_lookups_counter = client_cache_lookups_counter
+        self._client_coalesced_requests_counter = client_coalesced_requests_counter
+        self._client_throttle_delay_histogram = client_throttle_delay_histogram
+        self._client_request_size_histogram = client_request_size_histogram
+        self._client_response_size_histogram = client_response_size_histogram
+        self._client_in_flight_requests_gauge = client_in_flight_requests_gauge
 
     def on_request_error(self, client_name: str, error: Exception, http_method: str, http_target: str) -> None:
         self._client_non_http_errors_counter.labels(
@@ -102,11 +995,153 @@ class DefaultMetricsIntegration:
             http_target=http_target,
             http_status_code=response.status_code,
         ).observe(response.elapsed.total_seconds())
+        if self._client_request_size_histogram is not None:
+            request_size = _request_size(response)
+            if request_size is not None:
+                self._client_request_size_histogram.labels(
+                    client_name=client_name,
+                    http_method=http_method,
+                    http_target=http_target,
+                ).observe(request_size)
+        if self._client_response_size_histogram is not None:
+            self._client_response_size_histogram.labels(
+                client_name=client_name,
+                http_method=http_method,
+                http_target=http_target,
+            ).observe(response.num_bytes_downloaded)
+
+    def bind_operation(self, client_name: str, http_method: str, http_target: str) -> "_DefaultOperationMetrics | None":
+        cls = type(self)
+        if (
+            cls.on_request_success is not DefaultMetricsIntegration.on_request_success
+            or cls.on_request_error is not DefaultMetricsIntegration.on_request_error
+        ):
+            return None  # the overriding methods are called on every request
+        return _DefaultOperationMetrics(self, client_name, http_method, http_target)
+
+    def on_request_retry(self, client_name: str, http_method: str, http_target: str, reason: str, delay: float) -> None:
+        if self._client_retries_counter is not None:
+            self._client_retries_counter.labels(
+                client_name=client_name,
+                http_method=http_method,
+                http_target=http_target,
+                reason=reason,
+            ).inc(1)
+        if self._client_retry_delay_histogram is not None:
+            self._client_retry_delay_histogram.labels(
+                client_name=client_name,
+                http_method=http_method,
+                http_target=http_target,
+            ).observe(delay)
+
+    def on_request_hedged(self, client_name: str, http_method: str, http_target: str, won: bool) -> None:
+        if self._client_hedges_counter is not None:
+            self._client_hedges_counter.labels(
+                client_name=client_name,
+                http_method=http_method,
+                http_target=http_target,
+                won=str(won).lower(),
+            ).inc(1)
+
+    def on_circuit_state_change(self, client_name: str, circuit: str, state: str) -> None:
+        if self._client_circuit_state_changes_counter is not None:
+            self._client_circuit_state_changes_counter.labels(
+                client_name=client_name,
+                circuit=circuit,
+                state=state,
+            ).inc(1)
+
+    def on_request_throttled(self, client_name: str, http_method: str, http_target: str, delay: float) -> None:
+        if self._client_throttle_delay_histogram is not None:
+            self._client_throttle_delay_histogram.labels(
+                client_name=client_name,
+                http_method=http_method,
+                http_target=http_target,
+            ).observe(delay)
+
+    def on_cache_lookup(self, client_name: str, http_method: str, http_target: str, result: str) -> None:
+        if self._client_cache_lookups_counter is not None:
+            self._client_cache_lookups_counter.labels(
+                client_name=client_name,
+                http_method=http_method,
+                http_target=http_target,
+                result=result,
+            ).inc(1)
+
+    def on_request_coalesced(self, client_name: str, http_method: str, http_target: str) -> None:
+        if self._client_coalesced_requests_counter is not None:
+            self._client_coalesced_requests_counter.labels(
+                client_name=client_name,
+                http_method=http_method,
+                http_target=http_target,
+            ).inc(1)
 
     def shadow_path(self) -> bool:
         return True
 
 
+class _DefaultOperationMetrics:
+    """Children of the metrics of DefaultMetricsIntegration for an operation
+
+    Looking up a child by its label values takes a lock and a dict lookup, the children of the operation
+    are looked up once, the ones of the status codes and of the exceptions when they are first seen.
+    """
+
+    def __init__(
+        self, integration: DefaultMetricsIntegration, client_name: str, http_method: str, http_target: str
+    ) -> None:
+        self._integration = integration
+        self._labels = {"client_name": client_name, "http_method": http_method, "http_target": http_target}
+        self._response_time: dict[int, Any] = {}  # status code -> child
+        self._non_http_errors: dict[str, Any] = {}  # exception -> child
+        self._request_size = self._child(integration._client_request_size_histogram)
+        self._response_size = self._child(integration._client_response_size_histogram)
+        self._in_flight = self._child(integration._client_in_flight_requests_gauge)
+
+    def _child(self, metric: Any) -> Any:
+        return metric.labels(**self._labels) if metric is not None else None
+
+    def on_request_start(self) -> None:
+        if self._in_flight is not None:
+            self._in_flight.inc()
+
+    def on_request_end(self) -> None:
+        if self._in_flight is not None:
+            self._in_flight.dec()
+
+    def on_request_success(self, response: httpx.Response) -> None:
+        response_time = self._response_time.get(response.status_code)
+        if response_time is None:
+            response_time = self._response_time[
+                response.status_code
+            ] = self._integration._client_response_time_histogram.labels(
+                **self._labels, http_status_code=response.status_code
+            )
+        response_time.observe(response.elapsed.total_seconds())
+        if self._request_size is not None:
+            request_size = _request_size(response)
+            if request_size is not None:
+                self._request_size.observe(request_size)
+        if self._response_size is not None:
+            self._response_size.observe(response.num_bytes_downloaded)
+
+    def on_request_error(self, error: Exception) -> None:
+        exception = error.__class__.__name__
+        non_http_errors = self._non_http_errors.get(exception)
+        if non_http_errors is None:
+            non_http_errors = self._non_http_errors[
+                exception
+            ] = self._integration._client_non_http_errors_counter.labels(**self._labels, exception=exception)
+        non_http_errors.inc(1)
+        raise error
+
+
+def _request_size(response: httpx.Response) -> int | None:
+    """Bytes of the body of the request, None if it was streamed without Content-Length"""
+    content_length = response.request.headers.get("Content-Length")
+    return int(content_length) if content_length is not None else None
+
+
 @dataclass
 class RequestBox:
     client_name: str
@@ -123,6 +1158,14 @@ class ResponseBox:
 
 
 class LogsIntegration(Protocol):
+    """Logs the events of the client
+
+    Optional methods, called if the integration defines them:
+
+    log_circuit_state_change(client_name, circuit: str, state: str)
+        Called when a circuit breaker changes its state.
+    """
+
     def log_extra(self, **kwargs: Any) -> dict[str, Any]:
         ...
 
@@ -172,8 +1215,16 @@ class DefaultLogsIntegration:
         else:
             return logging.INFO
 
+    def log_circuit_state_change(self, client_name: str, circuit: str, state: str) -> None:
+        level = logging.WARNING if state == CircuitState.open else logging.INFO
+        logging.log(
+            level,
+            f"circuit breaker is {state} | client={client_name} | circuit={circuit}",
+            extra=self.log_extra(client=client_name, circuit=circuit, state=state),
+        )
+
 
-FileContent = Union[IO[str], IO[bytes], str, bytes]
+FileContent = Union[IO[str], IO[bytes], str, bytes, Iterable[bytes]]
 FileTypes = Union[
     # file (or text)
     FileContent,
@@ -184,20 +1235,145 @@ FileTypes = Union[
 ]
 
 
+# body of a request: files and iterators are sent in chunks (Transfer-Encoding: chunked, if the size is unknown)
+RequestContent = Union[str, bytes, IO[bytes], Iterable[bytes], AsyncIterable[bytes]]
+
+UPLOAD_CHUNK_SIZE = 65536
+
+
+class _IteratorReader:
+    """File-like reader of a byte iterator, httpx sends multipart file parts only from files
+
+    Chunks are returned as they are produced, httpx doesn't need them to be of the requested size.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+
+    def read(self, size: int = -1) -> bytes:
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+def _streamed_file(content: FileContent) -> FileContent:
+    if isinstance(content, (str, bytes)) or hasattr(content, "read") or not isinstance(content, Iterable):
+        return content
+    return _IteratorReader(content)
+
+
+def _streamed_files(
+    files: Mapping[str, FileTypes] | Sequence[tuple[str, FileTypes]],
+) -> list[tuple[str, FileTypes]]:
+    """Multipart files, where byte iterators are replaced with file-like readers"""
+    streamed_files: list[tuple[str, FileTypes]] = []
+    for name, file in files.items() if isinstance(files, Mapping) else files:
+        if isinstance(file, tuple):
+            file = (file[0], _streamed_file(file[1]), *file[2:])
+        else:
+            file = _streamed_file(file)
+        streamed_files.append((name, file))
+    return streamed_files
+
+
+async def _aiter_chunks(content: IO[bytes] | Iterable[bytes]) -> AsyncIterator[bytes]:
+    if hasattr(content, "read"):
+        while chunk := content.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+    else:
+        for chunk in content:
+            yield chunk
+
+
+def _async_content(content: RequestContent | None) -> RequestContent | None:
+    """httpx.AsyncClient sends files and iterators in chunks only from async iterators"""
+    if content is None or isinstance(content, (str, bytes, AsyncIterable)):
+        return content
+    return _aiter_chunks(content)
+
+
+@dataclass
+class MapResult:
+    """Result of a call of Client.map"""
+
+    index: int  # of the call in the calls
+    kwargs: dict[str, Any]
+    result: Any = None
+    error: Exception | None = None  # raised by the call
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class MapProgress:
+    """Progress of Client.map, updated when a call completes"""
+
+    total: int | None  # None if the calls are an iterator
+    completed: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def calls_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed else 0.0
+
+
+class _MapResults:
+    """Results of the completed calls of Client.map to return, in the order of the calls if `ordered`"""
+
+    def __init__(self, progress: MapProgress, on_progress: Callable[[MapProgress], Any] | None, ordered: bool) -> None:
+        self._progress = progress
+        self._on_progress = on_progress
+        self._ordered = ordered
+        self._waiting: dict[int, MapResult] = {}  # completed before the calls that precede them
+        self._next_index = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of the results that wait for the calls that precede them"""
+        return len(self._waiting)
+
+    def add(self, result: MapResult) -> list[MapResult]:
+        self._progress.completed += 1
+        self._progress.failed += not result.ok
+        if self._on_progress is not None:
+            self._on_progress(self._progress)
+        if not self._ordered:
+            return [result]
+        self._waiting[result.index] = result
+        results = []
+        while self._next_index in self._waiting:
+            results.append(self._waiting.pop(self._next_index))
+            self._next_index += 1
+        return results
+
+
 class RequiredHeaders(Exception):
     ...
 
 
-class StringEnum(str, Enum):
-    """
-    StringEnum
-    """
+class EmptyBody(BaseModel):
+    status_code: int
+    text: str
 
-    FIRST_FIELD = "first-field"
-    SECOND_FIELD = "second field"
 
-    def __str__(self) -> Any:
-        return self.value
+class BasicAuth(BaseModel):
+    username: str
+    password: str
+
+
+class PythogenMetaBox(BaseModel):
+    request: RequestBox | None = None
+    response: ResponseBox | None = None
+    transfer: TransferStats | None = None  # set by download_* methods
 
 
 class IntegerEnum(IntEnum):
@@ -213,144 +1389,175 @@ class IntegerEnum(IntEnum):
     _6 = 6
 
 
-class EmptyBody(BaseModel):
-    status_code: int
-    text: str
-
+class StringEnum(str, Enum):
+    """
+    StringEnum
+    """
 
-class GetMessageHeaders(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
+    FIRST_FIELD = "first-field"
+    SECOND_FIELD = "second field"
 
-    x_auth_token: str = Field(alias="X-Auth-Token")
+    def __str__(self) -> Any:
+        return self.value
 
 
-class GetObjectNoRefSchemaPathParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
+class BaseObjectResp(BaseModel):
+    string_data: str
 
-    object_id: str = Field(alias="object_id")
+    @field_validator("string_data", mode="before")
+    def check(cls, v: str, info: ValidationInfo) -> str:
+        type_hints = get_type_hints(cls)
+        string_data_values: tuple[str] = type_hints["string_data"].__dict__["__args__"]
 
+        if v not in string_data_values:
+            raise ValueError(f"invalid string_data for {cls}")
 
-class GetObjectNoRefSchemaQueryParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
+        return v
 
-    from_: str = Field(alias="from", description="__safety_key__(from_)")
 
-    return_error: str | None = Field(None, alias="return_error")
+class Data(BaseModel):
+    """
+    Data
 
+    """
 
-class GetObjectPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    id: str | None = None
+    data: int | None = None
 
-    object_id: str = Field(alias="object_id")
 
+class Cat(BaseModel):
+    """
+    Cat
+
+    """
 
-class GetObjectQueryParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    name: str | None = None
 
-    from_: str = Field(alias="from", description="__safety_key__(from_)")
 
-    return_error: str | None = Field(None, alias="return_error")
-    ref_string_parameter: str | None = Field(None, alias="ref_string_parameter")
+class AllOfRefObjItem2(BaseModel):
+    """
+    None
 
+    """
 
-class GetEmptyHeaders(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    bark: bool | None = None
+    breed: Literal["Dingo", "Husky", "Retriever", "Shepherd"] | None = None
 
-    first_header: str = Field(alias="first-header")
 
+class AllOfRefObj(
+    Data,
+    Cat,
+):
+    """
+    All Of
+
+    """
 
-class GetNoOperationIdHeaders(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
 
-    first_header: str = Field(alias="first-header")
+    bark: bool | None = None
+    breed: Literal["Dingo", "Husky", "Retriever", "Shepherd"] | None = None
 
+    ...
 
-class GetObjectSlowPathParams(BaseModel):
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
 
-    object_id: str = Field(alias="object_id")
+class AllOfResp(BaseModel):
+    """
+    All Of Resp
 
+    """
 
-class GetObjectSlowQueryParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    all_of: AllOfRefObj | None = None
 
-    return_error: str | None = Field(None, alias="return_error")
 
+class CatWithKind(BaseModel):
+    """
+    Cat
+
+    """
 
-class PutObjectPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    kind: Literal["cat"]
+    name: str
 
-    object_id: str = Field(alias="object_id")
 
+class DogWithKind(BaseModel):
+    """
+    Dog
+
+    """
 
-class PutObjectSlowPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    kind: Literal["dog"]
+    name: str
 
-    object_id: str = Field(alias="object_id")
 
+class DiscriminatedOneOfResp(BaseModel):
+    """
+    All Of Resp
+
+    """
 
-class PatchObjectPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    required_discriminated_animal: CatWithKind | DogWithKind = Field(..., discriminator="kind")
+    discriminated_animal: CatWithKind | DogWithKind | None = Field(None, discriminator="kind")
 
-    object_id: str = Field(alias="object_id")
 
+class Dog(BaseModel):
+    """
+    Dog
+
+    """
 
-class DeleteObjectPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    name: str | None = None
 
-    object_id: str = Field(alias="object_id")
-
-
-class BaseObjectResp(BaseModel):
-    string_data: str
 
-    @field_validator("string_data", mode="before")
-    def check(cls, v: str, info: ValidationInfo) -> str:
-        type_hints = get_type_hints(cls)
-        string_data_values: tuple[str] = type_hints["string_data"].__dict__["__args__"]
+class AnyOfChildItem(RootModel):
+    """
+    AnyOfChildItem
 
-        if v not in string_data_values:
-            raise ValueError(f"invalid string_data for {cls}")
+    """
 
-        return v
+    root: Dog | Cat | int
 
 
-class RequestBodyAnyofRequestBody(RootModel):
+class GetMessageResp(BaseModel):
     """
-    None
+    GetMessageResp
 
     """
 
-    root: Data | PostObjectData
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    title: str | None = None
+    text: str | None = None
 
 
-class GetListObjectsResponse200(BaseModel):
+class TierObj(BaseModel):
     """
     None
 
@@ -359,34 +1566,30 @@ class GetListObjectsResponse200(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    code: str | None = None
+    name: str | None = None
+    priority: int | None = None
 
 
-class RewardsListItem(BaseModel):
+class AnyOfChildObj(RootModel):
     """
     None
 
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
-    pricePlanCode: str = Field(..., alias="pricePlanCode")
-    quantity: float
+    root: GetObjectResp | Cat
 
 
-class GetObjectWithInlineArrayResponse200(BaseModel):
+class AnimalObj(RootModel):
     """
     None
 
     """
 
-    model_config = ConfigDict(
-        populate_by_name=True,  # Addressing by field name, even if there is an alias.
-    )
-    rewards: list[RewardsListItem] | None = None
+    root: Cat | Dog
 
 
-class GetObjectWithArrayResponseResponse200(BaseModel):
+class DictOdArrayOfDictsObjItem0(BaseModel):
     """
     None
 
@@ -397,7 +1600,18 @@ class GetObjectWithArrayResponseResponse200(BaseModel):
     )
 
 
-class GetObjectWithArrayResponseResponse200Item(BaseModel):
+class DictOdArrayOfDictsObj(RootModel):
+    """
+    None
+
+    """
+
+    root: list[dict[Any, Any]] | dict[Any, Any]
+
+
+class PropertyAllOfSimpleStringRefRefObj(
+    str,
+):
     """
     None
 
@@ -406,11 +1620,11 @@ class GetObjectWithArrayResponseResponse200Item(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    pricePlanCode: str = Field(..., alias="pricePlanCode")
-    quantity: float
+
+    ...
 
 
-class GetObjectNoRefSchemaResponse200(BaseModel):
+class GetObjectResp(BaseModel):
     """
     GetObjectResp
 
@@ -419,176 +1633,172 @@ class GetObjectNoRefSchemaResponse200(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    integer_data_all_params: int = Field(..., gt=1, lt=20)
     string_data: str | None = Field(None, description="String Data. [__discriminator__(BaseObjectResp.string_data)]")
     integer_data: int | None = None
-    integer_data_all_params: int | None = Field(None, gt=1, lt=20)
-    integer_data_min_max: int | None = Field(None, ge=1, le=20)
     array_data: list[str] | None = None
+    array_with_anyof: dict | None = None
     boolean_data: bool | None = None
-    array_of_dicts_data: list[dict[Any, Any]] | None = None
+    tier: TierObj | None = None
+    anyOfChild: AnyOfChildObj | None = Field(None, alias="anyOfChild")
+    child: GetObjectResp | None = None
+    childs: list[GetObjectResp] | None = None
+    animal: AnimalObj | None = None
+    dictOdArrayOfDicts: DictOdArrayOfDictsObj | None = Field(None, alias="dictOdArrayOfDicts")
+    integer_data_min_max: int | None = Field(None, ge=1, le=20)
+    propertyAllOfSimpleStringRef: str | None = Field(None, alias="propertyAllOfSimpleStringRef")
 
 
-class IntEnumOrNullObj(RootModel):
+class OptionalAnyofStringDataObj(RootModel):
     """
     None
 
     """
 
-    root: int | None
+    root: str | None
 
 
-class OptionalAnyofStringDataObj(RootModel):
+class IntEnumOrNullObj(RootModel):
     """
     None
 
     """
 
-    root: str | None
+    root: int | None
 
 
-class PropertyAllOfSimpleStringRefRefObj(
-    str,
-):
+class PostObjectData(BaseModel):
     """
-    None
+    PostObjectData
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-
-    ...
-
-
-class DictOdArrayOfDictsObj(RootModel):
-    """
-    None
-
-    """
-
-    root: list[dict[Any, Any]] | dict[Any, Any]
+    string_data: str
+    integer_data: int
+    array_data: list[str]
+    boolean_data: bool
+    event_data: dict = Field(..., alias="event-data", description="__safety_key__(event_data)")
+    optional_anyof_string_data: OptionalAnyofStringDataObj | None = None
+    date_attr: datetime.date | None = None
+    datetime_attr: datetime.datetime | None = None
+    url: HttpUrl | None = None
+    int_enum: IntegerEnum | None = Field(None, description="An enumeration.")
+    str_enum: StringEnum | None = Field(None, description="An enumeration.")
+    int_enum_or_null: IntEnumOrNullObj | None = None
 
 
-class DictOdArrayOfDictsObjItem0(BaseModel):
+class PatchObjectData(BaseModel):
     """
-    None
+    Patch-Object_Data
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
+    id: str
+    data: int
 
 
-class AnimalObj(RootModel):
-    """
-    None
-
-    """
-
-    root: Cat | Dog
-
-
-class AnyOfChildObj(RootModel):
+class PutObjectData(BaseModel):
     """
-    None
+    PutObjectData
 
     """
 
-    root: GetObjectResp | Cat
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    id: str
+    data: int
 
 
-class TierObj(BaseModel):
+class PostFile(BaseModel):
     """
-    None
+    PostFile
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    code: str | None = None
-    name: str | None = None
-    priority: int | None = None
+    text: str
 
 
-class AllOfRefObjItem2(BaseModel):
+class UploadResp(BaseModel):
     """
-    None
+    UploadResp
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    bark: bool | None = None
-    breed: Literal["Dingo", "Husky", "Retriever", "Shepherd"] | None = None
+    size: int
 
 
-class Cat(BaseModel):
+class PostObjectResp(BaseModel):
     """
-    Cat
+    PostObjectResp
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    name: str | None = None
+    status: str | None = None
 
 
-class Data(BaseModel):
+class PatchObjectResp(BaseModel):
     """
-    Data
+    PatchObjectResp
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    id: str | None = None
-    data: int | None = None
+    status: str | None = None
 
 
-class AllOfRefObj(
-    Data,
-    Cat,
-):
+class PutObjectResp(BaseModel):
     """
-    All Of
+    PutObjectResp
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-
-    bark: bool | None = None
-    breed: Literal["Dingo", "Husky", "Retriever", "Shepherd"] | None = None
-
-    ...
+    status: str | None = None
 
 
-class AnyOfChildItem(RootModel):
+class DeleteObjectResp(BaseModel):
     """
-    AnyOfChildItem
+    DeleteObjectResp
 
     """
 
-    root: Dog | Cat | int
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    status: str | None = None
 
 
-class ListAnyOfResp(BaseModel):
+class UnknownError(BaseModel):
     """
-    PostObjectResp
+    UnknownError
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    anyOfChildArray: list[Dog | Cat | int] | None = Field(None, alias="anyOfChildArray")
+    code: str | None = None
+    loc: list[str | int] | None = None
 
 
 class SafetyKeyForTesting(BaseModel):
@@ -613,249 +1823,464 @@ class SafetyKeyForTesting(BaseModel):
     schema_: str | None = Field(None, alias="schema", description='Field named "schema"')
 
 
-class UnknownError(BaseModel):
+class ListAnyOfResp(BaseModel):
     """
-    UnknownError
+    PostObjectResp
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    code: str | None = None
-    loc: list[str | int] | None = None
+    anyOfChildArray: list[Dog | Cat | int] | None = Field(None, alias="anyOfChildArray")
 
 
-class DeleteObjectResp(BaseModel):
+class GetObjectNoRefSchemaResponse200(BaseModel):
     """
-    DeleteObjectResp
+    GetObjectResp
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    status: str | None = None
+    string_data: str | None = Field(None, description="String Data. [__discriminator__(BaseObjectResp.string_data)]")
+    integer_data: int | None = None
+    integer_data_all_params: int | None = Field(None, gt=1, lt=20)
+    integer_data_min_max: int | None = Field(None, ge=1, le=20)
+    array_data: list[str] | None = None
+    boolean_data: bool | None = None
+    array_of_dicts_data: list[dict[Any, Any]] | None = None
 
 
-class PutObjectResp(BaseModel):
+class GetObjectWithArrayResponseResponse200Item(BaseModel):
     """
-    PutObjectResp
+    None
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    status: str | None = None
+    pricePlanCode: str = Field(..., alias="pricePlanCode")
+    quantity: float
 
 
-class PatchObjectResp(BaseModel):
+class GetObjectWithArrayResponseResponse200(BaseModel):
     """
-    PatchObjectResp
+    None
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    status: str | None = None
 
 
-class PostObjectResp(BaseModel):
+class RewardsListItem(BaseModel):
     """
-    PostObjectResp
+    None
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    status: str | None = None
+    pricePlanCode: str = Field(..., alias="pricePlanCode")
+    quantity: float
 
 
-class PostFile(BaseModel):
+class GetObjectWithInlineArrayResponse200(BaseModel):
     """
-    PostFile
+    None
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    text: str
+    rewards: list[RewardsListItem] | None = None
 
 
-class PutObjectData(BaseModel):
+class GetListObjectsResponse200(BaseModel):
     """
-    PutObjectData
+    None
 
     """
 
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    id: str
-    data: int
 
 
-class PatchObjectData(BaseModel):
+class RequestBodyAnyofRequestBody(RootModel):
     """
-    Patch-Object_Data
+    None
 
     """
 
+    root: Data | PostObjectData
+
+
+class GetMessageHeaders(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    id: str
-    data: int
 
+    x_auth_token: str = Field(alias="X-Auth-Token")
 
-class PostObjectData(BaseModel):
-    """
-    PostObjectData
 
-    """
+class GetObjectNoRefSchemaPathParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    object_id: str = Field(alias="object_id")
 
+
+class GetObjectNoRefSchemaQueryParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    string_data: str
-    integer_data: int
-    array_data: list[str]
-    boolean_data: bool
-    event_data: dict = Field(..., alias="event-data", description="__safety_key__(event_data)")
-    optional_anyof_string_data: OptionalAnyofStringDataObj | None = None
-    date_attr: datetime.date | None = None
-    datetime_attr: datetime.datetime | None = None
-    url: HttpUrl | None = None
-    int_enum: IntegerEnum | None = Field(None, description="An enumeration.")
-    str_enum: StringEnum | None = Field(None, description="An enumeration.")
-    int_enum_or_null: IntEnumOrNullObj | None = None
 
+    from_: str = Field(alias="from", description="__safety_key__(from_)")
 
-class GetObjectResp(BaseModel):
-    """
-    GetObjectResp
+    return_error: str | None = Field(None, alias="return_error")
 
-    """
 
+class GetObjectPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    integer_data_all_params: int = Field(..., gt=1, lt=20)
-    string_data: str | None = Field(None, description="String Data. [__discriminator__(BaseObjectResp.string_data)]")
-    integer_data: int | None = None
-    array_data: list[str] | None = None
-    array_with_anyof: dict | None = None
-    boolean_data: bool | None = None
-    tier: TierObj | None = None
-    anyOfChild: AnyOfChildObj | None = Field(None, alias="anyOfChild")
-    child: GetObjectResp | None = None
-    childs: list[GetObjectResp] | None = None
-    animal: AnimalObj | None = None
-    dictOdArrayOfDicts: DictOdArrayOfDictsObj | None = Field(None, alias="dictOdArrayOfDicts")
-    integer_data_min_max: int | None = Field(None, ge=1, le=20)
-    propertyAllOfSimpleStringRef: str | None = Field(None, alias="propertyAllOfSimpleStringRef")
-
 
-class GetMessageResp(BaseModel):
-    """
-    GetMessageResp
+    object_id: str = Field(alias="object_id")
 
-    """
 
+class GetObjectQueryParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    title: str | None = None
-    text: str | None = None
 
+    from_: str = Field(alias="from", description="__safety_key__(from_)")
 
-class Dog(BaseModel):
-    """
-    Dog
+    return_error: str | None = Field(None, alias="return_error")
+    ref_string_parameter: str | None = Field(None, alias="ref_string_parameter")
 
-    """
 
+class GetEmptyHeaders(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    name: str | None = None
-
 
-class DogWithKind(BaseModel):
-    """
-    Dog
+    first_header: str = Field(alias="first-header")
 
-    """
 
+class GetNoOperationIdHeaders(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    kind: Literal["dog"]
-    name: str
 
+    first_header: str = Field(alias="first-header")
 
-class CatWithKind(BaseModel):
-    """
-    Cat
 
-    """
+class GetObjectSlowPathParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    object_id: str = Field(alias="object_id")
+
 
+class GetObjectSlowQueryParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    kind: Literal["cat"]
-    name: str
 
+    return_error: str | None = Field(None, alias="return_error")
 
-class DiscriminatedOneOfResp(BaseModel):
-    """
-    All Of Resp
 
-    """
+class PutObjectPathParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    object_id: str = Field(alias="object_id")
 
+
+class PutObjectSlowPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    required_discriminated_animal: CatWithKind | DogWithKind = Field(..., discriminator="kind")
-    discriminated_animal: CatWithKind | DogWithKind | None = Field(None, discriminator="kind")
 
+    object_id: str = Field(alias="object_id")
 
-class AllOfResp(BaseModel):
-    """
-    All Of Resp
 
-    """
+class PatchObjectPathParams(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    object_id: str = Field(alias="object_id")
+
 
+class DeleteObjectPathParams(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,  # Addressing by field name, even if there is an alias.
     )
-    all_of: AllOfRefObj | None = None
 
+    object_id: str = Field(alias="object_id")
 
-class BasicAuth(BaseModel):
-    username: str
-    password: str
 
+GET_MESSAGE_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: GetMessageResp.model_validate_json(response.content),
+}
 
-class PythogenMetaBox(BaseModel):
-    request: RequestBox | None = None
-    response: ResponseBox | None = None
+GET_OBJECT_NO_REF_SCHEMA_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: GetObjectNoRefSchemaResponse200.model_validate_json(response.content),
+}
+
+GET_EMPTY_OBJECT_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: response.json(),
+}
+
+GET_OBJECT_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: GetObjectResp.model_validate_json(response.content),
+    500: lambda response: UnknownError.model_validate_json(response.content),
+}
+
+GET_OBJECT_WITH_ARRAY_RESPONSE_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: _list_adapter(GetObjectWithArrayResponseResponse200Item).validate_json(response.content),
+}
+
+GET_OBJECT_WITH_INLINE_ARRAY_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: GetObjectWithInlineArrayResponse200.model_validate_json(response.content),
+}
+
+GET_LIST_OBJECTS_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: _list_adapter(GetObjectResp).validate_json(response.content),
+}
+
+GET_TEXT_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: response.text,
+}
+
+GET_TEXT_AS_INTEGER_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: int(response.text),
+}
+
+GET_EMPTY_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+GET_NO_OPERATION_ID_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: EmptyBody(status_code=response.status_code, text=response.text),
+}
+
+GET_BINARY_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: response.content,
+}
+
+GET_ALLOF_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: AllOfResp.model_validate_json(response.content),
+}
+
+GET_DISCRIMINATED_ONEOF_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: DiscriminatedOneOfResp.model_validate_json(response.content),
+}
+
+GET_OBJECT_SLOW_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: GetObjectResp.model_validate_json(response.content),
+    500: lambda response: UnknownError.model_validate_json(response.content),
+}
+
+RESPONSE_BODY_LIST_OF_ANYOF_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: ListAnyOfResp.model_validate_json(response.content),
+}
+
+POST_OBJECT_WITHOUT_BODY_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: PostObjectResp.model_validate_json(response.content),
+}
+
+POST_OBJECT_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: PostObjectResp.model_validate_json(response.content),
+}
+
+POST_FORM_OBJECT_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: PostObjectResp.model_validate_json(response.content),
+}
+
+POST_MULTIPART_FORM_DATA_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: PostObjectResp.model_validate_json(response.content),
+}
+
+UPLOAD_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: UploadResp.model_validate_json(response.content),
+}
+
+UPLOAD_MULTIPART_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: UploadResp.model_validate_json(response.content),
+}
+
+REQUEST_BODY_ANYOF_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: PostObjectResp.model_validate_json(response.content),
+}
+
+PUT_OBJECT_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: PutObjectResp.model_validate_json(response.content),
+}
+
+PUT_OBJECT_SLOW_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: PutObjectResp.model_validate_json(response.content),
+}
+
+PATCH_OBJECT_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: PatchObjectResp.model_validate_json(response.content),
+}
+
+DELETE_OBJECT_DECODERS: dict[int, ResponseDecoder] = {
+    200: lambda response: DeleteObjectResp.model_validate_json(response.content),
+}
+
+
+OPERATION_TARGETS: dict[str, tuple[str, str]] = {
+    "getMessage": ("get", "/messages"),
+    "get_object_no_ref_schema": ("get", "/objects/no-ref-schema/:object_id"),
+    "get_empty_object": ("get", "/get-empty-object"),
+    "get_object": ("get", "/objects/:object_id"),
+    "get_object_with_array_response": ("get", "/object-with-array-response"),
+    "get_object_with_inline_array": ("get", "/object-with-inline-array"),
+    "get_list_objects": ("get", "/objects"),
+    "get_text": ("get", "/text"),
+    "get_text_as_integer": ("get", "/text_as_integer"),
+    "get_empty": ("get", "/empty"),
+    "get_no_operation_id": ("get", "/no-operation-id"),
+    "get_binary": ("get", "/binary"),
+    "get_allof": ("get", "/allof"),
+    "get_discriminated_oneof": ("get", "/discriminated-oneof"),
+    "get_object_slow": ("get", "/slow/objects/:object_id"),
+    "response_body_list_of_anyof": ("get", "/nested-any-of"),
+    "post_object_without_body": ("post", "/post-without-body"),
+    "post_object": ("post", "/objects"),
+    "post_form_object": ("post", "/objects-form-data"),
+    "post_multipart_form_data": ("post", "/multipart-form-data"),
+    "upload": ("post", "/upload"),
+    "upload_multipart": ("post", "/upload-multipart"),
+    "request_body_anyof": ("post", "/request-body-anyof"),
+    "put_object": ("put", "/objects/:object_id"),
+    "put_object_slow": ("put", "/slow/objects/:object_id"),
+    "patch_object": ("patch", "/objects/:object_id"),
+    "delete_object": ("delete", "/objects/:object_id"),
+}
+
+
+IDEMPOTENT_OPERATIONS: frozenset[str] = frozenset(
+    {
+        "getMessage",
+        "get_object_no_ref_schema",
+        "get_empty_object",
+        "get_object",
+        "get_object_with_array_response",
+        "get_object_with_inline_array",
+        "get_list_objects",
+        "get_text",
+        "get_text_as_integer",
+        "get_empty",
+        "get_no_operation_id",
+        "get_binary",
+        "get_allof",
+        "get_discriminated_oneof",
+        "get_object_slow",
+        "response_body_list_of_anyof",
+        "post_object_without_body",
+        "put_object",
+        "delete_object",
+    }
+)
+
+
+CACHEABLE_OPERATIONS: frozenset[str] = frozenset(
+    {
+        "getMessage",
+        "get_object_no_ref_schema",
+        "get_empty_object",
+        "get_object",
+        "get_object_with_array_response",
+        "get_object_with_inline_array",
+        "get_list_objects",
+        "get_text",
+        "get_text_as_integer",
+        "get_empty",
+        "get_no_operation_id",
+        "get_binary",
+        "get_allof",
+        "get_discriminated_oneof",
+        "get_object_slow",
+        "response_body_list_of_anyof",
+    }
+)
+
+
+RATE_LIMITS: dict[str, RateLimit] = {
+    "get_object_slow": RateLimit(
+        requests=100,
+        period=60,
+        burst=10,
+    ),
+}
+
+
+SAFE_OPERATIONS: frozenset[str] = frozenset(
+    {
+        "getMessage",
+        "get_object_no_ref_schema",
+        "get_empty_object",
+        "get_object",
+        "get_object_with_array_response",
+        "get_object_with_inline_array",
+        "get_list_objects",
+        "get_text",
+        "get_text_as_integer",
+        "get_empty",
+        "get_no_operation_id",
+        "get_binary",
+        "get_allof",
+        "get_discriminated_oneof",
+        "get_object_slow",
+        "response_body_list_of_anyof",
+    }
+)
 
 
 class Client:
     def __init__(
         self,
         base_url: str,
-        timeout: int = 5,
+        timeout: float | Timeout = 5,
         client_name: str = "",
         client: httpx.AsyncClient | None = None,
         headers: dict[str, str] | None = None,
         metrics_integration: MetricsIntegration | None = None,
         logs_integration: LogsIntegration | None = DefaultLogsIntegration(),
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        limits: httpx.Limits | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        idempotent_operations: Iterable[str] = (),
+        hedge_policy: HedgePolicy | None = None,
+        hedge_policies: Mapping[str, HedgePolicy | None] | None = None,
+        hedge_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        rate_limits: Mapping[str, RateLimit | None] | None = None,
+        response_cache: CacheBackend | None = None,
+        cached_operations: Iterable[str] | None = None,
+        coalesce_requests: bool = False,
+        coalesced_operations: Iterable[str] | None = None,
     ):
         """
         Parameters
@@ -863,7 +2288,7 @@ class Client:
         base_url
             Base URL
         timeout
-            In seconds
+            In seconds, or httpx.Timeout
         client_name
             Used in metrics
         client
@@ -874,19 +2299,111 @@ class Client:
             The object that is responsible for collecting and sending metrics
         logs_integration
             The object that is responsible for logging events
+        connect_timeout, read_timeout, write_timeout, pool_timeout
+            In seconds, override the parts of the timeout
+        limits
+            Limits of the connection pool, default: httpx.Limits()
+        keepalive_expiry
+            In seconds, overrides limits.keepalive_expiry
+        http2
+            Use HTTP/2 when the server supports it, needs `pip install httpx[http2]`
+
+        retry_policy
+            Retries of idempotent operations, requests are not retried by default
+        retry_budget
+            Limits retries of all the operations of the client, default: RetryBudget()
+        idempotent_operations
+            Names of the methods of the operations that are retried besides GET, PUT, DELETE
+            and the ones marked with `x-idempotent: true`
+        hedge_policy
+            Hedged requests of safe operations (GET), requests are not hedged by default
+        hedge_policies
+            Names of the methods of operations -> hedge policies that override `hedge_policy`, None turns hedging off
+        hedge_budget
+            Limits hedged requests of all the operations of the client, default: RetryBudget()
+        circuit_breaker
+            Circuit breakers of the operations or of the hosts, calls are not limited by default
+        rate_limit
+            Rate limit of all the requests of the client, requests are not limited by default
+        rate_limits
+            Names of the methods of operations -> rate limits that override the `x-rate-limit` extensions,
+            None turns the limit of the operation off
+        response_cache
+            Cache of the responses of GET operations, e.g. MemoryCache() or DiskCache(directory),
+            responses are not cached by default
+        cached_operations
+            Names of the methods of the GET operations whose responses are cached, default: all of them
+        coalesce_requests
+            Identical concurrent calls of safe operations (GET) share one request and its result,
+            calls are not coalesced by default
+        coalesced_operations
+            Names of the methods of the safe operations whose calls are coalesced, default: all of them
+
+        Timeouts, limits and http2 configure the httpx-client that is created when `client` is not passed.
         """
-        self.client = client or httpx.AsyncClient(timeout=Timeout(timeout))
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=_timeout(timeout, connect_timeout, read_timeout, write_timeout, pool_timeout),
+                limits=_limits(limits, keepalive_expiry),
+                http2=http2,
+            )
+        self.client = client
         self.base_url = base_url
         self.headers = headers or {}
+        self.client_name = client_name
         self.metrics_integration = metrics_integration
         self.logs_integration = logs_integration
-        self.client_name = client_name
+        self.retry_policy = retry_policy
+        self.retry_budget = retry_budget or RetryBudget()
+        self._retried_operations = IDEMPOTENT_OPERATIONS | frozenset(idempotent_operations)
+        hedge_policies_ = dict.fromkeys(SAFE_OPERATIONS, hedge_policy) if hedge_policy else {}
+        hedge_policies_.update(hedge_policies or {})
+        self._hedge_policies = {fn_name: policy for fn_name, policy in hedge_policies_.items() if policy is not None}
+        self.hedge_budget = hedge_budget or RetryBudget()
+        self._latencies: dict[str, _Latencies] = {}
+        self.circuit_breaker_policy = circuit_breaker
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self.rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+        rate_limits_ = {**RATE_LIMITS, **(rate_limits or {})}
+        self._rate_limiters = {
+            fn_name: TokenBucket(limit) for fn_name, limit in rate_limits_.items() if limit is not None
+        }
+        self.response_cache = response_cache
+        if cached_operations is None:
+            self._cached_operations = CACHEABLE_OPERATIONS
+        else:
+            self._cached_operations = CACHEABLE_OPERATIONS & frozenset(cached_operations)
+        if not coalesce_requests:
+            self._coalesced_operations: frozenset[str] = frozenset()
+        elif coalesced_operations is None:
+            self._coalesced_operations = SAFE_OPERATIONS
+        else:
+            self._coalesced_operations = SAFE_OPERATIONS & frozenset(coalesced_operations)
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    @property
+    def metrics_integration(self) -> MetricsIntegration | None:
+        return self._metrics_integration
+
+    @metrics_integration.setter
+    def metrics_integration(self, metrics_integration: MetricsIntegration | None) -> None:
+        """Ask for the shadow path and bind the metrics of the operations once, not on every request"""
+        self._metrics_integration = metrics_integration
+        self._shadow_path = bool(metrics_integration) and metrics_integration.shadow_path()
+        self._operation_metrics: dict[str, OperationMetrics] = {}
+        bind_operation = getattr(metrics_integration, "bind_operation", None)
+        if bind_operation is None or not self._shadow_path:
+            return
+        for fn_name, (http_method, http_target) in OPERATION_TARGETS.items():
+            operation_metrics = bind_operation(self.client_name, http_method, http_target)
+            if operation_metrics is not None:
+                self._operation_metrics[fn_name] = operation_metrics
 
     async def getMessage(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         headers: GetMessageHeaders | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> GetMessageResp | None:
@@ -905,7 +2422,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if isinstance(headers, GetMessageHeaders):
             headers_ = headers.model_dump(by_alias=True, exclude_none=True)
@@ -919,46 +2436,48 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "getMessage",
+                method,
+                url,
+                path,
+                "/messages",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/messages"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("getMessage", method, path, "/messages", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/messages"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("getMessage", method, path, "/messages", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return GetMessageResp.model_validate(response.json())
+        decoder = GET_MESSAGE_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
 
     async def get_object_no_ref_schema(
         self,
@@ -966,7 +2485,7 @@ class Client:
         path_params: GetObjectNoRefSchemaPathParams | dict[str, Any],
         query_params: GetObjectNoRefSchemaQueryParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> GetObjectNoRefSchemaResponse200 | None:
         """
@@ -990,7 +2509,7 @@ class Client:
         else:
             params = query_params
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -999,52 +2518,58 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_object_no_ref_schema",
+                method,
+                url,
+                path,
+                "/objects/no-ref-schema/:object_id",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/objects/no-ref-schema/:object_id"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error(
+                    "get_object_no_ref_schema", method, path, "/objects/no-ref-schema/:object_id", exc
+                )
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/objects/no-ref-schema/:object_id"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success(
+                "get_object_no_ref_schema", method, path, "/objects/no-ref-schema/:object_id", response
+            )
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return GetObjectNoRefSchemaResponse200.model_validate(response.json())
+        decoder = GET_OBJECT_NO_REF_SCHEMA_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
 
     async def get_empty_object(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> dict[Any, Any] | None:
         """
@@ -1062,7 +2587,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1071,46 +2596,48 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_empty_object",
+                method,
+                url,
+                path,
+                "/get-empty-object",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/get-empty-object"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("get_empty_object", method, path, "/get-empty-object", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/get-empty-object"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("get_empty_object", method, path, "/get-empty-object", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return response.json()
+        decoder = GET_EMPTY_OBJECT_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
 
     async def get_object(
         self,
@@ -1118,7 +2645,7 @@ class Client:
         path_params: GetObjectPathParams | dict[str, Any],
         query_params: GetObjectQueryParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> GetObjectResp | UnknownError:
         """
@@ -1142,7 +2669,7 @@ class Client:
         else:
             params = query_params
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1151,63 +2678,58 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_object",
+                method,
+                url,
+                path,
+                "/objects/:object_id",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/objects/:object_id"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("get_object", method, path, "/objects/:object_id", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/objects/:object_id"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("get_object", method, path, "/objects/:object_id", response)
 
-        if response.status_code == 200:
-            return GetObjectResp.model_validate(response.json())
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 500:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = GET_OBJECT_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return UnknownError.model_validate(response.json())
+        return _decoded(decoder, response)
 
     async def get_object_with_array_response(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> list[GetObjectWithArrayResponseResponse200Item] | None:
         """
@@ -1225,7 +2747,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1234,52 +2756,149 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_object_with_array_response",
+                method,
+                url,
+                path,
+                "/object-with-array-response",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/object-with-array-response"
+                self._report_request_error(
+                    "get_object_with_array_response", method, path, "/object-with-array-response", exc
+                )
+
+            raise exc
+
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success(
+                "get_object_with_array_response", method, path, "/object-with-array-response", response
+            )
+
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            meta.request = req
+            meta.response = resp
+
+        decoder = GET_OBJECT_WITH_ARRAY_RESPONSE_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
+
+    async def stream_get_object_with_array_response(
+        self,
+        *,
+        auth: BasicAuth | None = None,
+        content: RequestContent | None = None,
+        meta: PythogenMetaBox | None = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[GetObjectWithArrayResponseResponse200Item]:
+        """
+        GET /object-with-array-response
+        Operation ID: get_object_with_array_response
+        Summary:      Get Object With Inline Array
+        Description:  None
+
+        Streaming variant of get_object_with_array_response: items of the array in the 200 response
+        are yielded one by one as they are received, the whole response is never loaded
+        into memory. Other responses raise UnexpectedResponse.
+        """
+
+        method = "get"
+
+        path = "/object-with-array-response"
+
+        url = f"{self.base_url}{path}"
+
+        params = None
+
+        headers_ = self.headers
+
+        if auth is None:
+            auth_ = DEFAULT_AUTH
+        elif isinstance(auth, httpx.Auth):
+            auth_ = auth
+        else:
+            auth_ = (auth.username, auth.password)
+
+        content = _async_content(content)
+
+        metrics_path = "/object-with-array-response"
+        try:
+            async with self._stream(
+                "get_object_with_array_response",
+                method,
+                url,
+                path,
+                metrics_path,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            ) as response:
+                if response.status_code == 200:
+                    array_items = _JsonArrayItems()
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        for item in array_items.feed(chunk):
+                            yield GetObjectWithArrayResponseResponse200Item.model_validate(item)
+                    array_items.close()
                 else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                    await response.aread()
+        except Exception as exc:
+            if self.metrics_integration:
+                self._report_request_error("get_object_with_array_response", method, path, metrics_path, exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/object-with-array-response"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+            self._report_request_success("get_object_with_array_response", method, path, metrics_path, response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if meta:
-            meta.request = req
-            meta.response = resp
+        if response.status_code != 200:
+            if self.logs_integration and response.status_code >= 400:
+                self.logs_integration.log_error(req, resp)
 
-        if response.status_code == 200:
-            return [GetObjectWithArrayResponseResponse200Item.model_validate(item) for item in response.json()]
+            decoder = GET_OBJECT_WITH_ARRAY_RESPONSE_DECODERS.get(response.status_code)
+            raise UnexpectedResponse(response.status_code, decoder(response) if decoder is not None else None)
 
     async def get_object_with_inline_array(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> GetObjectWithInlineArrayResponse200 | None:
         """
@@ -1297,7 +2916,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1306,52 +2925,58 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_object_with_inline_array",
+                method,
+                url,
+                path,
+                "/object-with-inline-array",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/object-with-inline-array"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error(
+                    "get_object_with_inline_array", method, path, "/object-with-inline-array", exc
+                )
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/object-with-inline-array"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success(
+                "get_object_with_inline_array", method, path, "/object-with-inline-array", response
+            )
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return GetObjectWithInlineArrayResponse200.model_validate(response.json())
+        decoder = GET_OBJECT_WITH_INLINE_ARRAY_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
 
     async def get_list_objects(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> list[GetObjectResp] | None:
         """
@@ -1369,7 +2994,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1378,52 +3003,145 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_list_objects",
+                method,
+                url,
+                path,
+                "/objects",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/objects"
+                self._report_request_error("get_list_objects", method, path, "/objects", exc)
+
+            raise exc
+
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("get_list_objects", method, path, "/objects", response)
+
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            meta.request = req
+            meta.response = resp
+
+        decoder = GET_LIST_OBJECTS_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
+
+    async def stream_get_list_objects(
+        self,
+        *,
+        auth: BasicAuth | None = None,
+        content: RequestContent | None = None,
+        meta: PythogenMetaBox | None = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[GetObjectResp]:
+        """
+        GET /objects
+        Operation ID: get_list_objects
+        Summary:      Get list objects
+        Description:  None
+
+        Streaming variant of get_list_objects: items of the array in the 200 response
+        are yielded one by one as they are received, the whole response is never loaded
+        into memory. Other responses raise UnexpectedResponse.
+        """
+
+        method = "get"
+
+        path = "/objects"
+
+        url = f"{self.base_url}{path}"
+
+        params = None
+
+        headers_ = self.headers
+
+        if auth is None:
+            auth_ = DEFAULT_AUTH
+        elif isinstance(auth, httpx.Auth):
+            auth_ = auth
+        else:
+            auth_ = (auth.username, auth.password)
+
+        content = _async_content(content)
+
+        metrics_path = "/objects"
+        try:
+            async with self._stream(
+                "get_list_objects",
+                method,
+                url,
+                path,
+                metrics_path,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            ) as response:
+                if response.status_code == 200:
+                    array_items = _JsonArrayItems()
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        for item in array_items.feed(chunk):
+                            yield GetObjectResp.model_validate(item)
+                    array_items.close()
                 else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                    await response.aread()
+        except Exception as exc:
+            if self.metrics_integration:
+                self._report_request_error("get_list_objects", method, path, metrics_path, exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/objects"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+            self._report_request_success("get_list_objects", method, path, metrics_path, response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if meta:
-            meta.request = req
-            meta.response = resp
+        if response.status_code != 200:
+            if self.logs_integration and response.status_code >= 400:
+                self.logs_integration.log_error(req, resp)
 
-        if response.status_code == 200:
-            return [GetObjectResp.model_validate(item) for item in response.json()]
+            decoder = GET_LIST_OBJECTS_DECODERS.get(response.status_code)
+            raise UnexpectedResponse(response.status_code, decoder(response) if decoder is not None else None)
 
     async def get_text(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> str | None:
         """
@@ -1441,7 +3159,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1450,52 +3168,46 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_text", method, url, path, "/text", headers=headers_, params=params, content=content, auth=auth_
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/text"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("get_text", method, path, "/text", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/text"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("get_text", method, path, "/text", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return response.text
+        decoder = GET_TEXT_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
 
     async def get_text_as_integer(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> int | None:
         """
@@ -1513,7 +3225,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1522,73 +3234,147 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_text_as_integer",
+                method,
+                url,
+                path,
+                "/text_as_integer",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/text_as_integer"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("get_text_as_integer", method, path, "/text_as_integer", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/text_as_integer"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("get_text_as_integer", method, path, "/text_as_integer", response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            meta.request = req
+            meta.response = resp
+
+        decoder = GET_TEXT_AS_INTEGER_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
+
+    async def get_empty(
+        self,
+        *,
+        auth: BasicAuth | None = None,
+        content: RequestContent | None = None,
+        headers: GetEmptyHeaders | dict[str, Any] | None = None,
+        meta: PythogenMetaBox | None = None,
+    ) -> EmptyBody | None:
+        """
+        GET /empty
+        Operation ID: get_empty
+        Summary:      Get Empty
+        Description:  None
+        """
+
+        method = "get"
 
-        if meta:
+        path = "/empty"
+
+        url = f"{self.base_url}{path}"
+
+        params = None
+
+        headers_ = self.headers
+
+        if isinstance(headers, GetEmptyHeaders):
+            headers_ = headers.model_dump(by_alias=True, exclude_none=True)
+        elif isinstance(headers, dict):
+            headers_ = headers
+
+        if auth is None:
+            auth_ = DEFAULT_AUTH
+        elif isinstance(auth, httpx.Auth):
+            auth_ = auth
+        else:
+            auth_ = (auth.username, auth.password)
+
+        content = _async_content(content)
+        try:
+            response = await self._request(
+                "get_empty", method, url, path, "/empty", headers=headers_, params=params, content=content, auth=auth_
+            )
+        except Exception as exc:
+            if self.metrics_integration:
+                self._report_request_error("get_empty", method, path, "/empty", exc)
+
+            raise exc
+
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("get_empty", method, path, "/empty", response)
+
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return int(response.text)
+        decoder = GET_EMPTY_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-    async def get_empty(
+        return _decoded(decoder, response)
+
+    async def get_no_operation_id(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
-        headers: GetEmptyHeaders | dict[str, Any] | None = None,
+        content: RequestContent | None = None,
+        headers: GetNoOperationIdHeaders | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> EmptyBody | None:
         """
-        GET /empty
-        Operation ID: get_empty
-        Summary:      Get Empty
+        GET /no-operation-id
+        Operation ID: None
+        Summary:      No operation ID
         Description:  None
         """
 
         method = "get"
 
-        path = "/empty"
+        path = "/no-operation-id"
 
         url = f"{self.base_url}{path}"
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
-        if isinstance(headers, GetEmptyHeaders):
+        if isinstance(headers, GetNoOperationIdHeaders):
             headers_ = headers.model_dump(by_alias=True, exclude_none=True)
         elif isinstance(headers, dict):
             headers_ = headers
@@ -1600,76 +3386,72 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_no_operation_id",
+                method,
+                url,
+                path,
+                "/no-operation-id",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/empty"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("get_no_operation_id", method, path, "/no-operation-id", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/empty"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("get_no_operation_id", method, path, "/no-operation-id", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        decoder = GET_NO_OPERATION_ID_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-    async def get_no_operation_id(
+        return _decoded(decoder, response)
+
+    async def get_binary(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
-        headers: GetNoOperationIdHeaders | dict[str, Any] | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
-    ) -> EmptyBody | None:
+    ) -> bytes | None:
         """
-        GET /no-operation-id
-        Operation ID: None
-        Summary:      No operation ID
+        GET /binary
+        Operation ID: get_binary
+        Summary:      Get Binary
         Description:  None
         """
 
         method = "get"
 
-        path = "/no-operation-id"
+        path = "/binary"
 
         url = f"{self.base_url}{path}"
 
         params = None
 
-        headers_ = self.headers.copy()
-
-        if isinstance(headers, GetNoOperationIdHeaders):
-            headers_ = headers.model_dump(by_alias=True, exclude_none=True)
-        elif isinstance(headers, dict):
-            headers_ = headers
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1678,59 +3460,60 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_binary", method, url, path, "/binary", headers=headers_, params=params, content=content, auth=auth_
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/no-operation-id"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("get_binary", method, path, "/binary", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/no-operation-id"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("get_binary", method, path, "/binary", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return EmptyBody(status_code=response.status_code, text=response.text)
+        decoder = GET_BINARY_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-    async def get_binary(
+        return _decoded(decoder, response)
+
+    async def download_get_binary(
         self,
         *,
+        destination: DownloadDestination,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
-    ) -> bytes | None:
+        chunk_size: int = 65536,
+    ) -> TransferStats:
         """
         GET /binary
         Operation ID: get_binary
         Summary:      Get Binary
         Description:  None
+
+        Streaming variant of get_binary: the 200 response is written to the destination
+        (path of a file, writable binary file or callback, maybe async) in chunks,
+        the whole response is never loaded into memory. Other responses raise UnexpectedResponse.
+        Returns the number of transferred bytes and the throughput, which are also set to meta.transfer.
         """
 
         method = "get"
@@ -1741,7 +3524,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1750,52 +3533,74 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
+
+        metrics_path = "/binary"
+        transfer = TransferStats()
+        started_at = time.perf_counter()
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
-            )
+            async with self._stream(
+                "get_binary",
+                method,
+                url,
+                path,
+                metrics_path,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            ) as response:
+                if response.status_code == 200:
+                    with _open_destination(destination) as write:
+                        async for chunk in response.aiter_bytes(chunk_size):
+                            written = write(chunk)
+                            if inspect.isawaitable(written):
+                                await written
+                    transfer.bytes_transferred = response.num_bytes_downloaded
+                    transfer.seconds = time.perf_counter() - started_at
+                    if meta is not None:
+                        meta.transfer = transfer
+                else:
+                    await response.aread()
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/binary"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("get_binary", method, path, metrics_path, exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/binary"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+            self._report_request_success("get_binary", method, path, metrics_path, response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if meta:
-            meta.request = req
-            meta.response = resp
+        if response.status_code != 200:
+            if self.logs_integration and response.status_code >= 400:
+                self.logs_integration.log_error(req, resp)
+
+            decoder = GET_BINARY_DECODERS.get(response.status_code)
+            raise UnexpectedResponse(response.status_code, decoder(response) if decoder is not None else None)
 
-        if response.status_code == 200:
-            return response.content
+        return transfer
 
     async def get_allof(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> AllOfResp | None:
         """
@@ -1813,7 +3618,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1822,52 +3627,46 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_allof", method, url, path, "/allof", headers=headers_, params=params, content=content, auth=auth_
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/allof"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("get_allof", method, path, "/allof", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/allof"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("get_allof", method, path, "/allof", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return AllOfResp.model_validate(response.json())
+        decoder = GET_ALLOF_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
 
     async def get_discriminated_oneof(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> DiscriminatedOneOfResp | None:
         """
@@ -1885,7 +3684,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1894,46 +3693,48 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_discriminated_oneof",
+                method,
+                url,
+                path,
+                "/discriminated-oneof",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/discriminated-oneof"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("get_discriminated_oneof", method, path, "/discriminated-oneof", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/discriminated-oneof"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("get_discriminated_oneof", method, path, "/discriminated-oneof", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return DiscriminatedOneOfResp.model_validate(response.json())
+        decoder = GET_DISCRIMINATED_ONEOF_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
 
     async def get_object_slow(
         self,
@@ -1941,7 +3742,7 @@ class Client:
         path_params: GetObjectSlowPathParams | dict[str, Any],
         query_params: GetObjectSlowQueryParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> GetObjectResp | UnknownError:
         """
@@ -1965,7 +3766,7 @@ class Client:
         else:
             params = query_params
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -1974,63 +3775,58 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "get_object_slow",
+                method,
+                url,
+                path,
+                "/slow/objects/:object_id",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/slow/objects/:object_id"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("get_object_slow", method, path, "/slow/objects/:object_id", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/slow/objects/:object_id"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
-            meta.request = req
-            meta.response = resp
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("get_object_slow", method, path, "/slow/objects/:object_id", response)
 
-        if response.status_code == 200:
-            return GetObjectResp.model_validate(response.json())
+        if meta is not None or (self.logs_integration and response.status_code >= 400):
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            if meta is not None:
+                meta.request = req
+                meta.response = resp
 
-        if response.status_code == 500:
-            if response.content is None:
-                content = None
-            else:
-                content = response.content[:500]
+        decoder = GET_OBJECT_SLOW_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-            if self.logs_integration:
-                self.logs_integration.log_error(req, resp)
+        if self.logs_integration and response.status_code >= 400:
+            self.logs_integration.log_error(req, resp)
 
-            return UnknownError.model_validate(response.json())
+        return _decoded(decoder, response)
 
     async def response_body_list_of_anyof(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> ListAnyOfResp | None:
         """
@@ -2048,7 +3844,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2057,52 +3853,54 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "response_body_list_of_anyof",
+                method,
+                url,
+                path,
+                "/nested-any-of",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/nested-any-of"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("response_body_list_of_anyof", method, path, "/nested-any-of", exc)
 
             raise exc
 
-        if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/nested-any-of"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+        if self.metrics_integration and not _without_request(response):
+            self._report_request_success("response_body_list_of_anyof", method, path, "/nested-any-of", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return ListAnyOfResp.model_validate(response.json())
+        decoder = RESPONSE_BODY_LIST_OF_ANYOF_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return _decoded(decoder, response)
 
     async def post_object_without_body(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> PostObjectResp | None:
         """
@@ -2114,13 +3912,175 @@ class Client:
 
         method = "post"
 
-        path = "/post-without-body"
+        path = "/post-without-body"
+
+        url = f"{self.base_url}{path}"
+
+        params = None
+
+        headers_ = self.headers
+
+        if auth is None:
+            auth_ = DEFAULT_AUTH
+        elif isinstance(auth, httpx.Auth):
+            auth_ = auth
+        else:
+            auth_ = (auth.username, auth.password)
+
+        content = _async_content(content)
+        try:
+            response = await self._request(
+                "post_object_without_body",
+                method,
+                url,
+                path,
+                "/post-without-body",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
+        except Exception as exc:
+            if self.metrics_integration:
+                self._report_request_error("post_object_without_body", method, path, "/post-without-body", exc)
+
+            raise exc
+
+        if self.metrics_integration:
+            self._report_request_success("post_object_without_body", method, path, "/post-without-body", response)
+
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            meta.request = req
+            meta.response = resp
+
+        decoder = POST_OBJECT_WITHOUT_BODY_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
+
+    async def post_object(
+        self,
+        *,
+        auth: BasicAuth | None = None,
+        content: RequestContent | None = None,
+        body: PostObjectData | dict[str, Any] | None = None,
+        meta: PythogenMetaBox | None = None,
+        request_body_serializer: RequestBodySerializer | None = None,
+    ) -> PostObjectResp | None:
+        """
+        POST /objects
+        Operation ID: post_object
+        Summary:      Post Object
+        Description:  None
+        """
+
+        method = "post"
+
+        path = "/objects"
+
+        url = f"{self.base_url}{path}"
+
+        params = None
+
+        headers_ = self.headers
+
+        if auth is None:
+            auth_ = DEFAULT_AUTH
+        elif isinstance(auth, httpx.Auth):
+            auth_ = auth
+        else:
+            auth_ = (auth.username, auth.password)
+
+        if request_body_serializer:
+            json = request_body_serializer(body)
+        elif isinstance(body, dict):
+            json = body
+        elif isinstance(body, PostObjectData):
+            json = body.model_dump(by_alias=True)
+        else:
+            json = None
+
+        content = _async_content(content)
+        try:
+            response = await self._request(
+                "post_object",
+                method,
+                url,
+                path,
+                "/objects",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+            )
+        except Exception as exc:
+            if self.metrics_integration:
+                self._report_request_error("post_object", method, path, "/objects", exc)
+
+            raise exc
+
+        if self.metrics_integration:
+            self._report_request_success("post_object", method, path, "/objects", response)
+
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
+            meta.request = req
+            meta.response = resp
+
+        decoder = POST_OBJECT_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
+
+    async def post_form_object(
+        self,
+        *,
+        auth: BasicAuth | None = None,
+        content: RequestContent | None = None,
+        body: PostObjectData | dict[str, Any] | None = None,
+        meta: PythogenMetaBox | None = None,
+        request_body_serializer: RequestBodySerializer | None = None,
+    ) -> PostObjectResp | None:
+        """
+        POST /objects-form-data
+        Operation ID: post_form_object
+        Summary:      Post Form Object
+        Description:  None
+        """
+
+        method = "post"
+
+        path = "/objects-form-data"
 
         url = f"{self.base_url}{path}"
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2129,72 +4089,86 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        if request_body_serializer:
+            json = request_body_serializer(body)
+        elif isinstance(body, dict):
+            json = body
+        elif isinstance(body, PostObjectData):
+            json = body.model_dump(by_alias=True)
+        else:
+            json = None
+
+        headers_ = {**headers_, "Content-Type": "application/x-www-form-urlencoded"}
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "post_form_object",
+                method,
+                url,
+                path,
+                "/objects-form-data",
+                data=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/post-without-body"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("post_form_object", method, path, "/objects-form-data", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/post-without-body"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+            self._report_request_success("post_form_object", method, path, "/objects-form-data", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return PostObjectResp.model_validate(response.json())
+        decoder = POST_FORM_OBJECT_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-    async def post_object(
+        return decoder(response)
+
+    async def post_multipart_form_data(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
-        body: PostObjectData | dict[str, Any] | None = None,
+        content: RequestContent | None = None,
+        files: Mapping[str, FileTypes] | Sequence[tuple[str, FileTypes]] | None = None,
+        body: PostFile | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
     ) -> PostObjectResp | None:
         """
-        POST /objects
-        Operation ID: post_object
-        Summary:      Post Object
+        POST /multipart-form-data
+        Operation ID: post_multipart_form_data
+        Summary:      Post Multipart Form Data
         Description:  None
         """
 
         method = "post"
 
-        path = "/objects"
+        path = "/multipart-form-data"
 
         url = f"{self.base_url}{path}"
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2207,77 +4181,85 @@ class Client:
             json = request_body_serializer(body)
         elif isinstance(body, dict):
             json = body
-        elif isinstance(body, PostObjectData):
+        elif isinstance(body, PostFile):
             json = body.model_dump(by_alias=True)
         else:
             json = None
 
+        # Content-Type=multipart/form-data doesn't work, because header MUST contain boundaries
+        # let library do it for us
+        headers_ = {key: value for key, value in headers_.items() if key != "Content-Type"}
+        if files is not None:
+            files = _streamed_files(files)
+
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "post_multipart_form_data",
+                method,
+                url,
+                path,
+                "/multipart-form-data",
+                data=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+                files=files,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/objects"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("post_multipart_form_data", method, path, "/multipart-form-data", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/objects"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+            self._report_request_success("post_multipart_form_data", method, path, "/multipart-form-data", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return PostObjectResp.model_validate(response.json())
+        decoder = POST_MULTIPART_FORM_DATA_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-    async def post_form_object(
+        return decoder(response)
+
+    async def upload(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
-        body: PostObjectData | dict[str, Any] | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
-        request_body_serializer: RequestBodySerializer | None = None,
-    ) -> PostObjectResp | None:
+    ) -> UploadResp | None:
         """
-        POST /objects-form-data
-        Operation ID: post_form_object
-        Summary:      Post Form Object
-        Description:  None
+        POST /upload
+        Operation ID: upload
+        Summary:      Upload
+        Description:  Body of the request is counted, but not stored
         """
 
         method = "post"
 
-        path = "/objects-form-data"
+        path = "/upload"
 
         url = f"{self.base_url}{path}"
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2286,83 +4268,67 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
-        if request_body_serializer:
-            json = request_body_serializer(body)
-        elif isinstance(body, dict):
-            json = body
-        elif isinstance(body, PostObjectData):
-            json = body.model_dump(by_alias=True)
-        else:
-            json = None
-
-        headers_.update({"Content-Type": "application/x-www-form-urlencoded"})
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, data=json, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "upload", method, url, path, "/upload", headers=headers_, params=params, content=content, auth=auth_
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/objects-form-data"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("upload", method, path, "/upload", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/objects-form-data"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+            self._report_request_success("upload", method, path, "/upload", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return PostObjectResp.model_validate(response.json())
+        decoder = UPLOAD_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
 
-    async def post_multipart_form_data(
+        return decoder(response)
+
+    async def upload_multipart(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         files: Mapping[str, FileTypes] | Sequence[tuple[str, FileTypes]] | None = None,
         body: PostFile | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
-    ) -> PostObjectResp | None:
+    ) -> UploadResp | None:
         """
-        POST /multipart-form-data
-        Operation ID: post_multipart_form_data
-        Summary:      Post Multipart Form Data
-        Description:  None
+        POST /upload-multipart
+        Operation ID: upload_multipart
+        Summary:      Upload Multipart
+        Description:  Files of the request are counted, but not stored
         """
 
         method = "post"
 
-        path = "/multipart-form-data"
+        path = "/upload-multipart"
 
         url = f"{self.base_url}{path}"
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2382,54 +4348,60 @@ class Client:
 
         # Content-Type=multipart/form-data doesn't work, because header MUST contain boundaries
         # let library do it for us
-        headers_.pop("Content-Type", None)
+        headers_ = {key: value for key, value in headers_.items() if key != "Content-Type"}
+        if files is not None:
+            files = _streamed_files(files)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, data=json, headers=headers_, params=params, content=content, auth=auth_, files=files
+            response = await self._request(
+                "upload_multipart",
+                method,
+                url,
+                path,
+                "/upload-multipart",
+                data=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
+                files=files,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/multipart-form-data"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("upload_multipart", method, path, "/upload-multipart", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/multipart-form-data"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+            self._report_request_success("upload_multipart", method, path, "/upload-multipart", response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return PostObjectResp.model_validate(response.json())
+        decoder = UPLOAD_MULTIPART_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
 
     async def request_body_anyof(
         self,
         *,
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: RequestBodyAnyofRequestBody | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -2449,7 +4421,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2467,53 +4439,56 @@ class Client:
         else:
             json = None
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "request_body_anyof",
+                method,
+                url,
+                path,
+                "/request-body-anyof",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/request-body-anyof"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("request_body_anyof", method, path, "/request-body-anyof", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/request-body-anyof"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+            self._report_request_success("request_body_anyof", method, path, "/request-body-anyof", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return PostObjectResp.model_validate(response.json())
+        decoder = REQUEST_BODY_ANYOF_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
 
     async def patch_object(
         self,
         *,
         path_params: PatchObjectPathParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: PatchObjectData | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -2536,7 +4511,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2554,53 +4529,56 @@ class Client:
         else:
             json = None
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "patch_object",
+                method,
+                url,
+                path,
+                "/objects/:object_id",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/objects/:object_id"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("patch_object", method, path, "/objects/:object_id", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/objects/:object_id"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+            self._report_request_success("patch_object", method, path, "/objects/:object_id", response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return PatchObjectResp.model_validate(response.json())
+        decoder = PATCH_OBJECT_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
 
     async def put_object(
         self,
         *,
         path_params: PutObjectPathParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: PutObjectData | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -2623,7 +4601,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2641,53 +4619,56 @@ class Client:
         else:
             json = None
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "put_object",
+                method,
+                url,
+                path,
+                "/objects/:object_id",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/objects/:object_id"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("put_object", method, path, "/objects/:object_id", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/objects/:object_id"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+            self._report_request_success("put_object", method, path, "/objects/:object_id", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return PutObjectResp.model_validate(response.json())
+        decoder = PUT_OBJECT_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
 
     async def put_object_slow(
         self,
         *,
         path_params: PutObjectSlowPathParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         body: PutObjectData | dict[str, Any] | None = None,
         meta: PythogenMetaBox | None = None,
         request_body_serializer: RequestBodySerializer | None = None,
@@ -2710,7 +4691,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2728,53 +4709,56 @@ class Client:
         else:
             json = None
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, json=json, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "put_object_slow",
+                method,
+                url,
+                path,
+                "/slow/objects/:object_id",
+                json=json,
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/slow/objects/:object_id"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("put_object_slow", method, path, "/slow/objects/:object_id", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/slow/objects/:object_id"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
+            self._report_request_success("put_object_slow", method, path, "/slow/objects/:object_id", response)
 
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
-
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return PutObjectResp.model_validate(response.json())
+        decoder = PUT_OBJECT_SLOW_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
 
     async def delete_object(
         self,
         *,
         path_params: DeleteObjectPathParams | dict[str, Any],
         auth: BasicAuth | None = None,
-        content: str | bytes | None = None,
+        content: RequestContent | None = None,
         meta: PythogenMetaBox | None = None,
     ) -> DeleteObjectResp | None:
         """
@@ -2795,7 +4779,7 @@ class Client:
 
         params = None
 
-        headers_ = self.headers.copy()
+        headers_ = self.headers
 
         if auth is None:
             auth_ = DEFAULT_AUTH
@@ -2804,50 +4788,414 @@ class Client:
         else:
             auth_ = (auth.username, auth.password)
 
+        content = _async_content(content)
         try:
-            response = await self.client.request(
-                method, url, headers=headers_, params=params, content=content, auth=auth_
+            response = await self._request(
+                "delete_object",
+                method,
+                url,
+                path,
+                "/objects/:object_id",
+                headers=headers_,
+                params=params,
+                content=content,
+                auth=auth_,
             )
         except Exception as exc:
             if self.metrics_integration:
-                if self.metrics_integration.shadow_path():
-                    metrics_path = "/objects/:object_id"
-                else:
-                    metrics_path = path
-                self.metrics_integration.on_request_error(self.client_name, exc, method, metrics_path)
+                self._report_request_error("delete_object", method, path, "/objects/:object_id", exc)
 
             raise exc
 
         if self.metrics_integration:
-            if self.metrics_integration.shadow_path():
-                metrics_path = "/objects/:object_id"
-            else:
-                metrics_path = path
-            self.metrics_integration.on_request_success(self.client_name, response, method, metrics_path)
-
-        req = RequestBox(
-            client_name=self.client_name,
-            method=method,
-            url=url,
-            params=params,
-            headers=headers_,
-            content=content,
-        )
-
-        resp = ResponseBox(
-            status_code=response.status_code,
-        )
+            self._report_request_success("delete_object", method, path, "/objects/:object_id", response)
 
-        if meta:
+        if meta is not None:
+            req = RequestBox(
+                client_name=self.client_name,
+                method=method,
+                url=url,
+                params=params,
+                headers=dict(headers_),
+                content=content,
+            )
+            resp = ResponseBox(
+                status_code=response.status_code,
+            )
             meta.request = req
             meta.response = resp
 
-        if response.status_code == 200:
-            return DeleteObjectResp.model_validate(response.json())
+        decoder = DELETE_OBJECT_DECODERS.get(response.status_code)
+        if decoder is None:
+            return None  # the status code is not described in the OpenAPI file
+
+        return decoder(response)
 
     async def close(self) -> None:
         await self.client.aclose()
 
+    def map(
+        self,
+        operation: str | Callable[..., Awaitable[Any]],
+        calls: Iterable[dict[str, Any]],
+        *,
+        concurrency: int = 10,
+        ordered: bool = True,
+        on_progress: Callable[[MapProgress], Any] | None = None,
+    ) -> AsyncIterator[MapResult]:
+        """Call the operation with every kwargs of the calls, `concurrency` calls at a time
+
+        Results are returned in the order of the calls, or as the calls complete if not `ordered`.
+        Exceptions of the calls are returned in MapResult.error. `on_progress` is called when a call completes.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency of map must be at least 1, got {concurrency}")
+        return self._map(operation, calls, concurrency, ordered, on_progress)
+
+    async def _map(
+        self,
+        operation: str | Callable[..., Awaitable[Any]],
+        calls: Iterable[dict[str, Any]],
+        concurrency: int,
+        ordered: bool,
+        on_progress: Callable[[MapProgress], Any] | None,
+    ) -> AsyncIterator[MapResult]:
+        method = getattr(self, operation) if isinstance(operation, str) else operation
+        results = _MapResults(MapProgress(len(calls) if isinstance(calls, Sized) else None), on_progress, ordered)
+
+        async def call(index: int, kwargs: dict[str, Any]) -> MapResult:
+            try:
+                return MapResult(index, kwargs, result=await method(**kwargs))
+            except Exception as exc:
+                return MapResult(index, kwargs, error=exc)
+
+        indexed_calls = enumerate(calls)
+        pending: set[asyncio.Future] = set()
+        try:
+            while True:
+                # results that complete ahead of a slow call wait for it in ordered mode, no calls are started
+                # while `concurrency` of them are waiting, so that they don't pile up
+                if results.waiting < concurrency:
+                    for index, kwargs in indexed_calls:
+                        pending.add(asyncio.ensure_future(call(index, kwargs)))
+                        if len(pending) >= concurrency:
+                            break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for result in results.add(task.result()):
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _request(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send the request of the operation, all the methods of the operations send requests through it"""
+        if fn_name in self._coalesced_operations and _is_shareable_request(kwargs):
+            return await self._send_coalesced(fn_name, method, url, path, path_template, kwargs)
+        return await self._send_cacheable(fn_name, method, url, path, path_template, kwargs)
+
+    async def _send_coalesced(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Share the response of an identical request in flight, the response is decoded once for all the calls
+
+        The request is sent by a task of its own, so that it isn't cancelled with the call that started it.
+        """
+        key = _request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+        task = self._in_flight.get(key)
+        if task is not None:
+            on_request_coalesced = getattr(self.metrics_integration, "on_request_coalesced", None)
+            if on_request_coalesced is not None:
+                on_request_coalesced(self.client_name, method, self._metrics_path(path, path_template))
+            return _coalesced_response(await asyncio.shield(task))
+
+        async def send() -> httpx.Response:
+            return _shared_response(await self._send_cacheable(fn_name, method, url, path, path_template, kwargs))
+
+        task = self._in_flight[key] = asyncio.ensure_future(send())
+        task.add_done_callback(partial(self._end_in_flight, key))
+        return await asyncio.shield(task)
+
+    def _end_in_flight(self, key: str, task: asyncio.Future) -> None:
+        del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # the error isn't logged as "never retrieved" if all the calls were cancelled
+
+    async def _send_cacheable(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send the request through the response cache"""
+        if self.response_cache is not None and fn_name in self._cached_operations and _is_shareable_request(kwargs):
+            return await self._send_cached(fn_name, method, url, path, path_template, kwargs)
+        return await self._send_retried(fn_name, method, url, path, path_template, kwargs)
+
+    async def _send_cached(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Return the cached response if it's fresh, revalidate it if it's stale
+
+        A new response is stored in the cache when it's decoded, see _decoded.
+        """
+        key = _request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+        entry = self.response_cache.get(key)
+        if entry is not None and entry.is_fresh():
+            self._report_cache_lookup(method, path, path_template, "hit")
+            return entry.to_response(
+                method, url, _CachedResponse(self.response_cache, key, entry, without_request=True)
+            )
+
+        if entry is not None:
+            kwargs = {**kwargs, "headers": {**(kwargs.get("headers") or {}), **entry.validators()}}
+        response = await self._send_retried(fn_name, method, url, path, path_template, kwargs)
+        if entry is not None and response.status_code == 304:
+            entry.revalidate(response)
+            self.response_cache.set(key, entry)
+            self._report_cache_lookup(method, path, path_template, "revalidated")
+            cached_response = entry.to_response(method, url, _CachedResponse(self.response_cache, key, entry))
+            cached_response.elapsed = response.elapsed
+            return cached_response
+
+        self._report_cache_lookup(method, path, path_template, "miss")
+        new_entry = CacheEntry.from_response(response)
+        if new_entry is not None:
+            response.extensions[RESULT_EXTENSION] = _CachedResponse(self.response_cache, key, new_entry)
+        return response
+
+    def _report_cache_lookup(self, method: str, path: str, path_template: str, result: str) -> None:
+        on_cache_lookup = getattr(self.metrics_integration, "on_cache_lookup", None)
+        if on_cache_lookup is not None:
+            on_cache_lookup(self.client_name, method, self._metrics_path(path, path_template), result)
+
+    async def _send_retried(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send the request, retry it by the retry policy if the operation is idempotent"""
+        if (
+            self.retry_policy is None
+            or fn_name not in self._retried_operations
+            or not _is_replayable(kwargs.get("content"), kwargs.get("files"))
+        ):
+            return await self._send_limited(fn_name, method, url, path, path_template, kwargs)
+
+        self.retry_budget.deposit()
+        retry = 1
+        while True:
+            try:
+                response = await self._send_limited(fn_name, method, url, path, path_template, kwargs)
+            except self.retry_policy.exceptions as exc:
+                delay = self._retry_delay(retry, None)
+                if delay is None:
+                    raise
+                reason = exc.__class__.__name__
+            else:
+                if response.status_code not in self.retry_policy.status_codes:
+                    return response
+                delay = self._retry_delay(retry, response)
+                if delay is None:
+                    return response
+                reason = str(response.status_code)
+
+            on_request_retry = getattr(self.metrics_integration, "on_request_retry", None)
+            if on_request_retry is not None:
+                on_request_retry(self.client_name, method, self._metrics_path(path, path_template), reason, delay)
+            await asyncio.sleep(delay)
+            retry += 1
+
+    def _retry_delay(self, retry: int, response: httpx.Response | None) -> float | None:
+        """Seconds to wait before the retry, None if the request is not retried"""
+        delay = self.retry_policy.delay(retry, response)
+        if delay is None or not self.retry_budget.withdraw():
+            return None
+        return delay
+
+    async def _send_limited(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send the request when the rate limiters of the client and of the operation let it through
+
+        The limiters follow the quota of the server from the rate limit headers of the response.
+        """
+        limiters = await self._wait_rate_limiters(fn_name, method, path, path_template)
+        response = await self._send(fn_name, method, url, path, path_template, kwargs)
+        if limiters:
+            _update_rate_limiters(limiters, response)
+        return response
+
+    async def _wait_rate_limiters(self, fn_name: str, method: str, path: str, path_template: str) -> list[TokenBucket]:
+        """Wait until the rate limiters of the client and of the operation let the request through, return the limiters"""
+        limiters = [limiter for limiter in (self.rate_limiter, self._rate_limiters.get(fn_name)) if limiter is not None]
+        if not limiters:
+            return limiters
+
+        delay = max(limiter.reserve() for limiter in limiters)
+        if delay > 0:
+            on_request_throttled = getattr(self.metrics_integration, "on_request_throttled", None)
+            if on_request_throttled is not None:
+                on_request_throttled(self.client_name, method, self._metrics_path(path, path_template), delay)
+            await asyncio.sleep(delay)
+        return limiters
+
+    async def _send(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send the request through the circuit breaker of the operation or the host"""
+        if self.circuit_breaker_policy is None:
+            return await self._send_counted(fn_name, method, url, path, path_template, kwargs)
+
+        circuit_breaker = self._circuit_breaker(fn_name, url)
+        trial = circuit_breaker.before_call()
+        try:
+            response = await self._send_counted(fn_name, method, url, path, path_template, kwargs)
+        except Exception:
+            circuit_breaker.record(trial, failed=True)
+            raise
+        except BaseException:
+            circuit_breaker.release(trial)  # cancelled, the result is unknown
+            raise
+        circuit_breaker.record(trial, failed=response.status_code in self.circuit_breaker_policy.failure_status_codes)
+        return response
+
+    async def _send_counted(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send the request (hedged), counted by the in-flight metric of the operation
+
+        Calls answered by the response cache or coalesced with another call don't get here.
+        """
+        operation_metrics = self._operation_metrics.get(fn_name)
+        if operation_metrics is None:
+            return await self._send_hedged(fn_name, method, url, path, path_template, kwargs)
+
+        operation_metrics.on_request_start()
+        try:
+            return await self._send_hedged(fn_name, method, url, path, path_template, kwargs)
+        finally:
+            operation_metrics.on_request_end()
+
+    @asynccontextmanager
+    async def _stream(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, **kwargs: Any
+    ) -> AsyncIterator[httpx.Response]:
+        """Stream the response of the operation through the rate limiters and the circuit breaker,
+        like _send_limited and _send do
+
+        The call is recorded when the status code is received, errors while reading the body are not failures of the call.
+        """
+        limiters = await self._wait_rate_limiters(fn_name, method, path, path_template)
+        if self.circuit_breaker_policy is None:
+            async with self.client.stream(method, url, **kwargs) as response:
+                if limiters:
+                    _update_rate_limiters(limiters, response)
+                yield response
+            return
+
+        circuit_breaker = self._circuit_breaker(fn_name, url)
+        trial = circuit_breaker.before_call()
+        recorded = False
+        try:
+            async with self.client.stream(method, url, **kwargs) as response:
+                circuit_breaker.record(
+                    trial, failed=response.status_code in self.circuit_breaker_policy.failure_status_codes
+                )
+                recorded = True
+                if limiters:
+                    _update_rate_limiters(limiters, response)
+                yield response
+        except Exception:
+            if not recorded:
+                circuit_breaker.record(trial, failed=True)
+            raise
+        except BaseException:
+            if not recorded:
+                circuit_breaker.release(trial)  # cancelled, the result is unknown
+            raise
+
+    def _circuit_breaker(self, fn_name: str, url: str) -> CircuitBreaker:
+        if self.circuit_breaker_policy.key == "host":
+            circuit = urlsplit(url).netloc
+        else:
+            circuit = fn_name
+        circuit_breaker = self._circuit_breakers.get(circuit)
+        if circuit_breaker is None:
+            circuit_breaker = self._circuit_breakers.setdefault(
+                circuit, CircuitBreaker(circuit, self.circuit_breaker_policy, self._on_circuit_state_change)
+            )
+        return circuit_breaker
+
+    def _on_circuit_state_change(self, circuit: str, state: CircuitState) -> None:
+        on_circuit_state_change = getattr(self.metrics_integration, "on_circuit_state_change", None)
+        if on_circuit_state_change is not None:
+            on_circuit_state_change(self.client_name, circuit, state.value)
+        log_circuit_state_change = getattr(self.logs_integration, "log_circuit_state_change", None)
+        if log_circuit_state_change is not None:
+            log_circuit_state_change(self.client_name, circuit, state.value)
+
+    async def _send_hedged(
+        self, fn_name: str, method: str, url: str, path: str, path_template: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        """Send the request, and send it again if the hedge policy of the operation says so
+
+        The first response is returned, the other request is cancelled.
+        """
+        hedge_policy = self._hedge_policies.get(fn_name)
+        if hedge_policy is None or not _is_replayable(kwargs.get("content"), kwargs.get("files")):
+            return await self.client.request(method, url, **kwargs)
+
+        latencies = self._latencies.get(fn_name)
+        if latencies is None:
+            latencies = self._latencies[fn_name] = _Latencies(hedge_policy.window)
+        delay = hedge_policy.delay if hedge_policy.delay is not None else latencies.percentile(hedge_policy)
+        self.hedge_budget.deposit()
+
+        started_at = time.perf_counter()
+        tasks = [asyncio.ensure_future(self.client.request(method, url, **kwargs))]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self.hedge_budget.withdraw():
+                    tasks.append(asyncio.ensure_future(self.client.request(method, url, **kwargs)))
+            winner = await _first_response(tasks)
+            response = winner.result()
+        finally:
+            _cancel(tasks)
+
+        latencies.add(time.perf_counter() - started_at)
+        if len(tasks) > 1:
+            on_request_hedged = getattr(self.metrics_integration, "on_request_hedged", None)
+            if on_request_hedged is not None:
+                metrics_path = self._metrics_path(path, path_template)
+                on_request_hedged(self.client_name, method, metrics_path, winner is tasks[1])
+        return response
+
+    def _metrics_path(self, path: str, path_template: str) -> str:
+        if self._shadow_path:
+            return path_template
+        return path
+
+    def _report_request_success(
+        self, fn_name: str, method: str, path: str, path_template: str, response: httpx.Response
+    ) -> None:
+        operation_metrics = self._operation_metrics.get(fn_name)
+        if operation_metrics is not None:
+            operation_metrics.on_request_success(response)
+        else:
+            self.metrics_integration.on_request_success(
+                self.client_name, response, method, self._metrics_path(path, path_template)
+            )
+
+    def _report_request_error(self, fn_name: str, method: str, path: str, path_template: str, error: Exception) -> None:
+        operation_metrics = self._operation_metrics.get(fn_name)
+        if operation_metrics is not None:
+            operation_metrics.on_request_error(error)
+        else:
+            self.metrics_integration.on_request_error(
+                self.client_name, error, method, self._metrics_path(path, path_template)
+            )
+
     def _get_url(self, path: str) -> str:
         return f"{self.base_url}{path}"
 
@@ -2875,128 +5223,11 @@ class Client:
         )
 
     def _parse_any_of(self, item: dict[str, Any], schema_classes: list[Any]) -> Any:
-        for schema_class in schema_classes:
-            try:
-                return schema_class.model_validate(item)
-            except:
-                continue
-
-        raise Exception('Can\'t parse "{item}"')
-
-
-if hasattr(RequestBodyAnyofRequestBody, "model_rebuild"):
-    RequestBodyAnyofRequestBody.model_rebuild()
-
-if hasattr(GetListObjectsResponse200, "model_rebuild"):
-    GetListObjectsResponse200.model_rebuild()
-
-if hasattr(RewardsListItem, "model_rebuild"):
-    RewardsListItem.model_rebuild()
-
-if hasattr(GetObjectWithInlineArrayResponse200, "model_rebuild"):
-    GetObjectWithInlineArrayResponse200.model_rebuild()
-
-if hasattr(GetObjectWithArrayResponseResponse200, "model_rebuild"):
-    GetObjectWithArrayResponseResponse200.model_rebuild()
-
-if hasattr(GetObjectWithArrayResponseResponse200Item, "model_rebuild"):
-    GetObjectWithArrayResponseResponse200Item.model_rebuild()
+        return _parse_any_of(item, schema_classes)
 
 
-if hasattr(GetObjectNoRefSchemaResponse200, "model_rebuild"):
-    GetObjectNoRefSchemaResponse200.model_rebuild()
-
-if hasattr(IntEnumOrNullObj, "model_rebuild"):
-    IntEnumOrNullObj.model_rebuild()
-
-if hasattr(OptionalAnyofStringDataObj, "model_rebuild"):
-    OptionalAnyofStringDataObj.model_rebuild()
-
-if hasattr(PropertyAllOfSimpleStringRefRefObj, "model_rebuild"):
-    PropertyAllOfSimpleStringRefRefObj.model_rebuild()
-
-if hasattr(DictOdArrayOfDictsObj, "model_rebuild"):
-    DictOdArrayOfDictsObj.model_rebuild()
-
-
-if hasattr(DictOdArrayOfDictsObjItem0, "model_rebuild"):
-    DictOdArrayOfDictsObjItem0.model_rebuild()
-
-
-if hasattr(AnimalObj, "model_rebuild"):
-    AnimalObj.model_rebuild()
-
 if hasattr(AnyOfChildObj, "model_rebuild"):
     AnyOfChildObj.model_rebuild()
 
-if hasattr(TierObj, "model_rebuild"):
-    TierObj.model_rebuild()
-
-if hasattr(AllOfRefObjItem2, "model_rebuild"):
-    AllOfRefObjItem2.model_rebuild()
-
-if hasattr(Cat, "model_rebuild"):
-    Cat.model_rebuild()
-
-if hasattr(Data, "model_rebuild"):
-    Data.model_rebuild()
-
-if hasattr(AllOfRefObj, "model_rebuild"):
-    AllOfRefObj.model_rebuild()
-
-if hasattr(AnyOfChildItem, "model_rebuild"):
-    AnyOfChildItem.model_rebuild()
-
-if hasattr(ListAnyOfResp, "model_rebuild"):
-    ListAnyOfResp.model_rebuild()
-
-if hasattr(SafetyKeyForTesting, "model_rebuild"):
-    SafetyKeyForTesting.model_rebuild()
-
-if hasattr(UnknownError, "model_rebuild"):
-    UnknownError.model_rebuild()
-
-if hasattr(DeleteObjectResp, "model_rebuild"):
-    DeleteObjectResp.model_rebuild()
-
-if hasattr(PutObjectResp, "model_rebuild"):
-    PutObjectResp.model_rebuild()
-
-if hasattr(PatchObjectResp, "model_rebuild"):
-    PatchObjectResp.model_rebuild()
-
-if hasattr(PostObjectResp, "model_rebuild"):
-    PostObjectResp.model_rebuild()
-
-if hasattr(PostFile, "model_rebuild"):
-    PostFile.model_rebuild()
-
-if hasattr(PutObjectData, "model_rebuild"):
-    PutObjectData.model_rebuild()
-
-if hasattr(PatchObjectData, "model_rebuild"):
-    PatchObjectData.model_rebuild()
-
-if hasattr(PostObjectData, "model_rebuild"):
-    PostObjectData.model_rebuild()
-
 if hasattr(GetObjectResp, "model_rebuild"):
     GetObjectResp.model_rebuild()
-
-if hasattr(GetMessageResp, "model_rebuild"):
-    GetMessageResp.model_rebuild()
-
-if hasattr(Dog, "model_rebuild"):
-    Dog.model_rebuild()
-
-if hasattr(DogWithKind, "model_rebuild"):
-    DogWithKind.model_rebuild()
-
-if hasattr(CatWithKind, "model_rebuild"):
-    CatWithKind.model_rebuild()
-
-if hasattr(DiscriminatedOneOfResp, "model_rebuild"):
-    DiscriminatedOneOfResp.model_rebuild()
-
-if hasattr(AllOfResp, "model_rebuild"):
-    AllOfResp.model_rebuild()
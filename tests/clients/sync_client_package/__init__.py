@@ -0,0 +1,125 @@
+# ==============================================================================
+#
+# Client (HTTP-client)
+#
+# This file was generated by a code generator.
+# Don't make changes to it manually.
+#
+# Generator info:
+#   GitHub Page: https://github.com/artsmolin/pythogen
+#   Version:     0.2.41
+# ==============================================================================
+
+# mypy: ignore-errors
+
+import importlib
+from typing import Any
+
+
+# Classes are imported on the first access (PEP 562),
+# so that the models that are not used are never built
+_LAZY_IMPORTS = {
+    "Client": ".client",
+    "ResponseDecoder": ".client",
+    "DownloadDestination": ".client",
+    "TransferStats": ".client",
+    "UnexpectedResponse": ".client",
+    "RetryPolicy": ".client",
+    "RetryBudget": ".client",
+    "CacheEntry": ".client",
+    "CacheBackend": ".client",
+    "MemoryCache": ".client",
+    "DiskCache": ".client",
+    "CircuitState": ".client",
+    "CircuitBreakerPolicy": ".client",
+    "CircuitOpenError": ".client",
+    "CircuitBreaker": ".client",
+    "RateLimit": ".client",
+    "TokenBucket": ".client",
+    "RequestBodySerializer": ".client",
+    "OperationMetrics": ".client",
+    "MetricsIntegration": ".client",
+    "RequestBox": ".client",
+    "ResponseBox": ".client",
+    "LogsIntegration": ".client",
+    "DefaultLogsIntegration": ".client",
+    "FileContent": ".client",
+    "FileTypes": ".client",
+    "RequestContent": ".client",
+    "MapResult": ".client",
+    "MapProgress": ".client",
+    "RequiredHeaders": ".client",
+    "EmptyBody": ".client",
+    "BasicAuth": ".client",
+    "PythogenMetaBox": ".client",
+    "IntegerEnum": ".enums",
+    "StringEnum": ".enums",
+    "GetMessageHeaders": ".params",
+    "GetObjectNoRefSchemaPathParams": ".params",
+    "GetObjectNoRefSchemaQueryParams": ".params",
+    "GetObjectPathParams": ".params",
+    "GetObjectQueryParams": ".params",
+    "GetEmptyHeaders": ".params",
+    "GetNoOperationIdHeaders": ".params",
+    "GetObjectSlowPathParams": ".params",
+    "GetObjectSlowQueryParams": ".params",
+    "PutObjectPathParams": ".params",
+    "PutObjectSlowPathParams": ".params",
+    "PatchObjectPathParams": ".params",
+    "DeleteObjectPathParams": ".params",
+    "Data": ".models.data",
+    "Cat": ".models.data",
+    "AllOfRefObjItem2": ".models.data",
+    "AllOfRefObj": ".models.data",
+    "AllOfResp": ".models.data",
+    "Dog": ".models.data",
+    "AnyOfChildItem": ".models.data",
+    "TierObj": ".models.data",
+    "AnyOfChildObj": ".models.data",
+    "AnimalObj": ".models.data",
+    "DictOdArrayOfDictsObjItem0": ".models.data",
+    "DictOdArrayOfDictsObj": ".models.data",
+    "PropertyAllOfSimpleStringRefRefObj": ".models.data",
+    "GetObjectResp": ".models.data",
+    "OptionalAnyofStringDataObj": ".models.data",
+    "IntEnumOrNullObj": ".models.data",
+    "PostObjectData": ".models.data",
+    "ListAnyOfResp": ".models.data",
+    "GetListObjectsResponse200": ".models.data",
+    "RequestBodyAnyofRequestBody": ".models.data",
+    "CatWithKind": ".models.cat_with_kind",
+    "DogWithKind": ".models.cat_with_kind",
+    "DiscriminatedOneOfResp": ".models.cat_with_kind",
+    "GetMessageResp": ".models.get_message_resp",
+    "PatchObjectData": ".models.patch_object_data",
+    "PutObjectData": ".models.put_object_data",
+    "PostFile": ".models.post_file",
+    "UploadResp": ".models.upload_resp",
+    "PostObjectResp": ".models.post_object_resp",
+    "PatchObjectResp": ".models.patch_object_resp",
+    "PutObjectResp": ".models.put_object_resp",
+    "DeleteObjectResp": ".models.delete_object_resp",
+    "UnknownError": ".models.unknown_error",
+    "SafetyKeyForTesting": ".models.safety_key_for_testing",
+    "GetObjectNoRefSchemaResponse200": ".models.get_object_no_ref_schema_response200",
+    "GetObjectWithArrayResponseResponse200Item": ".models.get_object_with_array_response_response200_item",
+    "GetObjectWithArrayResponseResponse200": ".models.get_object_with_array_response_response200_item",
+    "RewardsListItem": ".models.rewards_list_item",
+    "GetObjectWithInlineArrayResponse200": ".models.rewards_list_item",
+    "BaseObjectResp": ".models.discriminators",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
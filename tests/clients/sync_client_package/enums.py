@@ -0,0 +1,44 @@
+# ==============================================================================
+#
+# Client (HTTP-client)
+#
+# This file was generated by a code generator.
+# Don't make changes to it manually.
+#
+# Generator info:
+#   GitHub Page: https://github.com/artsmolin/pythogen
+#   Version:     0.2.41
+# ==============================================================================
+
+# mypy: ignore-errors
+
+from __future__ import annotations
+
+from enum import Enum
+from enum import IntEnum
+from typing import Any
+
+
+class IntegerEnum(IntEnum):
+    """
+    IntegerEnum
+    """
+
+    _1 = 1
+    _2 = 2
+    _3 = 3
+    _4 = 4
+    _5 = 5
+    _6 = 6
+
+
+class StringEnum(str, Enum):
+    """
+    StringEnum
+    """
+
+    FIRST_FIELD = "first-field"
+    SECOND_FIELD = "second field"
+
+    def __str__(self) -> Any:
+        return self.value
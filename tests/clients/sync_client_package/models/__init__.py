@@ -0,0 +1,77 @@
+# ==============================================================================
+#
+# Client (HTTP-client)
+#
+# This file was generated by a code generator.
+# Don't make changes to it manually.
+#
+# Generator info:
+#   GitHub Page: https://github.com/artsmolin/pythogen
+#   Version:     0.2.41
+# ==============================================================================
+
+# mypy: ignore-errors
+
+import importlib
+from typing import Any
+
+
+# Classes are imported on the first access (PEP 562),
+# so that the models that are not used are never built
+_LAZY_IMPORTS = {
+    "Data": ".data",
+    "Cat": ".data",
+    "AllOfRefObjItem2": ".data",
+    "AllOfRefObj": ".data",
+    "AllOfResp": ".data",
+    "Dog": ".data",
+    "AnyOfChildItem": ".data",
+    "TierObj": ".data",
+    "AnyOfChildObj": ".data",
+    "AnimalObj": ".data",
+    "DictOdArrayOfDictsObjItem0": ".data",
+    "DictOdArrayOfDictsObj": ".data",
+    "PropertyAllOfSimpleStringRefRefObj": ".data",
+    "GetObjectResp": ".data",
+    "OptionalAnyofStringDataObj": ".data",
+    "IntEnumOrNullObj": ".data",
+    "PostObjectData": ".data",
+    "ListAnyOfResp": ".data",
+    "GetListObjectsResponse200": ".data",
+    "RequestBodyAnyofRequestBody": ".data",
+    "CatWithKind": ".cat_with_kind",
+    "DogWithKind": ".cat_with_kind",
+    "DiscriminatedOneOfResp": ".cat_with_kind",
+    "GetMessageResp": ".get_message_resp",
+    "PatchObjectData": ".patch_object_data",
+    "PutObjectData": ".put_object_data",
+    "PostFile": ".post_file",
+    "UploadResp": ".upload_resp",
+    "PostObjectResp": ".post_object_resp",
+    "PatchObjectResp": ".patch_object_resp",
+    "PutObjectResp": ".put_object_resp",
+    "DeleteObjectResp": ".delete_object_resp",
+    "UnknownError": ".unknown_error",
+    "SafetyKeyForTesting": ".safety_key_for_testing",
+    "GetObjectNoRefSchemaResponse200": ".get_object_no_ref_schema_response200",
+    "GetObjectWithArrayResponseResponse200Item": ".get_object_with_array_response_response200_item",
+    "GetObjectWithArrayResponseResponse200": ".get_object_with_array_response_response200_item",
+    "RewardsListItem": ".rewards_list_item",
+    "GetObjectWithInlineArrayResponse200": ".rewards_list_item",
+    "BaseObjectResp": ".discriminators",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
@@ -0,0 +1,60 @@
+# ==============================================================================
+#
+# Client (HTTP-client)
+#
+# This file was generated by a code generator.
+# Don't make changes to it manually.
+#
+# Generator info:
+#   GitHub Page: https://github.com/artsmolin/pythogen
+#   Version:     0.2.41
+# ==============================================================================
+
+# mypy: ignore-errors
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+
+
+class CatWithKind(BaseModel):
+    """
+    Cat
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    kind: Literal["cat"]
+    name: str
+
+
+class DogWithKind(BaseModel):
+    """
+    Dog
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    kind: Literal["dog"]
+    name: str
+
+
+class DiscriminatedOneOfResp(BaseModel):
+    """
+    All Of Resp
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    required_discriminated_animal: CatWithKind | DogWithKind = Field(..., discriminator="kind")
+    discriminated_animal: CatWithKind | DogWithKind | None = Field(None, discriminator="kind")
@@ -0,0 +1,290 @@
+# ==============================================================================
+#
+# Client (HTTP-client)
+#
+# This file was generated by a code generator.
+# Don't make changes to it manually.
+#
+# Generator info:
+#   GitHub Page: https://github.com/artsmolin/pythogen
+#   Version:     0.2.41
+# ==============================================================================
+
+# mypy: ignore-errors
+
+from __future__ import annotations
+
+import datetime
+from typing import Any
+from typing import Literal
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+from pydantic import HttpUrl
+from pydantic import RootModel
+
+from ..enums import IntegerEnum
+from ..enums import StringEnum
+
+
+class Data(BaseModel):
+    """
+    Data
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    id: str | None = None
+    data: int | None = None
+
+
+class Cat(BaseModel):
+    """
+    Cat
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    name: str | None = None
+
+
+class AllOfRefObjItem2(BaseModel):
+    """
+    None
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    bark: bool | None = None
+    breed: Literal["Dingo", "Husky", "Retriever", "Shepherd"] | None = None
+
+
+class AllOfRefObj(
+    Data,
+    Cat,
+):
+    """
+    All Of
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    bark: bool | None = None
+    breed: Literal["Dingo", "Husky", "Retriever", "Shepherd"] | None = None
+
+    ...
+
+
+class AllOfResp(BaseModel):
+    """
+    All Of Resp
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    all_of: AllOfRefObj | None = None
+
+
+class Dog(BaseModel):
+    """
+    Dog
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    name: str | None = None
+
+
+class AnyOfChildItem(RootModel):
+    """
+    AnyOfChildItem
+
+    """
+
+    root: Dog | Cat | int
+
+
+class TierObj(BaseModel):
+    """
+    None
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    code: str | None = None
+    name: str | None = None
+    priority: int | None = None
+
+
+class AnyOfChildObj(RootModel):
+    """
+    None
+
+    """
+
+    root: GetObjectResp | Cat
+
+
+class AnimalObj(RootModel):
+    """
+    None
+
+    """
+
+    root: Cat | Dog
+
+
+class DictOdArrayOfDictsObjItem0(BaseModel):
+    """
+    None
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+
+class DictOdArrayOfDictsObj(RootModel):
+    """
+    None
+
+    """
+
+    root: list[dict[Any, Any]] | dict[Any, Any]
+
+
+class PropertyAllOfSimpleStringRefRefObj(
+    str,
+):
+    """
+    None
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+    ...
+
+
+class GetObjectResp(BaseModel):
+    """
+    GetObjectResp
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    integer_data_all_params: int = Field(..., gt=1, lt=20)
+    string_data: str | None = Field(None, description="String Data. [__discriminator__(BaseObjectResp.string_data)]")
+    integer_data: int | None = None
+    array_data: list[str] | None = None
+    array_with_anyof: dict | None = None
+    boolean_data: bool | None = None
+    tier: TierObj | None = None
+    anyOfChild: AnyOfChildObj | None = Field(None, alias="anyOfChild")
+    child: GetObjectResp | None = None
+    childs: list[GetObjectResp] | None = None
+    animal: AnimalObj | None = None
+    dictOdArrayOfDicts: DictOdArrayOfDictsObj | None = Field(None, alias="dictOdArrayOfDicts")
+    integer_data_min_max: int | None = Field(None, ge=1, le=20)
+    propertyAllOfSimpleStringRef: str | None = Field(None, alias="propertyAllOfSimpleStringRef")
+
+
+class OptionalAnyofStringDataObj(RootModel):
+    """
+    None
+
+    """
+
+    root: str | None
+
+
+class IntEnumOrNullObj(RootModel):
+    """
+    None
+
+    """
+
+    root: int | None
+
+
+class PostObjectData(BaseModel):
+    """
+    PostObjectData
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    string_data: str
+    integer_data: int
+    array_data: list[str]
+    boolean_data: bool
+    event_data: dict = Field(..., alias="event-data", description="__safety_key__(event_data)")
+    optional_anyof_string_data: OptionalAnyofStringDataObj | None = None
+    date_attr: datetime.date | None = None
+    datetime_attr: datetime.datetime | None = None
+    url: HttpUrl | None = None
+    int_enum: IntegerEnum | None = Field(None, description="An enumeration.")
+    str_enum: StringEnum | None = Field(None, description="An enumeration.")
+    int_enum_or_null: IntEnumOrNullObj | None = None
+
+
+class ListAnyOfResp(BaseModel):
+    """
+    PostObjectResp
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    anyOfChildArray: list[Dog | Cat | int] | None = Field(None, alias="anyOfChildArray")
+
+
+class GetListObjectsResponse200(BaseModel):
+    """
+    None
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+
+
+class RequestBodyAnyofRequestBody(RootModel):
+    """
+    None
+
+    """
+
+    root: Data | PostObjectData
+
+
+if hasattr(AnyOfChildObj, "model_rebuild"):
+    AnyOfChildObj.model_rebuild()
+
+if hasattr(GetObjectResp, "model_rebuild"):
+    GetObjectResp.model_rebuild()
@@ -0,0 +1,35 @@
+# ==============================================================================
+#
+# Client (HTTP-client)
+#
+# This file was generated by a code generator.
+# Don't make changes to it manually.
+#
+# Generator info:
+#   GitHub Page: https://github.com/artsmolin/pythogen
+#   Version:     0.2.41
+# ==============================================================================
+
+# mypy: ignore-errors
+
+from __future__ import annotations
+
+from typing import get_type_hints
+
+from pydantic import BaseModel
+from pydantic import ValidationInfo
+from pydantic import field_validator
+
+
+class BaseObjectResp(BaseModel):
+    string_data: str
+
+    @field_validator("string_data", mode="before")
+    def check(cls, v: str, info: ValidationInfo) -> str:
+        type_hints = get_type_hints(cls)
+        string_data_values: tuple[str] = type_hints["string_data"].__dict__["__args__"]
+
+        if v not in string_data_values:
+            raise ValueError(f"invalid string_data for {cls}")
+
+        return v
@@ -0,0 +1,41 @@
+# ==============================================================================
+#
+# Client (HTTP-client)
+#
+# This file was generated by a code generator.
+# Don't make changes to it manually.
+#
+# Generator info:
+#   GitHub Page: https://github.com/artsmolin/pythogen
+#   Version:     0.2.41
+# ==============================================================================
+
+# mypy: ignore-errors
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+
+
+class SafetyKeyForTesting(BaseModel):
+    """
+    model for testing safety key
+
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Addressing by field name, even if there is an alias.
+    )
+    for_: str | None = Field(None, alias="for", description='reserved word, expecting "for_"')
+    class_: str | None = Field(None, alias="class", description='reserved word, expecting "class_"')
+    with_dot_and_hyphens: int | None = Field(
+        None, alias="33with.dot-and-hyphens&*", description='invalid identifier, expecting "with_dot_and_hyphens"'
+    )
+    old_feature_priority: int | None = Field(
+        None,
+        alias="34with.dot-and-hyphens&*",
+        description='__safety_key__(old_feature_priority) invalid identifier, expecting "old_feature_priority"',
+    )
+    schema_: str | None = Field(None, alias="schema", description='Field named "schema"')
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from pythogen import batch
+
+
+runner = CliRunner()
+
+
+OPENAPI_PATH = Path("tests/docs/openapi.yaml").absolute()
+OPENAPI_TOO_MUCH_ALLOF_PATH = Path("tests/docs/openapi-with-too-much-allof.yaml").absolute()
+
+
+def test_batch(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(
+        f"""
+defaults:
+  input: {OPENAPI_PATH}
+  cache_dir: cache
+jobs:
+  - output: async_client.py
+  - output: sync_client.py
+    name: SyncClient
+    sync: true
+"""
+    )
+
+    result = runner.invoke(batch.app, [str(manifest_path), "--workers", "2"])
+    assert result.exit_code == 0, result.output
+    assert "2 jobs in" in result.output
+    assert (tmp_path / "async_client.py").exists()
+    assert "class SyncClient:" in (tmp_path / "sync_client.py").read_text()
+
+    result = runner.invoke(batch.app, [str(manifest_path), "--workers", "1"])
+    assert result.exit_code == 0, result.output
+    assert result.output.count("cache hit") == 2
+
+
+def test_batch_with_failed_job(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(
+        f"""
+jobs:
+  - input: {OPENAPI_PATH}
+    output: async_client.py
+  - input: {OPENAPI_TOO_MUCH_ALLOF_PATH}
+    output: broken_client.py
+"""
+    )
+
+    result = runner.invoke(batch.app, [str(manifest_path), "--workers", "1"])
+    assert result.exit_code == 1
+    assert (tmp_path / "async_client.py").exists()
+    assert "failed" in result.output
+
+
+def test_load_manifest_unknown_option(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text("jobs:\n  - {input: a.yaml, output: a.py, syncc: true}\n")
+
+    result = runner.invoke(batch.app, [str(manifest_path)])
+    assert result.exit_code == 1
+    assert "syncc" in str(result.exception)
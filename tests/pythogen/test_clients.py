@@ -1,6 +1,7 @@
 import io
 import logging
 
+import httpx
 import pytest
 from clients import async_client
 from clients import sync_client
@@ -217,3 +218,77 @@ async def test_httpx_async_client():
     assert isinstance(response, async_client.GetMessageResp)
 
     await httpx_async_client.close()
+
+
+class RecordingLogsIntegration(sync_client.DefaultLogsIntegration):
+    def __init__(self):
+        self.errors = []
+
+    def log_error(self, req, resp):
+        self.errors.append((req, resp))
+
+
+def test_httpx_sync_client_request_and_response_boxes():
+    logs_integration = RecordingLogsIntegration()
+    headers = {'X-Request-Source': 'tests', 'Content-Type': 'application/json'}
+    httpx_sync_client = sync_client.Client(TEST_SERVER_URL, headers=headers, logs_integration=logs_integration)
+
+    meta = sync_client.PythogenMetaBox()
+    httpx_sync_client.get_object(
+        path_params={'object_id': '123'},
+        query_params={'return_error': '', 'from': ''},
+        meta=meta,
+    )
+    assert meta.request.url == f"{TEST_SERVER_URL}/objects/123"
+    assert meta.request.headers == headers
+    assert meta.response.status_code == 200
+    assert logs_integration.errors == []
+
+    response = httpx_sync_client.get_object(
+        path_params={'object_id': '123'},
+        query_params={'return_error': 'true', 'from': ''},
+    )
+    assert isinstance(response, sync_client.UnknownError)
+    [(req, resp)] = logs_integration.errors
+    assert req.method == 'get'
+    assert resp.status_code == 500
+
+    # headers of the client are not changed by operations that set their own Content-Type
+    response = httpx_sync_client.post_multipart_form_data(
+        body=sync_client.PostFile(text="ping"),
+        files=[("file", ("hello.txt", io.BytesIO(b"hello world"), 'text/plain'))],
+    )
+    assert isinstance(response, sync_client.PostObjectResp)
+    assert httpx_sync_client.headers == {'X-Request-Source': 'tests', 'Content-Type': 'application/json'}
+
+    httpx_sync_client.close()
+
+
+def test_httpx_sync_client_response_decoders():
+    assert set(sync_client.GET_OBJECT_DECODERS) == {200, 500}
+
+    http_client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(418, json={})))
+    httpx_sync_client = sync_client.Client(TEST_SERVER_URL, client=http_client)
+
+    response = httpx_sync_client.get_object(
+        path_params={'object_id': '123'},
+        query_params={'return_error': '', 'from': ''},
+    )
+    assert response is None
+
+
+def test_httpx_client_options():
+    httpx_sync_client = sync_client.Client(
+        TEST_SERVER_URL,
+        timeout=10,
+        connect_timeout=1,
+        pool_timeout=2,
+        limits=httpx.Limits(max_connections=5, max_keepalive_connections=3),
+        keepalive_expiry=30,
+    )
+    assert httpx_sync_client.client.timeout == httpx.Timeout(10, connect=1, pool=2)
+    pool = httpx_sync_client.client._transport._pool
+    assert (pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry) == (5, 3, 30)
+
+    httpx_async_client = async_client.Client(TEST_SERVER_URL, timeout=httpx.Timeout(3, read=7))
+    assert httpx_async_client.client.timeout == httpx.Timeout(3, read=7)
@@ -0,0 +1,121 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+from clients import async_client
+
+
+TEST_SERVER_URL = "http://localhost:8080"
+OBJECT = {"integer_data_all_params": 2}
+QUERY_PARAMS = {"return_error": "", "from": ""}
+
+
+class RecordingMetricsIntegration:
+    def __init__(self):
+        self.requests = []
+        self.coalesced = 0
+
+    def on_request_error(self, client_name, error, http_method, http_target):
+        pass
+
+    def on_request_success(self, client_name, response, http_method, http_target):
+        self.requests.append(response.status_code)
+
+    def on_request_coalesced(self, client_name, http_method, http_target):
+        self.coalesced += 1
+
+    def shadow_path(self):
+        return True
+
+
+def _slow_server(error=None):
+    """Async handler of httpx.MockTransport that answers in 50 ms"""
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        if error is not None:
+            raise error
+        body = gzip.compress(json.dumps(OBJECT).encode())
+        return httpx.Response(200, headers={"Content-Encoding": "gzip"}, stream=httpx.ByteStream(body))
+
+    return handler, requests
+
+
+def _async_client(handler, **kwargs):
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return async_client.Client(TEST_SERVER_URL, client=http_client, **kwargs)
+
+
+async def _get_objects(client, object_ids):
+    return await asyncio.gather(
+        *(
+            client.get_object(path_params={"object_id": object_id}, query_params=QUERY_PARAMS)
+            for object_id in object_ids
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_are_coalesced():
+    handler, requests = _slow_server()
+    metrics = RecordingMetricsIntegration()
+    client = _async_client(handler, coalesce_requests=True, metrics_integration=metrics)
+
+    results = await _get_objects(client, ["1"] * 10 + ["2"] * 5)
+
+    assert results[0] == async_client.GetObjectResp(**OBJECT)
+    assert all(result is results[0] for result in results[:10])  # decoded once
+    assert results[10] is not results[0]
+    assert len(requests) == 2
+    assert metrics.coalesced == 13
+    assert metrics.requests == [200, 200]  # coalesced calls are not requests
+
+    await _get_objects(client, ["1"])  # the request is not in flight anymore
+    assert len(requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_calls_are_not_coalesced():
+    handler, requests = _slow_server()
+
+    client = _async_client(handler)
+    await _get_objects(client, ["1"] * 3)
+    assert len(requests) == 3
+
+    requests.clear()
+    client = _async_client(handler, coalesce_requests=True, coalesced_operations=["get_empty"])
+    await _get_objects(client, ["1"] * 3)
+    assert len(requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesced_calls_outlive_the_first_call():
+    handler, requests = _slow_server()
+    client = _async_client(handler, coalesce_requests=True)
+
+    first = asyncio.ensure_future(_get_objects(client, ["1"]))
+    await asyncio.sleep(0.01)
+    second = asyncio.ensure_future(_get_objects(client, ["1"]))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == [async_client.GetObjectResp(**OBJECT)]
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesced_calls_share_the_error():
+    handler, requests = _slow_server(error=httpx.ConnectError("connection refused"))
+    client = _async_client(handler, coalesce_requests=True)
+
+    results = await asyncio.gather(
+        *(client.get_object(path_params={"object_id": "1"}, query_params=QUERY_PARAMS) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
+    assert len(requests) == 1
@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+from pythogen.parsers.document import load_openapi_file
+from pythogen.parsers.document import parse_openapi_file
+
+
+OPENAPI_PATH = "tests/docs/openapi.yaml"
+
+
+def test_load_openapi_file(tmp_path: Path):
+    yaml_path = tmp_path / "openapi.yaml"
+    yaml_path.write_text("info: {version: 2020-01-01}\npaths:\n  /a:\n    get:\n      responses:\n        200: {}\n")
+
+    openapi_data = load_openapi_file(str(yaml_path))
+
+    assert openapi_data == {"info": {"version": "2020-01-01"}, "paths": {"/a": {"get": {"responses": {"200": {}}}}}}
+
+    json_path = tmp_path / "openapi.json"
+    json_path.write_text(json.dumps(openapi_data))
+    assert load_openapi_file(str(json_path)) == openapi_data
+
+
+def test_load_openapi_file_keys_and_tags(tmp_path: Path):
+    yaml_path = tmp_path / "openapi.yaml"
+    yaml_path.write_text(
+        "responses:\n"
+        "  200: {x-data: !!binary aGVsbG8=, x-tags: !!set {a, b}}\n"
+        "  x-keys: {true: 1, null: 2, 1.5: 3}\n"
+    )
+
+    openapi_data = load_openapi_file(str(yaml_path))
+
+    assert openapi_data == {
+        "responses": {
+            "200": {"x-data": b"hello", "x-tags": {"a", "b"}},
+            "x-keys": {"true": 1, "null": 2, "1.5": 3},
+        }
+    }
+
+
+def test_parse_openapi_file_from_loaded_data():
+    document_from_path = parse_openapi_file(OPENAPI_PATH)
+    document_from_data = parse_openapi_file(load_openapi_file(OPENAPI_PATH))
+
+    assert document_from_path.schemas.keys() == document_from_data.schemas.keys()
+    assert document_from_path.paths.keys() == document_from_data.paths.keys()
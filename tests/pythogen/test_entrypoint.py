@@ -1,9 +1,14 @@
+import importlib.util
+import json
+import pstats
 import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 from typer.testing import CliRunner
 
+from pythogen import generator
 from pythogen import main
 
 
@@ -61,3 +66,181 @@ def test_entrypoint_gen_http_client_in_shell_with_too_much_allof() -> None:
     _, stderr = process.communicate()
     assert b"Failed to generate a client" in stderr
     assert b"\"allOf\" field in property can contains only one item" in stderr
+
+
+@pytest.mark.usefixtures("temp_files")
+def test_entrypoint_gen_http_client_with_cache(tmp_path: Path) -> None:
+    cache_dir = str(tmp_path / "cache")
+
+    result = runner.invoke(main.app, [OPENAPI_PATH, ASYNC_CLIENT_PATH, "--cache-dir", cache_dir])
+    assert result.exit_code == 0
+    assert "cache miss" in result.output
+    generated_client = Path(ASYNC_CLIENT_PATH).read_text()
+
+    result = runner.invoke(main.app, [OPENAPI_PATH, ASYNC_CLIENT_PATH, "--cache-dir", cache_dir])
+    assert result.exit_code == 0
+    assert "cache hit" in result.output
+    assert "unchanged" in result.output
+
+    Path(ASYNC_CLIENT_PATH).unlink()
+    result = runner.invoke(main.app, [OPENAPI_PATH, ASYNC_CLIENT_PATH, "--cache-dir", cache_dir])
+    assert result.exit_code == 0
+    assert "cache hit" in result.output
+    assert Path(ASYNC_CLIENT_PATH).read_text() == generated_client
+
+    result = runner.invoke(main.app, [OPENAPI_PATH, ASYNC_CLIENT_PATH, "--cache-dir", cache_dir, "--sync"])
+    assert result.exit_code == 0
+    assert "cache miss" in result.output
+
+
+INVALID_OPENAPI = """
+openapi: 3.0.0
+info: {title: invalid, version: 0.0.1}
+paths:
+  /objects:
+    get:
+      x-idempotent: 'yes'
+      x-rate-limit: {requests: 0, period: 60}
+      parameters:
+        - {in: body, name: limit, schema: {type: integer}}
+        - {in: query, name: offset}
+      responses:
+        '200':
+          content:
+            application/json:
+              schema: {$ref: '#/components/schemas/Object'}
+components:
+  schemas:
+    Object:
+      type: object
+      properties:
+        id: {type: uuid}
+        created: {type: string, format: timestamp}
+"""
+
+
+def test_entrypoint_reports_all_issues(tmp_path: Path) -> None:
+    openapi_path = tmp_path / "openapi.yaml"
+    openapi_path.write_text(INVALID_OPENAPI)
+
+    result = runner.invoke(main.app, [str(openapi_path), str(tmp_path / "client.py"), "--validation", "off"])
+
+    assert "Failed to generate a client" in result.output
+    assert 'parameter "limit": the "in" field must be one of' in result.output
+    assert 'parameter "offset": the "schema" field is required' in result.output
+    assert 'response "200" must contain the "description" field' in result.output
+    assert 'the "x-idempotent" extension must be a boolean' in result.output
+    assert '"requests" of the "x-rate-limit" extension must be a positive number' in result.output
+    assert 'schema "Object": unknown type "uuid"' not in result.output  # property schemas are inline
+    assert 'unknown type "uuid"' in result.output
+    assert 'unknown format "timestamp"' in result.output
+    assert not (tmp_path / "client.py").exists()
+
+
+COLLIDING_OPERATIONS_OPENAPI = """
+openapi: 3.0.0
+info: {title: colliding, version: 0.0.1}
+paths:
+  /message:
+    get:
+      operationId: getMessage
+      responses:
+        '200': {description: message}
+  /messages/last:
+    get:
+      operationId: get_message
+      responses:
+        '200': {description: last message}
+"""
+
+
+def test_entrypoint_fails_on_colliding_operation_names(tmp_path: Path) -> None:
+    openapi_path = tmp_path / "openapi.yaml"
+    openapi_path.write_text(COLLIDING_OPERATIONS_OPENAPI)
+
+    result = runner.invoke(main.app, [str(openapi_path), str(tmp_path / "client.py"), "--validation", "off"])
+
+    assert "Failed to generate a client" in result.output
+    assert 'operations "getMessage" and "get_message" get the same name GET_MESSAGE_DECODERS' in result.output
+    assert not (tmp_path / "client.py").exists()
+
+
+def test_entrypoint_cached_validation(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    args = [OPENAPI_PATH, str(tmp_path / "client.py"), "--validation", "cached"]
+
+    result = runner.invoke(main.app, args)
+    assert result.exit_code == 0
+    assert len(list((tmp_path / "cache" / "pythogen" / "validation").iterdir())) == 1
+
+    def validate(spec_dict):
+        raise AssertionError("validation must be skipped")
+
+    monkeypatch.setattr(generator, "validate", validate)
+    result = runner.invoke(main.app, args)
+    assert result.exit_code == 0, result.output
+
+
+def test_entrypoint_format_modes(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+
+    result = runner.invoke(main.app, [OPENAPI_PATH, str(tmp_path / "full.py"), "--cache-dir", str(cache_dir)])
+    assert result.exit_code == 0
+    assert list((cache_dir / "chunks").iterdir())
+
+    result = runner.invoke(main.app, [OPENAPI_PATH, str(tmp_path / "none.py"), "--format", "none"])
+    assert result.exit_code == 0
+
+    full_client = (tmp_path / "full.py").read_text()
+    not_formatted_client = (tmp_path / "none.py").read_text()
+    assert full_client != not_formatted_client
+    compile(not_formatted_client, "none.py", "exec")
+
+
+def test_entrypoint_defer_build(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    client_path = tmp_path / "deferred_client.py"
+
+    result = runner.invoke(main.app, [OPENAPI_PATH, str(client_path), "--sync", "--defer-build"])
+    assert result.exit_code == 0
+    assert "model_rebuild" not in client_path.read_text()
+
+    spec = importlib.util.spec_from_file_location("deferred_client", client_path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "deferred_client", module)
+    spec.loader.exec_module(module)
+
+    assert not module.GetObjectResp.__pydantic_complete__
+    item = module.GetObjectResp.model_validate({"integer_data_all_params": 2, "child": {"integer_data_all_params": 3}})
+    assert item.child.integer_data_all_params == 3
+    assert module.GetObjectResp.__pydantic_complete__
+
+
+def test_entrypoint_profile(tmp_path: Path) -> None:
+    profile_dir = tmp_path / "profile"
+
+    result = runner.invoke(
+        main.app,
+        [OPENAPI_PATH, str(tmp_path / "client.py"), "--profile", str(profile_dir), "--profile-pstats"],
+    )
+    assert result.exit_code == 0
+    assert "SchemaParser.parse_collection" in result.output
+
+    profile = json.loads((profile_dir / "profile.json").read_text())
+    phases = {phase["name"]: phase for phase in profile["phases"]}
+    assert {
+        "spec load",
+        "validation",
+        "SchemaParser.parse_collection",
+        "PathParser.parse_collection",
+        "schema sorting",
+        "render",
+        "black",
+        "isort",
+        "autoflake",
+        "write",
+    } <= set(phases)
+    assert all(phase["calls"] >= 1 and phase["peak_memory_bytes"] > 0 for phase in phases.values())
+    assert sum(phase["seconds"] for phase in phases.values()) <= profile["total_seconds"]
+
+    for pstats_name in ("parse", "render"):
+        assert pstats.Stats(str(profile_dir / f"{pstats_name}.pstats")).total_calls > 0
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import autoflake
+import black
+import isort
+import pytest
+
+from pythogen import formatter
+from pythogen import generator
+
+
+CODE = '''import os
+import sys
+from typing import Any
+x = 1
+y = {'a':1}
+# comment of the class
+class A:
+    """Doc"""
+    a: int=1
+    def first(self): return  1
+
+    @property
+    def second(self)->int:
+        value=self.first()
+
+        return value
+    async def third(self, long_argument_name: dict[str, Any], another_long_argument_name: dict[str, Any], flag: bool = False): pass
+class B:
+    def first(self): pass
+    def second(self): pass
+    # comment at the end of the class body
+def f(a,b): return a+b
+z = f(1, 2)
+'''
+
+
+def _format_whole_module(code: str) -> str:
+    code = black.format_str(code, mode=black.Mode(line_length=120))
+    code = isort.code(code, force_grid_wrap=2, lines_after_imports=2, force_single_line=True, line_length=120)
+    return autoflake.fix_code(code, remove_all_unused_imports=True)
+
+
+def test_format_code_same_as_whole_module():
+    chunks = formatter.split_into_chunks(CODE)
+
+    assert [chunk.indent for chunk in chunks] == [0, 0, 4, 4, 0, 0, 0]
+    assert formatter.format_code(CODE, workers=1) == _format_whole_module(CODE)
+
+
+def test_format_code_chunks_cache():
+    chunks_cache: dict[str, str] = {}
+    formatted = formatter.format_code(CODE, workers=1, chunks_cache=chunks_cache)
+    assert len(chunks_cache) == 7
+
+    chunks_cache = {key: value + "# from cache\n" for key, value in chunks_cache.items()}
+    assert formatter.format_code(CODE, workers=1, chunks_cache=chunks_cache) != formatted
+
+
+def test_format_code_modes():
+    assert formatter.format_code(CODE, mode=formatter.FormatMode.none) == CODE
+    assert "import os" in formatter.format_code(CODE, mode=formatter.FormatMode.fast, workers=1)
+    assert "import os" not in formatter.format_code(CODE, mode=formatter.FormatMode.full, workers=1)
+
+
+@pytest.mark.parametrize("sync", [False, True])
+@pytest.mark.parametrize("metrics", [False, True])
+def test_format_code_same_as_whole_module_of_clients(tmp_path: Path, sync: bool, metrics: bool) -> None:
+    output = tmp_path / "client.py"
+    generator.generate(
+        input="tests/docs/openapi.yaml",
+        output=str(output),
+        sync=sync,
+        metrics=metrics,
+        validation=generator.ValidationMode.off,
+        format_mode=formatter.FormatMode.none,
+    )
+    code = output.read_text()
+
+    chunks = formatter.split_into_chunks(code)
+    formatted = formatter.join_chunks(chunks, formatter.format_chunks(chunks, workers=1))
+
+    assert formatted == black.format_str(code, mode=black.Mode(line_length=120))
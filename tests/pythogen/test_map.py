@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from clients import async_client
+from clients import sync_client
+
+
+TEST_SERVER_URL = "http://localhost:8080"
+
+
+def _objects_handler(delays=None):
+    """Handler of httpx.MockTransport that answers GET /objects/{object_id} after a delay of the object"""
+    delays = delays or {}
+    state = {"in_flight": 0, "max_in_flight": 0}
+    lock = threading.Lock()
+
+    def handler(request):
+        object_id = int(request.url.path.rsplit("/", 1)[-1])
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(delays.get(object_id, 0.01))
+        with lock:
+            state["in_flight"] -= 1
+        if object_id < 0:
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(200, json={"integer_data_all_params": object_id + 2})
+
+    return handler, state
+
+
+def _calls(object_ids):
+    return [
+        {"path_params": {"object_id": str(i)}, "query_params": {"return_error": "", "from": ""}} for i in object_ids
+    ]
+
+
+def test_sync_map():
+    handler, state = _objects_handler(delays={0: 0.2})
+    client = sync_client.Client(TEST_SERVER_URL, client=httpx.Client(transport=httpx.MockTransport(handler)))
+    progress = []
+
+    results = list(client.map("get_object", _calls(range(10)), concurrency=3, on_progress=progress.append))
+
+    assert [result.index for result in results] == list(range(10))
+    assert [result.result for result in results] == [
+        sync_client.GetObjectResp(integer_data_all_params=i + 2) for i in range(10)
+    ]
+    assert all(result.ok for result in results)
+    assert state["max_in_flight"] == 3
+    assert progress[-1].total == progress[-1].completed == 10
+    assert progress[-1].calls_per_second > 0
+
+
+def test_sync_map_as_completed():
+    handler, _ = _objects_handler(delays={0: 0.2})
+    client = sync_client.Client(TEST_SERVER_URL, client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    results = list(client.map(client.get_object, iter(_calls(range(5))), ordered=False))
+
+    assert results[-1].index == 0  # the slowest call
+    assert sorted(result.index for result in results) == list(range(5))
+
+
+def test_sync_map_errors():
+    handler, _ = _objects_handler()
+    client = sync_client.Client(TEST_SERVER_URL, client=httpx.Client(transport=httpx.MockTransport(handler)))
+    progress = []
+
+    results = list(client.map("get_object", _calls([1, -1, 2]), on_progress=progress.append))
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, httpx.ConnectError)
+    assert results[1].kwargs == _calls([-1])[0]
+    assert progress[-1].failed == 1
+
+
+def test_sync_map_waiting_results_are_bounded():
+    handler, _ = _objects_handler(delays={0: 0.3})
+    client = sync_client.Client(TEST_SERVER_URL, client=httpx.Client(transport=httpx.MockTransport(handler)))
+    started = []
+
+    def calls():
+        for call in _calls(range(20)):
+            started.append(call)
+            yield call
+
+    results = client.map("get_object", calls(), concurrency=2)
+
+    assert next(results).index == 0
+    assert len(started) <= 5  # the results after the slow call don't pile up while it runs
+    assert [result.index for result in results] == list(range(1, 20))
+
+
+def test_map_concurrency_is_validated():
+    client = sync_client.Client(TEST_SERVER_URL)
+    with pytest.raises(ValueError, match="concurrency of map must be at least 1, got 0"):
+        client.map("get_object", _calls([1]), concurrency=0)
+
+    client = async_client.Client(TEST_SERVER_URL)
+    with pytest.raises(ValueError, match="concurrency of map must be at least 1, got -1"):
+        client.map("get_object", _calls([1]), concurrency=-1)
+
+
+@pytest.mark.asyncio
+async def test_async_map():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        object_id = int(request.url.path.rsplit("/", 1)[-1])
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.2 if object_id == 0 else 0.01)
+        in_flight -= 1
+        if object_id < 0:
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(200, json={"integer_data_all_params": object_id + 2})
+
+    client = async_client.Client(TEST_SERVER_URL, client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    results = [result async for result in client.map("get_object", _calls([0, 1, -1, 3, 4]), concurrency=2)]
+
+    assert [result.index for result in results] == list(range(5))
+    assert [result.ok for result in results] == [True, True, False, True, True]
+    assert results[0].result == async_client.GetObjectResp(integer_data_all_params=2)
+    assert max_in_flight == 2
+
+    results = [result async for result in client.map("get_object", _calls([0, 1, 2]), ordered=False)]
+    assert results[-1].index == 0  # the slowest call
@@ -0,0 +1,178 @@
+import httpx
+import pytest
+from clients import async_client_with_metrics
+from clients import sync_client
+from clients import sync_client_with_metrics
+from prometheus_client import CollectorRegistry
+from prometheus_client import Counter
+from prometheus_client import Gauge
+from prometheus_client import Histogram
+
+
+TEST_SERVER_URL = "http://localhost:8080"
+LABELS = ["client_name", "http_method", "http_target"]
+
+
+def _metrics_integration(module, registry):
+    return module.DefaultMetricsIntegration(
+        client_response_time_histogram=Histogram(
+            "client_response_time", "", [*LABELS, "http_status_code"], registry=registry
+        ),
+        client_non_http_errors_counter=Counter("client_non_http_errors", "", [*LABELS, "exception"], registry=registry),
+        client_request_size_histogram=Histogram("client_request_size", "", LABELS, registry=registry),
+        client_response_size_histogram=Histogram("client_response_size", "", LABELS, registry=registry),
+        client_in_flight_requests_gauge=Gauge("client_in_flight_requests", "", LABELS, registry=registry),
+    )
+
+
+def test_operation_metrics():
+    registry = CollectorRegistry()
+    in_flight = []
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        in_flight.append(registry.get_sample_value("client_in_flight_requests", labels))
+        if request.url.path == "/objects/0":
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(200, stream=httpx.ByteStream(b'{"integer_data_all_params": 2}'))
+
+    labels = {"client_name": "test", "http_method": "post", "http_target": "/objects"}
+    client = sync_client_with_metrics.Client(
+        TEST_SERVER_URL,
+        client_name="test",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        metrics_integration=_metrics_integration(sync_client_with_metrics, registry),
+    )
+
+    assert client.post_object(body={"string_data": "abc"})
+    assert in_flight == [1]
+    assert registry.get_sample_value("client_in_flight_requests", labels) == 0
+    assert registry.get_sample_value("client_response_time_count", {**labels, "http_status_code": "200"}) == 1
+    assert registry.get_sample_value("client_request_size_sum", labels) == len(requests[0].content)
+    assert registry.get_sample_value("client_response_size_sum", labels) == len(b'{"integer_data_all_params": 2}')
+
+    error_labels = {"client_name": "test", "http_method": "get", "http_target": "/objects/:object_id"}
+    with pytest.raises(httpx.ConnectError):
+        client.get_object(path_params={"object_id": "0"}, query_params={"return_error": "", "from": ""})
+    assert registry.get_sample_value("client_non_http_errors_total", {**error_labels, "exception": "ConnectError"}) == 1
+    assert registry.get_sample_value("client_in_flight_requests", error_labels) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_operation_metrics():
+    registry = CollectorRegistry()
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(204, stream=httpx.ByteStream(b"")))
+    )
+    client = async_client_with_metrics.Client(
+        TEST_SERVER_URL,
+        client_name="test",
+        client=http_client,
+        metrics_integration=_metrics_integration(async_client_with_metrics, registry),
+    )
+
+    await client.get_empty()
+
+    labels = {"client_name": "test", "http_method": "get", "http_target": "/empty", "http_status_code": "204"}
+    assert registry.get_sample_value("client_response_time_count", labels) == 1
+
+
+class RecordingMetricsIntegration:
+    def __init__(self, shadow_path=True):
+        self._shadow_path = shadow_path
+        self.shadow_path_calls = 0
+        self.targets = []
+
+    def on_request_error(self, client_name, error, http_method, http_target):
+        pass
+
+    def on_request_success(self, client_name, response, http_method, http_target):
+        self.targets.append(http_target)
+
+    def shadow_path(self):
+        self.shadow_path_calls += 1
+        return self._shadow_path
+
+
+def test_metrics_without_bound_operations():
+    http_client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})))
+    metrics = RecordingMetricsIntegration(shadow_path=False)
+    client = sync_client.Client(TEST_SERVER_URL, client=http_client, metrics_integration=metrics)
+
+    client.get_empty()
+    client.delete_object(path_params={"object_id": "1"})
+
+    assert metrics.targets == ["/empty", "/objects/1"]
+    assert metrics.shadow_path_calls == 1
+
+    client.metrics_integration = metrics = RecordingMetricsIntegration()
+    client.delete_object(path_params={"object_id": "1"})
+    assert metrics.targets == ["/objects/:object_id"]
+
+
+def test_default_metrics_integration_subclass():
+    class MetricsIntegration(sync_client_with_metrics.DefaultMetricsIntegration):
+        def on_request_success(self, client_name, response, http_method, http_target):
+            calls.append(http_target)
+
+    calls = []
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(204, stream=httpx.ByteStream(b"")))
+    )
+    client = sync_client_with_metrics.Client(
+        TEST_SERVER_URL, client=http_client, metrics_integration=MetricsIntegration()
+    )
+
+    client.get_empty()
+
+    assert calls == ["/empty"]  # the overriding method is not bypassed by the bound metrics
+
+
+class RecordingOperationMetrics:
+    def __init__(self):
+        self.starts = 0
+        self.successes = 0
+
+    def on_request_start(self):
+        self.starts += 1
+
+    def on_request_end(self):
+        pass
+
+    def on_request_success(self, response):
+        self.successes += 1
+
+    def on_request_error(self, error):
+        pass
+
+
+class BindingMetricsIntegration(RecordingMetricsIntegration):
+    def __init__(self):
+        super().__init__()
+        self.operations = {}
+
+    def bind_operation(self, client_name, http_method, http_target):
+        return self.operations.setdefault(http_target, RecordingOperationMetrics())
+
+
+def test_cache_hits_are_not_in_flight():
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(
+                200,
+                headers={"Cache-Control": "max-age=60"},
+                stream=httpx.ByteStream(b'{"integer_data_all_params": 2}'),
+            )
+        )
+    )
+    metrics = BindingMetricsIntegration()
+    client = sync_client.Client(
+        TEST_SERVER_URL, client=http_client, metrics_integration=metrics, response_cache=sync_client.MemoryCache()
+    )
+
+    for _ in range(3):
+        client.get_object(path_params={"object_id": "1"}, query_params={"return_error": "", "from": ""})
+
+    operation_metrics = metrics.operations["/objects/:object_id"]
+    assert operation_metrics.starts == operation_metrics.successes == 1
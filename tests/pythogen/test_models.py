@@ -1,4 +1,7 @@
+from clients import sync_client
 from clients.sync_client import SafetyKeyForTesting
+from pydantic import BaseModel
+
 from pythogen import models
 
 
@@ -45,3 +48,96 @@ def test_safety_key():
 def test_format_missing():
     assert models.Format("date-time") is models.Format.datetime
     assert models.Format("datetime") is models.Format.datetime
+
+
+def _schema(schema_id: str, **kwargs) -> models.SchemaObject:
+    return models.SchemaObject(
+        id=schema_id,
+        title=None,
+        enum=kwargs.pop("enum", None),
+        type=kwargs.pop("type", models.Type.object),
+        format=None,
+        items=kwargs.pop("items", None),
+        properties=kwargs.pop("properties", []),
+        **kwargs,
+    )
+
+
+def _property(key: str, schema: models.SchemaObject) -> models.SchemaProperty:
+    return models.SchemaProperty(orig_key=key, safety_key=None, schema=schema)
+
+
+def test_sorted_schemas():
+    enum = _schema("Enum", type=models.Type.string, enum=["a"])
+    base = _schema("Base", properties=[_property("kind", enum)])
+    item = _schema("Item")
+    cat = _schema("Cat")
+    dog = _schema("Dog")
+    recursive = _schema("Recursive")
+    recursive.properties.append(_property("children", _schema("children_list", type=models.Type.array, items=recursive)))
+    child = _schema(
+        "Child",
+        all_of=[base],
+        properties=[
+            _property("items", _schema("items_list", type=models.Type.array, items=item)),
+            _property("pet", _schema("pet_obj", any_of=[cat, dog])),
+            _property("tree", recursive),
+        ],
+    )
+    discriminated = _schema(
+        "Discriminated",
+        discriminator=models.Discriminator(property_name="kind", mapping={"cat": cat, "dog": dog}),
+    )
+
+    document = models.Document(
+        info=models.InfoObject(title="test", version="0.0.1"),
+        paths={},
+        parameters={},
+        schemas={s.id: s for s in (discriminated, child, recursive, dog, cat, item, base, enum)},
+        discriminator_base_class_schemas=[],
+    )
+
+    assert document.schema_dependencies["Child"] == ["Item", "Cat", "Dog", "Recursive", "Base"]
+    assert document.schema_dependencies["Recursive"] == ["Recursive"]
+    assert [s.id for s in document.sorted_enums] == ["Enum"]
+
+    order = [s.id for s in document.sorted_schemas]
+    assert sorted(order) == sorted(["Discriminated", "Child", "Recursive", "Dog", "Cat", "Item", "Base"])
+    for schema_id, dependencies in document.schema_dependencies.items():
+        for dependency in dependencies:
+            if dependency in order and schema_id in order and dependency != schema_id:
+                assert order.index(dependency) < order.index(schema_id)
+    assert document.sorted_schemas is document.sorted_schemas
+    assert document.recursive_schemas == {"Recursive"}
+
+
+def test_recursive_schemas():
+    # Parent <-> Child, Tree -> Tree, Owner -> Parent, Leaf
+    parent = _schema("Parent")
+    child = _schema("Child", properties=[_property("parent", parent)])
+    parent.properties.append(_property("children", _schema("children_list", type=models.Type.array, items=child)))
+    tree = _schema("Tree")
+    tree.properties.append(_property("subtree", _schema("subtree_obj", any_of=[tree])))
+    owner = _schema("Owner", properties=[_property("parent", parent)])
+    leaf = _schema("Leaf")
+
+    document = models.Document(
+        info=models.InfoObject(title="test", version="0.0.1"),
+        paths={},
+        parameters={},
+        schemas={s.id: s for s in (owner, leaf, tree, child, parent)},
+        discriminator_base_class_schemas=[],
+    )
+
+    assert document.recursive_schemas == {"Parent", "Child", "Tree"}
+
+
+def test_models_are_built_on_import():
+    models_classes = [
+        value
+        for value in vars(sync_client).values()
+        if isinstance(value, type) and issubclass(value, BaseModel) and value.__module__ == sync_client.__name__
+    ]
+
+    assert models_classes
+    assert all(model_class.__pydantic_complete__ for model_class in models_classes)
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+from clients import sync_client_package
+from pythogen import renderer
+from pythogen.parsers.document import parse_openapi_file
+
+
+OPENAPI_PATH = "tests/docs/openapi.yaml"
+TEST_SERVER_URL = "http://localhost:8080"
+
+
+def test_group_models():
+    document = parse_openapi_file(OPENAPI_PATH)
+
+    groups = renderer.group_models(document)
+
+    module_of_model = {model.id: group.module_name for group in groups for model in group.models}
+    assert len(set(module_of_model.values())) == len(groups) > 1
+    for model_id, module_name in module_of_model.items():
+        for dependency in document.schema_dependencies[model_id]:
+            if dependency in module_of_model:
+                assert module_of_model[dependency] == module_name
+
+
+def test_package_models_are_imported_lazily():
+    code = (
+        "import sys\n"
+        "from clients.sync_client_package import Client\n"
+        "print(sorted(name for name in sys.modules if name.startswith('clients.sync_client_package.models.')))\n"
+    )
+    process = subprocess.run([sys.executable, "-c", code], cwd="tests", capture_output=True, text=True, check=True)
+
+    assert process.stdout.strip() == "[]"
+
+
+def test_package_client():
+    client = sync_client_package.Client(TEST_SERVER_URL)
+
+    response = client.get_object(
+        path_params=sync_client_package.GetObjectPathParams(object_id="123"),
+        query_params={"return_error": "", "from": ""},
+    )
+    assert isinstance(response, sync_client_package.GetObjectResp)
+
+    response = client.get_object(path_params={"object_id": "123"}, query_params={"return_error": "true", "from": ""})
+    assert isinstance(response, sync_client_package.UnknownError)
+
+    data = sync_client_package.PostObjectData(
+        string_data="string_data",
+        integer_data=1,
+        boolean_data=True,
+        array_data=["1", "2", "3"],
+        event_data={"event": "delivered"},
+        str_enum=sync_client_package.StringEnum.FIRST_FIELD,
+    )
+    response = client.post_object(body=data)
+    assert isinstance(response, sync_client_package.PostObjectResp)
+
+    assert "GetObjectResp" in dir(sync_client_package)
+
+
+def test_package_exports_runtime_classes():
+    client_module = sync_client_package.client
+
+    assert "HedgePolicy" in renderer._runtime_names(sync=False, metrics=False)
+    assert "DefaultMetricsIntegration" in renderer._runtime_names(sync=True, metrics=True)
+    for name in renderer._runtime_names(sync=True, metrics=False):
+        assert getattr(sync_client_package, name) is getattr(client_module, name)
@@ -0,0 +1,56 @@
+import pytest
+
+from pythogen.parsers.references import RefResolver
+
+
+OPENAPI_DATA = {
+    "components": {
+        "schemas": {
+            "Pet": {"type": "object"},
+            "a/b": {"type": "string"},
+            "m~n": {"type": "integer"},
+            "with space": {"type": "boolean"},
+        },
+    },
+    "paths": {
+        "/pets": {"get": {"parameters": [{"name": "limit"}, {"name": "offset"}]}},
+    },
+}
+
+
+def test_resolve():
+    resolver = RefResolver(OPENAPI_DATA)
+
+    resolved_ref = resolver.resolve("#/components/schemas/Pet")
+    assert resolved_ref.ref_id == "Pet"
+    assert resolved_ref.ref_data is OPENAPI_DATA["components"]["schemas"]["Pet"]
+    assert resolver.resolve("#/components/schemas/Pet") is resolved_ref
+
+    assert resolver.stats.hits == 1
+    assert resolver.stats.misses == 1
+
+
+def test_resolve_escaped_pointer():
+    resolver = RefResolver(OPENAPI_DATA)
+
+    assert resolver.resolve("#/components/schemas/a~1b").ref_data == {"type": "string"}
+    assert resolver.resolve("#/components/schemas/a~1b").ref_id == "a/b"
+    assert resolver.resolve("#/components/schemas/m~0n").ref_data == {"type": "integer"}
+    assert resolver.resolve("#/components/schemas/with%20space").ref_data == {"type": "boolean"}
+    assert resolver.resolve("#/paths/~1pets/get/parameters/1").ref_data == {"name": "offset"}
+    assert resolver.resolve("#").ref_data is OPENAPI_DATA
+
+
+@pytest.mark.parametrize(
+    "ref",
+    [
+        "#/components/schemas/Unknown",
+        "#/paths/~1pets/get/parameters/2",
+        "other.yaml#/components/schemas/Pet",
+    ],
+)
+def test_resolve_error(ref: str):
+    resolver = RefResolver(OPENAPI_DATA)
+
+    with pytest.raises(Exception, match="Unable to resolve"):
+        resolver.resolve(ref)
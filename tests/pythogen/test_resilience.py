@@ -0,0 +1,481 @@
+import asyncio
+import datetime
+import time
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from clients import async_client
+from clients import sync_client
+
+
+TEST_SERVER_URL = "http://localhost:8080"
+NO_BACKOFF = sync_client.RetryPolicy(backoff_base=0)
+
+
+class RecordingMetricsIntegration:
+    def __init__(self):
+        self.retries = []
+
+    def on_request_error(self, client_name, error, http_method, http_target):
+        pass
+
+    def on_request_success(self, client_name, response, http_method, http_target):
+        pass
+
+    def on_request_retry(self, client_name, http_method, http_target, reason, delay):
+        self.retries.append((http_method, http_target, reason, delay))
+
+    def shadow_path(self):
+        return True
+
+
+def _responses(*responses):
+    """Handler of httpx.MockTransport that returns the responses in turn and records the requests"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        response = responses[min(len(requests), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return handler, requests
+
+
+def _client(module, handler, **kwargs):
+    if module is sync_client:
+        http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    else:
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return module.Client(TEST_SERVER_URL, client=http_client, **kwargs)
+
+
+def test_retry_idempotent_operation():
+    handler, requests = _responses(
+        httpx.Response(503),
+        httpx.ConnectError("connection refused"),
+        httpx.Response(200, json={"integer_data_all_params": 2}),
+    )
+    metrics = RecordingMetricsIntegration()
+    client = _client(sync_client, handler, retry_policy=NO_BACKOFF, metrics_integration=metrics)
+
+    response = client.get_object(path_params={"object_id": "1"}, query_params={"return_error": "", "from": ""})
+
+    assert response == sync_client.GetObjectResp(integer_data_all_params=2)
+    assert len(requests) == 3
+    assert metrics.retries == [
+        ("get", "/objects/:object_id", "503", 0.0),
+        ("get", "/objects/:object_id", "ConnectError", 0.0),
+    ]
+
+
+def test_retry_attempts_are_limited():
+    handler, requests = _responses(httpx.Response(502))
+    client = _client(sync_client, handler, retry_policy=sync_client.RetryPolicy(attempts=4, backoff_base=0))
+
+    assert client.get_empty() is None  # 502 isn't described
+    assert len(requests) == 4
+
+    handler, requests = _responses(httpx.ReadError("connection reset"))
+    client = _client(sync_client, handler, retry_policy=NO_BACKOFF)
+
+    with pytest.raises(httpx.ReadError):
+        client.get_empty()
+    assert len(requests) == 3
+
+
+def test_no_retries_by_default():
+    handler, requests = _responses(httpx.Response(503), httpx.Response(200))
+    client = _client(sync_client, handler)
+
+    client.get_empty()
+
+    assert len(requests) == 1
+
+
+def test_retry_non_idempotent_operation():
+    handler, requests = _responses(httpx.Response(503), httpx.Response(200, json={}))
+
+    # POST
+    client = _client(sync_client, handler, retry_policy=NO_BACKOFF)
+    client.post_object(body={"string_data": "a"})
+    assert len(requests) == 1
+
+    # POST, opted in by the client
+    requests.clear()
+    client = _client(sync_client, handler, retry_policy=NO_BACKOFF, idempotent_operations=["post_object"])
+    client.post_object(body={"string_data": "a"})
+    assert len(requests) == 2
+
+    # POST with x-idempotent: true
+    requests.clear()
+    client = _client(sync_client, handler, retry_policy=NO_BACKOFF)
+    client.post_object_without_body()
+    assert len(requests) == 2
+
+    # PUT with x-idempotent: false
+    requests.clear()
+    client = _client(sync_client, handler, retry_policy=NO_BACKOFF)
+    client.put_object_slow(path_params={"object_id": "1"}, body={"string_data": "a"})
+    assert len(requests) == 1
+
+
+def test_no_retries_of_streamed_content():
+    handler, requests = _responses(httpx.Response(503), httpx.Response(200, json={"size": 1}))
+    client = _client(sync_client, handler, retry_policy=NO_BACKOFF, idempotent_operations=["upload"])
+
+    client.upload(content=iter([b"x"]))
+    assert len(requests) == 1
+
+    requests.clear()
+    client.upload(content=b"x")
+    assert len(requests) == 2
+
+
+def test_retry_after():
+    assert sync_client._retry_after(httpx.Response(503, headers={"Retry-After": "2"})) == 2
+    date = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=30)
+    retry_after = sync_client._retry_after(httpx.Response(503, headers={"Retry-After": format_datetime(date)}))
+    assert 28 < retry_after <= 30
+    assert sync_client._retry_after(httpx.Response(503, headers={"Retry-After": "soon"})) is None
+    assert sync_client._retry_after(httpx.Response(503)) is None
+
+    policy = sync_client.RetryPolicy(retry_after_max=60)
+    assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "5"})) == 5
+    assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "120"})) is None
+    assert 0 <= policy.delay(2, httpx.Response(503)) <= 0.2
+    assert policy.delay(3, httpx.Response(503)) is None
+
+
+def test_retry_budget():
+    handler, requests = _responses(httpx.Response(503))
+    budget = sync_client.RetryBudget(ratio=0.5, max_tokens=2)
+    client = _client(sync_client, handler, retry_policy=NO_BACKOFF, retry_budget=budget)
+
+    client.get_empty()
+    assert len(requests) == 3  # the budget is full
+
+    requests.clear()
+    client.get_empty()
+    assert len(requests) == 1  # 0.5 token is left
+
+    requests.clear()
+    client.get_empty()
+    assert len(requests) == 2  # 1 token
+
+
+@pytest.mark.asyncio
+async def test_async_retry():
+    handler, requests = _responses(
+        httpx.Response(503, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"integer_data_all_params": 2}),
+    )
+    metrics = RecordingMetricsIntegration()
+    client = _client(async_client, handler, retry_policy=async_client.RetryPolicy(), metrics_integration=metrics)
+
+    response = await client.get_object(path_params={"object_id": "1"}, query_params={"return_error": "", "from": ""})
+
+    assert response == async_client.GetObjectResp(integer_data_all_params=2)
+    assert len(requests) == 2
+    assert metrics.retries == [("get", "/objects/:object_id", "503", 0.0)]
+
+
+class RecordingHedgesMetricsIntegration(RecordingMetricsIntegration):
+    def __init__(self):
+        super().__init__()
+        self.hedges = []
+
+    def on_request_hedged(self, client_name, http_method, http_target, won):
+        self.hedges.append((http_method, http_target, won))
+
+
+def _slow_first_responses(seconds=1.0):
+    """Async handler of httpx.MockTransport that answers the first request in `seconds`, the others at once"""
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            await asyncio.sleep(seconds)
+        return httpx.Response(200, json={"integer_data_all_params": len(requests)})
+
+    return handler, requests
+
+
+@pytest.mark.asyncio
+async def test_hedged_request():
+    handler, requests = _slow_first_responses()
+    metrics = RecordingHedgesMetricsIntegration()
+    client = _client(
+        async_client, handler, hedge_policy=async_client.HedgePolicy(delay=0.05), metrics_integration=metrics
+    )
+
+    started_at = time.perf_counter()
+    response = await client.get_object(path_params={"object_id": "1"}, query_params={"return_error": "", "from": ""})
+
+    assert time.perf_counter() - started_at < 0.5
+    assert response.integer_data_all_params == 2  # the response of the hedge
+    assert len(requests) == 2
+    assert metrics.hedges == [("get", "/objects/:object_id", True)]
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_policies():
+    handler, requests = _slow_first_responses(seconds=0.2)
+    policy = async_client.HedgePolicy(delay=0.05)
+
+    # POST is not hedged by default
+    client = _client(async_client, handler, hedge_policy=policy)
+    await client.post_object(body={"string_data": "a"})
+    assert len(requests) == 1
+
+    # hedging is turned off for the operation
+    requests.clear()
+    client = _client(async_client, handler, hedge_policy=policy, hedge_policies={"get_empty": None})
+    await client.get_empty()
+    assert len(requests) == 1
+
+    # the budget is empty
+    requests.clear()
+    client = _client(async_client, handler, hedge_policy=policy, hedge_budget=async_client.RetryBudget(max_tokens=0))
+    await client.get_empty()
+    assert len(requests) == 1
+
+    # hedging is turned on for the operation only
+    requests.clear()
+    client = _client(async_client, handler, hedge_policies={"post_object": policy})
+    await client.post_object(body={"string_data": "a"})
+    assert len(requests) == 2
+
+
+def test_hedge_delay_percentile():
+    policy = async_client.HedgePolicy(percentile=0.95, window=100, min_samples=20)
+    latencies = async_client._Latencies(policy.window)
+
+    for seconds in range(19):
+        latencies.add(seconds)
+    assert latencies.percentile(policy) is None
+
+    for seconds in range(19, 200):
+        latencies.add(seconds)
+    assert latencies.percentile(policy) == 195  # of the last 100 latencies: 100..199
+
+
+class RecordingCircuitIntegration(RecordingMetricsIntegration, sync_client.DefaultLogsIntegration):
+    def __init__(self):
+        super().__init__()
+        self.states = []
+        self.logged_states = []
+
+    def on_circuit_state_change(self, client_name, circuit, state):
+        self.states.append((circuit, state))
+
+    def log_circuit_state_change(self, client_name, circuit, state):
+        self.logged_states.append((circuit, state))
+
+
+CIRCUIT_BREAKER = sync_client.CircuitBreakerPolicy(window=4, min_calls=4, failure_rate=0.5, open_seconds=60)
+
+
+def test_circuit_breaker_opens():
+    handler, requests = _responses(httpx.Response(200), httpx.Response(503), httpx.Response(200), httpx.Response(503))
+    integration = RecordingCircuitIntegration()
+    client = _client(
+        sync_client,
+        handler,
+        circuit_breaker=CIRCUIT_BREAKER,
+        metrics_integration=integration,
+        logs_integration=integration,
+    )
+
+    for _ in range(4):
+        client.get_empty()
+    client.get_text()  # the circuit of another operation is closed
+
+    with pytest.raises(sync_client.CircuitOpenError) as exc_info:
+        client.get_empty()
+    assert exc_info.value.circuit == "get_empty"
+    assert 59 < exc_info.value.retry_after <= 60
+    assert len(requests) == 5
+    assert integration.states == integration.logged_states == [("get_empty", "open")]
+
+
+def test_circuit_breaker_half_open(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(sync_client.time, "monotonic", lambda: now)
+    handler, requests = _responses(httpx.ReadError("connection reset"))
+    integration = RecordingCircuitIntegration()
+    client = _client(sync_client, handler, circuit_breaker=CIRCUIT_BREAKER, metrics_integration=integration)
+
+    for _ in range(4):
+        with pytest.raises(httpx.ReadError):
+            client.get_empty()
+
+    # the trial call fails
+    now += 60
+    with pytest.raises(httpx.ReadError):
+        client.get_empty()
+    with pytest.raises(sync_client.CircuitOpenError):
+        client.get_empty()
+
+    # the trial call succeeds
+    now += 60
+    handler, requests = _responses(httpx.Response(200))
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    client.get_empty()
+    client.get_empty()
+
+    assert len(requests) == 2
+    assert integration.states == [
+        ("get_empty", "open"),
+        ("get_empty", "half_open"),
+        ("get_empty", "open"),
+        ("get_empty", "half_open"),
+        ("get_empty", "closed"),
+    ]
+
+
+def test_circuit_breaker_of_host():
+    handler, requests = _responses(httpx.Response(503))
+    policy = sync_client.CircuitBreakerPolicy(window=2, min_calls=2, key="host")
+    client = _client(sync_client, handler, circuit_breaker=policy)
+
+    client.get_empty()
+    client.get_text()
+
+    with pytest.raises(sync_client.CircuitOpenError) as exc_info:
+        client.get_binary()
+    assert exc_info.value.circuit == "localhost:8080"
+
+
+@pytest.mark.asyncio
+async def test_async_circuit_breaker():
+    handler, requests = _responses(httpx.Response(503))
+    policy = async_client.CircuitBreakerPolicy(window=2, min_calls=2)
+    client = _client(async_client, handler, circuit_breaker=policy, retry_policy=async_client.RetryPolicy(attempts=5))
+
+    # retries stop when the circuit opens
+    with pytest.raises(async_client.CircuitOpenError):
+        await client.get_empty()
+    assert len(requests) == 2
+
+
+def test_circuit_breaker_of_streaming_methods(tmp_path):
+    handler, requests = _responses(httpx.Response(503), httpx.ReadError("connection reset"))
+    policy = sync_client.CircuitBreakerPolicy(window=2, min_calls=2, key="host")
+    client = _client(sync_client, handler, circuit_breaker=policy)
+
+    with pytest.raises(sync_client.UnexpectedResponse):
+        list(client.stream_get_list_objects())
+    with pytest.raises(httpx.ReadError):
+        client.download_get_binary(destination=tmp_path / "binary")
+
+    with pytest.raises(sync_client.CircuitOpenError):
+        list(client.stream_get_list_objects())
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_circuit_breaker_of_streaming_methods():
+    handler, requests = _responses(httpx.Response(503))
+    policy = async_client.CircuitBreakerPolicy(window=2, min_calls=2)
+    client = _client(async_client, handler, circuit_breaker=policy)
+
+    for _ in range(2):
+        with pytest.raises(async_client.UnexpectedResponse):
+            await client.download_get_binary(destination=lambda chunk: None)
+
+    with pytest.raises(async_client.CircuitOpenError):
+        await client.download_get_binary(destination=lambda chunk: None)
+    assert len(requests) == 2
+
+
+def test_token_bucket(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(sync_client.time, "monotonic", lambda: now)
+    bucket = sync_client.TokenBucket(sync_client.RateLimit(requests=2, period=1, burst=3))
+
+    assert [bucket.reserve() for _ in range(5)] == [0, 0, 0, 0.5, 1.0]
+
+    now += 2  # refills 4 tokens, 2 of them are reserved
+    assert bucket.reserve() == 0
+
+    bucket.update(remaining=0, reset=10)  # the quota of the server is used up
+    assert bucket.reserve() == 10.5
+
+
+def test_rate_limit_quota(monkeypatch):
+    monkeypatch.setattr(sync_client.time, "time", lambda: 1_700_000_000.0)
+
+    def quota(status_code=200, **headers):
+        return sync_client._rate_limit_quota(httpx.Response(status_code, headers=headers))
+
+    assert quota(**{"RateLimit-Remaining": "5", "RateLimit-Reset": "30"}) == (5, 30)
+    assert quota(**{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000010"}) == (0, 10)
+    assert quota(**{"X-RateLimit-Remaining": "many"}) is None
+    assert quota() is None
+    assert quota(429, **{"Retry-After": "3"}) == (0, 3)
+
+
+def test_rate_limits():
+    handler, requests = _responses(httpx.Response(200, json={"integer_data_all_params": 2}))
+    client = _client(sync_client, handler)
+
+    assert client._rate_limiters["get_object_slow"].limit == sync_client.RateLimit(requests=100, period=60, burst=10)
+    assert client.rate_limiter is None
+
+    client = _client(
+        sync_client,
+        handler,
+        rate_limit=sync_client.RateLimit(requests=10),
+        rate_limits={"get_object_slow": None, "get_empty": sync_client.RateLimit(requests=1)},
+    )
+    assert set(client._rate_limiters) == {"get_empty"}
+    assert client.rate_limiter.limit.requests == 10
+
+
+class RecordingThrottleMetricsIntegration(RecordingMetricsIntegration):
+    def __init__(self):
+        super().__init__()
+        self.throttled = []
+
+    def on_request_throttled(self, client_name, http_method, http_target, delay):
+        self.throttled.append((http_method, http_target, delay))
+
+
+@pytest.mark.asyncio
+async def test_async_rate_limit():
+    handler, requests = _responses(
+        httpx.Response(200, headers={"RateLimit-Remaining": "0", "RateLimit-Reset": "0.2"}),
+        httpx.Response(200),
+    )
+    metrics = RecordingThrottleMetricsIntegration()
+    client = _client(
+        async_client, handler, rate_limit=async_client.RateLimit(requests=1000), metrics_integration=metrics
+    )
+
+    started_at = time.perf_counter()
+    await client.get_empty()
+    await client.get_empty()  # waits for the reset of the quota
+
+    assert time.perf_counter() - started_at >= 0.15
+    assert len(requests) == 2
+    assert [target for _, target, _ in metrics.throttled] == ["/empty"]
+
+
+def test_rate_limit_of_streaming_methods(tmp_path):
+    handler, requests = _responses(
+        httpx.Response(200, headers={"RateLimit-Remaining": "0", "RateLimit-Reset": "0.2"}, json=[]),
+        httpx.Response(200, content=b"binary"),
+    )
+    metrics = RecordingThrottleMetricsIntegration()
+    client = _client(sync_client, handler, rate_limit=sync_client.RateLimit(requests=1000), metrics_integration=metrics)
+
+    assert list(client.stream_get_list_objects()) == []
+    client.download_get_binary(destination=tmp_path / "binary")  # waits for the reset of the quota
+
+    assert len(requests) == 2
+    assert [target for _, target, _ in metrics.throttled] == ["/binary"]
+    assert metrics.throttled[0][2] > 0.15
@@ -0,0 +1,217 @@
+import datetime
+import gzip
+import json
+import os
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from clients import async_client
+from clients import sync_client
+
+
+TEST_SERVER_URL = "http://localhost:8080"
+OBJECT = {"integer_data_all_params": 2}
+QUERY_PARAMS = {"return_error": "", "from": ""}
+
+
+class RecordingMetricsIntegration:
+    def __init__(self):
+        self.lookups = []
+        self.requests = []
+
+    def on_request_error(self, client_name, error, http_method, http_target):
+        pass
+
+    def on_request_success(self, client_name, response, http_method, http_target):
+        self.requests.append(response.status_code)
+
+    def on_cache_lookup(self, client_name, http_method, http_target, result):
+        self.lookups.append(result)
+
+    def shadow_path(self):
+        return True
+
+
+def _server(headers, etag=None):
+    """Handler of httpx.MockTransport that answers with the headers, or 304 if the ETag matches"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        # streamed as by a real transport, which sets response.elapsed
+        if etag is not None and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(
+                304, headers={"ETag": etag, "Cache-Control": "max-age=60"}, stream=httpx.ByteStream(b"")
+            )
+        body = gzip.compress(json.dumps(OBJECT).encode())
+        return httpx.Response(200, headers={**headers, "Content-Encoding": "gzip"}, stream=httpx.ByteStream(body))
+
+    return handler, requests
+
+
+def _client(handler, **kwargs):
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    return sync_client.Client(TEST_SERVER_URL, client=http_client, **kwargs)
+
+
+def _get_object(client, object_id="1"):
+    return client.get_object(path_params={"object_id": object_id}, query_params=QUERY_PARAMS)
+
+
+def test_fresh_response_is_returned_from_cache():
+    handler, requests = _server({"Cache-Control": "max-age=60"})
+    metrics = RecordingMetricsIntegration()
+    client = _client(handler, response_cache=sync_client.MemoryCache(), metrics_integration=metrics)
+
+    first = _get_object(client)
+    second = _get_object(client)
+    _get_object(client, object_id="2")
+
+    assert first == sync_client.GetObjectResp(**OBJECT)
+    assert second is first  # decoded once
+    assert len(requests) == 2
+    assert metrics.lookups == ["miss", "hit", "miss"]
+    assert metrics.requests == [200, 200]  # hits are not requests
+
+
+def test_expires():
+    now = datetime.datetime.now(datetime.timezone.utc)
+    headers = {
+        "Date": format_datetime(now, usegmt=True),
+        "Expires": format_datetime(now + datetime.timedelta(minutes=1), usegmt=True),
+    }
+    handler, requests = _server(headers)
+    client = _client(handler, response_cache=sync_client.MemoryCache())
+
+    _get_object(client)
+    _get_object(client)
+
+    assert len(requests) == 1
+
+
+def test_stale_response_is_revalidated():
+    handler, requests = _server({"Cache-Control": "no-cache", "ETag": '"v1"'}, etag='"v1"')
+    metrics = RecordingMetricsIntegration()
+    client = _client(handler, response_cache=sync_client.MemoryCache(), metrics_integration=metrics)
+
+    first = _get_object(client)
+    second = _get_object(client)
+    third = _get_object(client)  # the 304 response made the entry fresh
+
+    assert second is first
+    assert third is first
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert metrics.lookups == ["miss", "revalidated", "hit"]
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"Cache-Control": "no-store, max-age=60"},
+        {"Cache-Control": "max-age=60, no-cache"},
+        {"Expires": "Thu, 01 Jan 1970 00:00:00 GMT"},
+    ],
+)
+def test_response_is_not_cached(headers):
+    handler, requests = _server(headers)
+    client = _client(handler, response_cache=sync_client.MemoryCache())
+
+    _get_object(client)
+    _get_object(client)
+
+    assert len(requests) == 2
+
+
+def test_cached_operations():
+    handler, requests = _server({"Cache-Control": "max-age=60"})
+    client = _client(handler, response_cache=sync_client.MemoryCache(), cached_operations=["get_empty"])
+
+    _get_object(client)
+    _get_object(client)
+    assert len(requests) == 2
+
+    # per-call auth isn't a part of the key
+    requests.clear()
+    client = _client(handler, response_cache=sync_client.MemoryCache())
+    auth = sync_client.BasicAuth(username="user", password="password")
+    client.get_object(path_params={"object_id": "1"}, query_params=QUERY_PARAMS, auth=auth)
+    client.get_object(path_params={"object_id": "1"}, query_params=QUERY_PARAMS, auth=auth)
+    assert len(requests) == 2
+
+
+def _entry(size, fresh_until=0.0):
+    return sync_client.CacheEntry(200, [], b"x" * size, fresh_until)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = sync_client.MemoryCache(max_bytes=250)
+    cache.set("a", _entry(100))
+    cache.set("b", _entry(100))
+    cache.get("a")
+    cache.set("c", _entry(100))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+    cache.set("d", _entry(300))  # larger than the cache
+    assert cache.get("d") is None
+
+
+def test_disk_cache(tmp_path):
+    handler, requests = _server({"Cache-Control": "max-age=60"})
+    client = _client(handler, response_cache=sync_client.DiskCache(tmp_path))
+    first = _get_object(client)
+
+    # another process
+    client = _client(handler, response_cache=sync_client.DiskCache(tmp_path))
+    second = _get_object(client)
+
+    assert second == first
+    assert len(requests) == 1
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = sync_client.DiskCache(tmp_path, max_bytes=2500)
+    cache.set("a", _entry(1000))
+    cache.set("b", _entry(1000))
+    for path in tmp_path.iterdir():  # the files were written in the same second
+        mtime = 1000 if path.name.startswith("a") else 2000
+        os.utime(path, (mtime, mtime))
+    cache.set("c", _entry(1000))
+
+    assert cache.get("a") is None
+    assert cache.get("b").content == b"x" * 1000
+    assert cache.get("c") is not None
+
+    (tmp_path / "b.pickle").write_bytes(b"damaged")
+    assert cache.get("b") is None
+    assert not (tmp_path / "b.pickle").exists()
+
+
+def test_disk_cache_counts_overwritten_entries_once(tmp_path):
+    cache = sync_client.DiskCache(tmp_path)
+    for size in (1000, 3000, 2000, 2000):
+        cache.set("a", _entry(size))
+    cache.set("b", _entry(1000))
+    cache.delete("b")
+
+    assert cache._bytes == (tmp_path / "a.pickle").stat().st_size
+    assert sync_client.DiskCache(tmp_path)._bytes == cache._bytes
+
+
+@pytest.mark.asyncio
+async def test_async_response_cache():
+    handler, requests = _server({"Cache-Control": "no-cache", "ETag": '"v1"'}, etag='"v1"')
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = async_client.Client(TEST_SERVER_URL, client=http_client, response_cache=async_client.MemoryCache())
+
+    first = await client.get_object(path_params={"object_id": "1"}, query_params=QUERY_PARAMS)
+    second = await client.get_object(path_params={"object_id": "1"}, query_params=QUERY_PARAMS)
+
+    assert second is first
+    assert len(requests) == 2
@@ -0,0 +1,200 @@
+import io
+import json
+import tracemalloc
+
+import httpx
+import pytest
+from clients import async_client
+from clients import sync_client
+
+
+TEST_SERVER_URL = "http://localhost:8080"
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 1024])
+def test_json_array_items(chunk_size):
+    items = [
+        {'a': '[{,}]', 'b': 'quote \\" and backslash \\\\', 'c': [1, {'d': None}]},
+        'string, with ] brackets and ünicode ✓',
+        12.5e3,
+        True,
+        None,
+        [],
+        {},
+    ]
+    data = json.dumps(items, indent=1, ensure_ascii=False).encode()
+
+    array_items = sync_client._JsonArrayItems()
+    decoded_items = []
+    for i in range(0, len(data), chunk_size):
+        decoded_items.extend(array_items.feed(data[i : i + chunk_size]))
+    array_items.close()
+
+    assert decoded_items == items
+
+
+@pytest.mark.parametrize('data', [b'[]', b' [ ] '])
+def test_json_array_items_empty_array(data):
+    array_items = sync_client._JsonArrayItems()
+    assert array_items.feed(data) == []
+    array_items.close()
+
+
+@pytest.mark.parametrize('data', [b'[1, 2', b'{"a": 1}', b'[1] [2]'])
+def test_json_array_items_invalid_array(data):
+    array_items = sync_client._JsonArrayItems()
+    with pytest.raises(ValueError):
+        array_items.feed(data)
+        array_items.close()
+
+
+def test_sync_stream():
+    client = sync_client.Client(TEST_SERVER_URL)
+
+    items = list(client.stream_get_list_objects(chunk_size=16))
+
+    assert items == client.get_list_objects()
+    assert all(isinstance(item, sync_client.GetObjectResp) for item in items)
+
+
+@pytest.mark.asyncio
+async def test_async_stream():
+    client = async_client.Client(TEST_SERVER_URL)
+
+    items = [item async for item in client.stream_get_list_objects(chunk_size=16)]
+
+    assert items == await client.get_list_objects()
+
+
+def test_stream_unexpected_response():
+    http_client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(404, json={})))
+    client = sync_client.Client(TEST_SERVER_URL, client=http_client)
+
+    with pytest.raises(sync_client.UnexpectedResponse) as exc_info:
+        list(client.stream_get_list_objects())
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.body is None
+
+
+def test_stream_memory_is_bounded():
+    items_count = 50_000
+    item = json.dumps({'string_data': 'x' * 100, 'integer_data_all_params': 2}).encode()
+
+    def body():
+        yield b'['
+        for i in range(items_count):
+            yield item if i == 0 else b',' + item
+        yield b']'
+
+    http_client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body())))
+    client = sync_client.Client(TEST_SERVER_URL, client=http_client)
+
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in client.stream_get_list_objects())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == items_count
+    assert peak < len(item) * items_count / 10
+
+
+def test_sync_download(tmp_path):
+    client = sync_client.Client(TEST_SERVER_URL)
+
+    meta = sync_client.PythogenMetaBox()
+    transfer = client.download_get_binary(destination=tmp_path / 'binary', meta=meta)
+    assert (tmp_path / 'binary').read_bytes() == client.get_binary()
+    assert transfer.bytes_transferred == len(b'some_body')
+    assert transfer.bytes_per_second > 0
+    assert meta.transfer == transfer
+    assert meta.response.status_code == 200
+
+    file = io.BytesIO()
+    client.download_get_binary(destination=file, chunk_size=2)
+    assert file.getvalue() == b'some_body'
+
+    chunks = []
+    client.download_get_binary(destination=chunks.append, chunk_size=2)
+    assert chunks == [b'so', b'me', b'_b', b'od', b'y']
+
+
+@pytest.mark.asyncio
+async def test_async_download():
+    client = async_client.Client(TEST_SERVER_URL)
+
+    chunks = []
+
+    async def write(chunk):
+        chunks.append(chunk)
+
+    transfer = await client.download_get_binary(destination=write)
+    assert b''.join(chunks) == await client.get_binary()
+    assert transfer.bytes_transferred == len(b'some_body')
+
+
+def test_download_memory_is_bounded():
+    chunks_count = 1000
+    chunk = b'x' * 65536
+
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=(chunk for _ in range(chunks_count))))
+    )
+    client = sync_client.Client(TEST_SERVER_URL, client=http_client)
+
+    received = 0
+
+    def write(data):
+        nonlocal received
+        received += len(data)
+
+    tracemalloc.start()
+    try:
+        transfer = client.download_get_binary(destination=write)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert received == transfer.bytes_transferred == len(chunk) * chunks_count
+    assert peak < len(chunk) * 10
+
+
+def _chunks(count, size=1000):
+    for _ in range(count):
+        yield b'x' * size
+
+
+def test_sync_upload(tmp_path):
+    client = sync_client.Client(TEST_SERVER_URL)
+
+    assert client.upload(content=_chunks(10)).size == 10_000
+    assert client.upload(content=io.BytesIO(b'x' * 10_000)).size == 10_000
+    assert client.upload(content=b'x' * 10_000).size == 10_000
+
+    (tmp_path / 'file').write_bytes(b'x' * 10_000)
+    with open(tmp_path / 'file', 'rb') as file:
+        response = client.upload_multipart(
+            body=sync_client.PostFile(text='ping'),
+            files=[('file', ('file.bin', file)), ('iterator', ('iterator.bin', _chunks(10), 'application/octet-stream'))],
+        )
+    assert response.size == 20_000
+
+
+@pytest.mark.asyncio
+async def test_async_upload():
+    client = async_client.Client(TEST_SERVER_URL)
+
+    async def achunks(count):
+        for chunk in _chunks(count):
+            yield chunk
+
+    assert (await client.upload(content=achunks(10))).size == 10_000
+    assert (await client.upload(content=_chunks(10))).size == 10_000
+    assert (await client.upload(content=io.BytesIO(b'x' * 10_000))).size == 10_000
+
+    response = await client.upload_multipart(
+        body=async_client.PostFile(text='ping'),
+        files={'iterator': ('iterator.bin', _chunks(10))},
+    )
+    assert response.size == 10_000
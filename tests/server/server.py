@@ -73,6 +73,24 @@ async def post_file_multipart_form_data(request: web.Request) -> Union[web.json_
     return web.json_response(data={'status': 'OK'})
 
 
+async def upload(request: web.Request) -> web.json_response:
+    size = 0
+    async for chunk in request.content.iter_any():
+        size += len(chunk)
+    return web.json_response(data={'size': size})
+
+
+async def upload_multipart(request: web.Request) -> web.json_response:
+    size = 0
+    reader = await request.multipart()
+    async for part in reader:
+        if part.filename is None:
+            continue
+        while chunk := await part.read_chunk():
+            size += len(chunk)
+    return web.json_response(data={'size': size})
+
+
 async def put_object(request: web.Request) -> Union[web.json_response, web.Response]:
     data = await request.json()
     if not data:
@@ -157,6 +175,8 @@ app.add_routes(
         web.get('/empty', get_empty),
         web.get('/binary', get_binary),
         web.post('/multipart-form-data', post_file_multipart_form_data),
+        web.post('/upload', upload),
+        web.post('/upload-multipart', upload_multipart),
         web.get('/slow/objects/{object_id}', get_object_slow),
         web.put('/slow/objects/{object_id}', put_object_slow),
         web.get('/nested-any-of', get_list_of_anyof),